@@ -0,0 +1,135 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import time
+from typing import Any
+
+from benchmarks.ingestion import bench_ingestion
+from benchmarks.near_duplicates import bench_near_duplicates
+from benchmarks.pipeline import run_pipeline_benchmarks
+from benchmarks.rendering import bench_render_pool, bench_rendering
+from benchmarks.startup import bench_startup
+
+DEFAULT_RESULTS_DIR = os.path.join(os.getcwd(), "benchmarks", "results")
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _medians(value: Any, prefix: str = "") -> dict[str, float]:
+    """Flatten a results tree to {path: median} for comparison."""
+    if isinstance(value, dict):
+        if "median" in value:
+            return {prefix: value["median"]}
+        flat: dict[str, float] = {}
+        for key, item in value.items():
+            flat.update(_medians(item, f"{prefix}.{key}" if prefix else key))
+        return flat
+    if isinstance(value, list):
+        flat = {}
+        for index, item in enumerate(value):
+            flat.update(_medians(item, f"{prefix}[{index}]"))
+        return flat
+    return {}
+
+
+def compare(current: dict, baseline: dict) -> None:
+    """Print how every median timing moved relative to a baseline run."""
+    now = _medians(current["results"])
+    before = _medians(baseline["results"])
+    print(f"\n📊 Compared with {baseline.get('commit', 'baseline')}:")
+    for path in sorted(now.keys() & before.keys()):
+        if before[path]:
+            change = (now[path] - before[path]) / before[path] * 100
+            print(
+                f"   {path}: {before[path]:.4f}s -> {now[path]:.4f}s ({change:+.1f}%)"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Resume Tailorator pipeline with stand-in models"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.05,
+        help="Simulated seconds per model request (default: 0.05)",
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Repetitions per measurement"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Smaller sizes, for a fast sanity run"
+    )
+    parser.add_argument(
+        "--skip-rendering", action="store_true", help="Skip the Markdown/PDF benchmarks"
+    )
+    parser.add_argument(
+        "--skip-ingestion",
+        action="store_true",
+        help="Skip the job posting URL benchmarks (needs Playwright's Chromium)",
+    )
+    parser.add_argument(
+        "--output",
+        help="Results JSON file (default: benchmarks/results/<commit>.json)",
+    )
+    parser.add_argument("--compare", help="Baseline results JSON file to compare with")
+    args = parser.parse_args()
+
+    commit = git_commit()
+    print(f"⏱️ Running benchmarks at {commit}...")
+    results: dict[str, Any] = {
+        "pipeline": run_pipeline_benchmarks(args.latency, args.repeats, args.quick),
+        "startup": bench_startup(args.repeats),
+        "near_duplicates": bench_near_duplicates(
+            [1000, 10000] if args.quick else [1000, 10000, 50000]
+        ),
+    }
+    if not args.skip_rendering:
+        sizes = [1, 5, 20] if args.quick else [1, 5, 20, 50, 100]
+        results["rendering"] = bench_rendering(sizes, args.repeats)
+        results["render_pool"] = bench_render_pool(8 if args.quick else 32)
+    if not args.skip_ingestion:
+        results["ingestion"] = bench_ingestion(
+            pages=16 if args.quick else 64,
+            context_counts=[1, 4] if args.quick else [1, 4, 8],
+            latency=args.latency,
+        )
+
+    report = {
+        "commit": commit,
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "latency": args.latency,
+            "repeats": args.repeats,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(DEFAULT_RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"✅ Results saved to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
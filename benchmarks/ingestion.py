@@ -0,0 +1,109 @@
+import asyncio
+import contextlib
+import hashlib
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from tools.browser_pool import BrowserPool
+from utils.cache import DiskCache
+
+
+def synthetic_posting_html(index: int, paragraphs: int = 20) -> str:
+    body = "\n".join(
+        f"<p>Requirement {i}: Python, AWS and Kubernetes in production.</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        f"<html><head><title>Posting {index}</title></head><body>"
+        f"<nav><a href='/'>Jobs</a></nav><img src='/logo.png'>"
+        f"<main><h1>Backend Engineer {index}</h1>{body}</main>"
+        f"<footer>Equal opportunity employer.</footer></body></html>"
+    )
+
+
+class _PostingHandler(BaseHTTPRequestHandler):
+    """Serves synthetic postings with ETags, like a job board would."""
+
+    latency = 0.0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        if not self.path.startswith("/posting/"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = synthetic_posting_html(int(self.path.rsplit("/", 1)[1])).encode()
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def posting_server(latency: float) -> Iterator[str]:
+    """Serve synthetic postings on localhost, yielding the base URL."""
+    handler = type("PostingHandler", (_PostingHandler,), {"latency": latency})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+async def _fetch_all(pool: BrowserPool, urls: list[str]) -> tuple[float, int]:
+    start = time.perf_counter()
+    errors = sum([page.error is not None async for page in pool.fetch_many(urls)])
+    return time.perf_counter() - start, errors
+
+
+async def _bench_pool(urls: list[str], contexts: int, cache_dir: str) -> dict:
+    cache = DiskCache("job_pages", cache_dir)
+    start = time.perf_counter()
+    async with BrowserPool(max_contexts=contexts, cache=cache) as pool:
+        startup = time.perf_counter() - start
+        cold, cold_errors = await _fetch_all(pool, urls)
+        warm, warm_errors = await _fetch_all(pool, urls)
+    return {
+        "contexts": contexts,
+        "browser_startup_seconds": startup,
+        "cold_pages_per_second": len(urls) / cold,
+        "revalidated_pages_per_second": len(urls) / warm,
+        "revalidated_not_modified": pool.stats.not_modified,
+        "errors": cold_errors + warm_errors,
+    }
+
+
+def bench_ingestion(
+    pages: int, context_counts: list[int], latency: float
+) -> list[dict[str, Any]]:
+    """
+    Fetch synthetic postings from a local HTTP server with `BrowserPool`:
+    once cold (every page rendered), then again with every page revalidated
+    by ETag, for each number of browser contexts.
+    """
+    results = []
+    with posting_server(latency) as base_url:
+        urls = [f"{base_url}/posting/{i}" for i in range(pages)]
+        for contexts in context_counts:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                result = asyncio.run(_bench_pool(urls, contexts, cache_dir))
+            results.append({"pages": pages, "server_latency": latency, **result})
+    return results
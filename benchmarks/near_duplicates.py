@@ -0,0 +1,61 @@
+import random
+import time
+from typing import Any
+
+from benchmarks.pipeline import summarize
+from utils.simhash import SimHashIndex, simhash
+
+
+def _synthetic_posting(rng: random.Random) -> str:
+    skills = ["Python", "Go", "AWS", "Kafka", "Kubernetes", "React", "SQL", "Rust"]
+    return "\n".join(
+        f"- {rng.choice(['Build', 'Own', 'Design', 'Scale'])} "
+        f"{rng.choice(skills)} services for team {rng.randrange(1000)}"
+        for _ in range(40)
+    )
+
+
+def bench_near_duplicates(
+    sizes: list[int], lookups: int = 1000
+) -> list[dict[str, Any]]:
+    """
+    SimHash lookup time in indexes of growing size: half the queries are
+    indexed fingerprints with two bits flipped (a lightly edited repost),
+    half are unrelated. Also times fingerprinting one posting.
+    """
+    rng = random.Random(0)
+    postings = [_synthetic_posting(rng) for _ in range(20)]
+    fingerprint_seconds = []
+    for posting in postings:
+        start = time.perf_counter()
+        simhash(posting)
+        fingerprint_seconds.append(time.perf_counter() - start)
+
+    results = []
+    for size in sizes:
+        index = SimHashIndex()
+        fingerprints = [rng.getrandbits(64) for _ in range(size)]
+        for key, fingerprint in enumerate(fingerprints):
+            index.add(fingerprint, str(key))
+        queries = [
+            rng.choice(fingerprints)
+            ^ (1 << rng.randrange(64))
+            ^ (1 << rng.randrange(64))
+            if i % 2 == 0
+            else rng.getrandbits(64)
+            for i in range(lookups)
+        ]
+        samples, found = [], 0
+        for query in queries:
+            start = time.perf_counter()
+            found += next(index.find(query), None) is not None
+            samples.append(time.perf_counter() - start)
+        results.append(
+            {
+                "indexed": size,
+                "lookup_seconds": summarize(samples),
+                "near_duplicates_found": found,
+                "fingerprint_seconds": summarize(fingerprint_seconds),
+            }
+        )
+    return results
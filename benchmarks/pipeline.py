@@ -0,0 +1,224 @@
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+from typing import Any
+
+from benchmarks.stand_ins import StandInConfig, stand_in_agents, synthetic_cv
+from models.agents.output import CV
+from workflows import ResumeTailorWorkflow
+from workflows.instrumentation import Instrumentation
+from workflows.policy import WorkflowError
+from workflows.scheduler import Stage, StageScheduler
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """Median, min, max and mean of a list of timings."""
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.fmean(samples),
+    }
+
+
+def _write_inputs(directory: str, resumes: int, postings: int) -> tuple[list, list]:
+    resume_paths, posting_paths = [], []
+    for i in range(resumes):
+        path = os.path.join(directory, f"resume_{i}.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# Resume {i}\n\nSoftware engineer.\n")
+        resume_paths.append(path)
+    for i in range(postings):
+        path = os.path.join(directory, f"posting_{i}.md")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"# Backend Engineer {i}\n\nPython, AWS, Docker.\n")
+        posting_paths.append(path)
+    return resume_paths, posting_paths
+
+
+async def bench_single_run(
+    config: StandInConfig,
+    repeats: int,
+    cv: CV | None = None,
+    writing_mode: str = "whole",
+) -> dict[str, Any]:
+    """
+    End-to-end wall time of `ResumeTailorWorkflow.run`, with the time not
+    spent in any critical-path stage reported as pipeline overhead.
+    """
+    wall, overhead, write, calls, retries, failures = [], [], [], [], [], 0
+    with tempfile.TemporaryDirectory() as directory:
+        _, (posting_path,) = _write_inputs(directory, 0, 1)
+        for repeat in range(repeats):
+            instrumentation = Instrumentation()
+            workflow = ResumeTailorWorkflow(
+                use_cache=False, instrumentation=instrumentation
+            )
+            workflow.writing_mode = writing_mode
+            # A different seed per repeat, so failures don't hit the same calls
+            with stand_in_agents(
+                replace(config, seed=config.seed + 100 * repeat), cv=cv
+            ):
+                start = time.perf_counter()
+                try:
+                    result = await workflow.run("# Resume\n", posting_path)
+                except WorkflowError:
+                    # Stand-in failures that outlasted the retries
+                    failures += 1
+                    continue
+                wall.append(time.perf_counter() - start)
+
+            timeline = result.timeline
+            on_path = {stage.name: stage for stage in timeline.stages}
+            overhead.append(
+                timeline.total_seconds
+                - sum(on_path[name].duration for name in timeline.critical_path)
+            )
+            write.append(_stage_seconds(workflow, instrumentation, "write"))
+            calls.append(len(instrumentation.profile.calls))
+            retries.append(sum(c.retries for c in instrumentation.profile.calls))
+
+    return {
+        "runs": repeats,
+        "failed_runs": failures,
+        "wall_seconds": summarize(wall) if wall else None,
+        "pipeline_overhead_seconds": summarize(overhead) if overhead else None,
+        "write_stage_seconds": summarize(write) if write else None,
+        "agent_calls_per_run": statistics.fmean(calls) if calls else None,
+        "retries_per_run": statistics.fmean(retries) if retries else None,
+    }
+
+
+def _stage_seconds(
+    workflow: ResumeTailorWorkflow, instrumentation: Instrumentation, stage: str
+) -> float:
+    # Wall time from the first call of a stage starting to the last finishing
+    calls = [c for c in instrumentation.profile.calls if c.stage == stage]
+    if not calls:
+        return 0.0
+    return max(c.started_at + c.seconds for c in calls) - min(
+        c.started_at for c in calls
+    )
+
+
+async def bench_writing_modes(
+    latency: float, seconds_per_kb: float, sizes: list[int], repeats: int
+) -> list[dict[str, Any]]:
+    """
+    Whole-CV vs section-parallel writing on CVs with a growing number of
+    roles, with latency growing with output size like real generation.
+    """
+    config = StandInConfig(latency=latency, seconds_per_kb=seconds_per_kb)
+    results = []
+    for experiences in sizes:
+        cv = synthetic_cv(experiences)
+        for mode in ("whole", "sections"):
+            results.append(
+                {
+                    "experiences": experiences,
+                    "writing_mode": mode,
+                    **await bench_single_run(config, repeats, cv, mode),
+                }
+            )
+    return results
+
+
+async def bench_scheduler(stage_count: int, repeats: int) -> dict[str, Any]:
+    """
+    Per-stage cost of the DAG scheduler itself, with no-op stages in a
+    chain (every stage waits for the previous one) and a fan-out.
+    """
+
+    async def noop(**_: Any) -> int:
+        return 0
+
+    chain = [
+        Stage(f"s{i}", noop, inputs=(f"v{i}",), outputs=(f"v{i + 1}",))
+        for i in range(stage_count)
+    ]
+    fan_out = [
+        Stage(f"s{i}", noop, inputs=("v0",), outputs=(f"v{i + 1}",))
+        for i in range(stage_count)
+    ]
+
+    results: dict[str, Any] = {"stages": stage_count}
+    for name, stages in [("chain", chain), ("fan_out", fan_out)]:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            await StageScheduler(stages).run({"v0": 0})
+            samples.append((time.perf_counter() - start) / stage_count)
+        results[f"{name}_seconds_per_stage"] = summarize(samples)
+    return results
+
+
+async def bench_retries(
+    latency: float, failure_rates: list[float], repeats: int
+) -> list[dict[str, Any]]:
+    """How agent retries, run failures and wall time grow with the failure rate."""
+    results = []
+    for failure_rate in failure_rates:
+        config = StandInConfig(latency=latency, failure_rate=failure_rate, seed=42)
+        results.append(
+            {"failure_rate": failure_rate, **await bench_single_run(config, repeats)}
+        )
+    return results
+
+
+async def bench_batch(
+    config: StandInConfig, resumes: int, postings: int, concurrency: int
+) -> dict[str, Any]:
+    """Throughput of `run_many` over every resume × posting pair."""
+    with tempfile.TemporaryDirectory() as directory:
+        resume_paths, posting_paths = _write_inputs(directory, resumes, postings)
+        workflow = ResumeTailorWorkflow(use_cache=False)
+        errors = 0
+        with stand_in_agents(config, cv=synthetic_cv()):
+            start = time.perf_counter()
+            async for item in workflow.run_many(
+                resume_paths, posting_paths, max_concurrency=concurrency
+            ):
+                errors += item.error is not None
+            wall = time.perf_counter() - start
+
+    pairs = resumes * postings
+    return {
+        "resumes": resumes,
+        "postings": postings,
+        "concurrency": concurrency,
+        "pairs": pairs,
+        "errors": errors,
+        "wall_seconds": wall,
+        "pairs_per_second": pairs / wall,
+    }
+
+
+async def bench_pipeline(
+    latency: float, repeats: int, quick: bool = False
+) -> dict[str, Any]:
+    config = StandInConfig(latency=latency)
+    batch_sizes = [(2, 2)] if quick else [(2, 2), (4, 4)]
+    return {
+        "single_run": await bench_single_run(config, repeats),
+        "writing_modes": await bench_writing_modes(
+            latency, 0.05, [3] if quick else [3, 10, 20], repeats
+        ),
+        "scheduler": await bench_scheduler(20 if quick else 200, repeats),
+        "retries": await bench_retries(
+            latency, [0.0, 0.2] if quick else [0.0, 0.1, 0.3], repeats
+        ),
+        "batch": [
+            await bench_batch(config, resumes, postings, concurrency)
+            for resumes, postings in batch_sizes
+            for concurrency in (1, 4)
+        ],
+    }
+
+
+def run_pipeline_benchmarks(
+    latency: float, repeats: int, quick: bool = False
+) -> dict[str, Any]:
+    return asyncio.run(bench_pipeline(latency, repeats, quick))
@@ -0,0 +1,122 @@
+import asyncio
+import contextlib
+import io
+import os
+import tempfile
+import time
+from typing import Any
+
+from benchmarks.pipeline import summarize
+from benchmarks.stand_ins import synthetic_cv
+from models.workflow import ResumeTailorResult
+from utils.markdown_writer import generate_resume
+from utils.pdf_converter import markdown_to_pdf
+from utils.render_pool import RenderedDocument, RenderPool
+
+
+def bench_rendering(sizes: list[int], repeats: int) -> list[dict[str, Any]]:
+    """
+    Time `generate_resume` (Markdown and PDF) and `markdown_to_pdf` alone on
+    synthetic resumes with a growing number of roles.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "files"))
+        cwd = os.getcwd()
+        # generate_resume writes under ./files
+        os.chdir(directory)
+        try:
+            for experiences in sizes:
+                result = ResumeTailorResult(
+                    company_name="Bench",
+                    tailored_resume=synthetic_cv(experiences).model_dump_json(),
+                    audit_report={},
+                    passed=True,
+                )
+                generate, pdf_only = [], []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        generate_resume(result, base_filename="bench")
+                    generate.append(time.perf_counter() - start)
+
+                with open(os.path.join("files", "bench.md"), encoding="utf-8") as f:
+                    markdown_text = f.read()
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    markdown_to_pdf(markdown_text, os.path.join("files", "only.pdf"))
+                    pdf_only.append(time.perf_counter() - start)
+
+                results.append(
+                    {
+                        "experiences": experiences,
+                        "markdown_bytes": len(markdown_text.encode()),
+                        "pdf_bytes": os.path.getsize(
+                            os.path.join("files", "bench.pdf")
+                        ),
+                        "generate_resume_seconds": summarize(generate),
+                        "markdown_to_pdf_seconds": summarize(pdf_only),
+                    }
+                )
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+async def _render_with_pool(
+    results: list[ResumeTailorResult], directory: str
+) -> tuple[float, float, list[RenderedDocument]]:
+    start = time.perf_counter()
+    async with RenderPool(output_dir=directory) as pool:
+        await pool.start()
+        startup = time.perf_counter() - start
+        start = time.perf_counter()
+        rendered = [
+            document
+            async for document in pool.render_many(
+                (result, f"pool_{i}") for i, result in enumerate(results)
+            )
+        ]
+        return startup, time.perf_counter() - start, rendered
+
+
+def bench_render_pool(documents: int, experiences: int = 5) -> dict[str, Any]:
+    """
+    Save a batch of resumes one after another with `generate_resume`, then
+    with the process-pool `RenderPool`, and compare wall time. Worker
+    startup is reported separately since it overlaps with tailoring in a
+    real batch.
+    """
+    results = [
+        ResumeTailorResult(
+            company_name=f"Bench {i}",
+            tailored_resume=synthetic_cv(experiences).model_dump_json(),
+            audit_report={},
+            passed=True,
+        )
+        for i in range(documents)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "files"))
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                for i, result in enumerate(results):
+                    generate_resume(result, base_filename=f"sequential_{i}")
+            sequential = time.perf_counter() - start
+        finally:
+            os.chdir(cwd)
+
+        startup, pooled, rendered = asyncio.run(_render_with_pool(results, directory))
+
+    return {
+        "documents": documents,
+        "experiences": experiences,
+        "sequential_seconds": sequential,
+        "pool_startup_seconds": startup,
+        "pool_seconds": pooled,
+        "pool_errors": sum(document.error is not None for document in rendered),
+        "pool_render_seconds": summarize([d.render_seconds for d in rendered]),
+    }
@@ -0,0 +1,231 @@
+import asyncio
+import contextlib
+import json
+import random
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+
+from pydantic import BaseModel
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    ModelResponse,
+    ToolCallPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import (
+    AgentInfo,
+    DeltaToolCall,
+    DeltaToolCalls,
+    FunctionModel,
+)
+
+from models.agents.output import (
+    CV,
+    AuditResult,
+    CoverLetter,
+    JobAnalysis,
+    ReviewResult,
+    TailoredHighlights,
+    TailoredSkills,
+    TailoredSummary,
+    WorkExperience,
+)
+from workflows import agents
+
+SKILL_POOL = [
+    "Python", "Go", "TypeScript", "SQL", "AWS", "GCP", "Docker", "Kubernetes",
+    "Terraform", "PostgreSQL", "Redis", "Kafka", "FastAPI", "Django", "React",
+    "GraphQL", "CI/CD", "Observability", "Machine Learning", "Data Pipelines",
+]  # fmt: skip
+
+
+@dataclass
+class StandInConfig:
+    """
+    How a stand-in model behaves.
+
+    Args:
+        latency: Seconds each simulated request takes
+        jitter: Extra uniformly random latency, up to this many seconds
+        seconds_per_kb: Extra latency per KB of output, so longer outputs
+            take longer like real token generation
+        failure_rate: Probability a request returns invalid output, which
+            makes pydantic-ai send a retry prompt like a real model failure
+        seed: Seed for reproducible latency and failures
+    """
+
+    latency: float = 0.05
+    jitter: float = 0.0
+    seconds_per_kb: float = 0.0
+    failure_rate: float = 0.0
+    seed: int = 0
+
+
+def synthetic_cv(experiences: int = 3, highlights: int = 4) -> CV:
+    """A deterministic CV with the given number of roles and bullets per role."""
+    return CV(
+        full_name="Jordan Example",
+        contact_info="jordan@example.com | Berlin",
+        summary=(
+            "Backend engineer building Python services, data pipelines and "
+            "cloud infrastructure on AWS and Kubernetes."
+        ),
+        skills=SKILL_POOL[: min(len(SKILL_POOL), 6 + experiences)],
+        projects=[
+            f"Project {i}: open source tooling for Python and Docker"
+            for i in range(max(1, experiences // 3))
+        ],
+        experience=[
+            WorkExperience(
+                company=f"Company {i}",
+                role="Senior Software Engineer" if i == 0 else "Software Engineer",
+                dates=f"{2024 - 2 * i - 2} - {2024 - 2 * i}",
+                highlights=[
+                    f"Built {SKILL_POOL[(i + j) % len(SKILL_POOL)]} services "
+                    f"handling {10 * (j + 1)}k requests per day"
+                    for j in range(highlights)
+                ],
+            )
+            for i in range(experiences)
+        ],
+        education=["BSc Computer Science, Example University"],
+        certifications=["AWS Certified Developer"],
+    )
+
+
+def synthetic_job_analysis(index: int = 0) -> JobAnalysis:
+    return JobAnalysis(
+        job_title="Backend Engineer",
+        company_name=f"Acme {index}",
+        summary="Build and run Python APIs on AWS.",
+        hard_skills=["Python", "AWS", "Docker", "Kubernetes", "PostgreSQL"],
+        soft_skills=["communication", "ownership"],
+        key_responsibilities=["Build APIs", "Operate services", "Mentor engineers"],
+        keywords_to_target=["Python", "AWS", "Docker", "APIs", "Kubernetes"],
+    )
+
+
+OutputFactory = Callable[[str, str], BaseModel]
+
+
+def _last_prompt(messages: list[ModelMessage]) -> str:
+    for message in reversed(messages):
+        if isinstance(message, ModelRequest):
+            for part in message.parts:
+                if isinstance(part, UserPromptPart) and isinstance(part.content, str):
+                    return part.content
+    return ""
+
+
+def stand_in_model(
+    output: BaseModel | OutputFactory, config: StandInConfig
+) -> FunctionModel:
+    """
+    A FunctionModel that answers every request with `output` as a tool call,
+    after the configured latency, or with invalid arguments at the configured
+    failure rate. Supports both regular and streamed requests.
+
+    `output` may be a function of the prompt and the requested output type's
+    name, for agents called with different output types.
+    """
+    rng = random.Random(config.seed)
+
+    async def respond(messages: list[ModelMessage], info: AgentInfo) -> dict:
+        title = info.output_tools[0].parameters_json_schema.get("title", "")
+        model = output(_last_prompt(messages), title) if callable(output) else output
+        args = model.model_dump(mode="json")
+        size_kb = len(json.dumps(args)) / 1024
+        await asyncio.sleep(
+            config.latency
+            + config.seconds_per_kb * size_kb
+            + rng.uniform(0, config.jitter)
+        )
+        return {} if rng.random() < config.failure_rate else args
+
+    async def function(messages: list[ModelMessage], info: AgentInfo) -> ModelResponse:
+        tool_name = info.output_tools[0].name
+        args = await respond(messages, info)
+        return ModelResponse(parts=[ToolCallPart(tool_name, args)])
+
+    async def stream_function(
+        messages: list[ModelMessage], info: AgentInfo
+    ) -> AsyncIterator[DeltaToolCalls]:
+        text = json.dumps(await respond(messages, info))
+        step = max(1, len(text) // 8)
+        for start in range(0, len(text), step):
+            yield {
+                0: DeltaToolCall(
+                    name=info.output_tools[0].name if start == 0 else None,
+                    json_args=text[start : start + step],
+                )
+            }
+
+    return FunctionModel(function, stream_function=stream_function)
+
+
+def writer_outputs(cv: CV) -> OutputFactory:
+    """
+    Writer answers for both writing modes: the whole CV, or one section of
+    it (the role is picked by the company named in the prompt).
+    """
+
+    def output(prompt: str, title: str) -> BaseModel:
+        if title == TailoredSummary.__name__:
+            return TailoredSummary(summary=cv.summary)
+        if title == TailoredSkills.__name__:
+            return TailoredSkills(skills=cv.skills)
+        if title == TailoredHighlights.__name__:
+            role = next(
+                (r for r in cv.experience if f'"company":"{r.company}"' in prompt),
+                cv.experience[0],
+            )
+            return TailoredHighlights(highlights=role.highlights)
+        return cv
+
+    return output
+
+
+@contextlib.contextmanager
+def stand_in_agents(
+    config: StandInConfig, cv: CV | None = None, job_analysis: JobAnalysis | None = None
+) -> Iterator[None]:
+    """
+    Swap every agent in `workflows.agents` for a stand-in model.
+
+    The parser and writer both return `cv`, so drafts always trace back to
+    the original and pass the pre-audit; reviewer and auditor always pass.
+    """
+    cv = cv or synthetic_cv()
+    job_analysis = job_analysis or synthetic_job_analysis()
+    outputs: dict[str, BaseModel | OutputFactory] = {
+        "scraper_agent": job_analysis,
+        "analyst_agent": job_analysis,
+        "resume_parser_agent": cv,
+        "writer_agent": writer_outputs(cv),
+        "reviewer_agent": ReviewResult(quality_score=9, needs_improvement=False),
+        "auditor_agent": AuditResult(
+            passed=True,
+            hallucination_score=0,
+            ai_cliche_score=1,
+            issues=[],
+            feedback_summary="Looks good.",
+        ),
+        "cover_letter_writer_agent": CoverLetter(
+            content="Dear hiring team, ...", word_count=4
+        ),
+    }
+    with contextlib.ExitStack() as stack:
+        for offset, (name, output) in enumerate(outputs.items()):
+            model = stand_in_model(
+                output,
+                StandInConfig(
+                    latency=config.latency,
+                    jitter=config.jitter,
+                    seconds_per_kb=config.seconds_per_kb,
+                    failure_rate=config.failure_rate,
+                    seed=config.seed + offset,
+                ),
+            )
+            stack.enter_context(getattr(agents, name).override(model=model))
+        yield
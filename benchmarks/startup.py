@@ -0,0 +1,87 @@
+import argparse
+import json
+import subprocess
+import sys
+from typing import Any
+
+from benchmarks.pipeline import summarize
+
+# Modules short-lived processes start from: the CLI, the workflow package
+# and the batch render workers
+ENTRY_POINTS = ("main", "workflows", "utils.render_pool")
+# Loaded on first use only, never just by importing an entry point
+DEFERRED_MODULES = (
+    "pydantic_ai",
+    "openai",
+    "httpx",
+    "markdown_pdf",
+    "fitz",
+    "playwright",
+    "html2text",
+)
+# Seconds an entry point may take to import in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 0.5
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "deferred_loaded": [m for m in {deferred!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure_import(module: str) -> dict[str, Any]:
+    """Import `module` in a fresh interpreter and report the time it took."""
+    probe = _PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    output = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def bench_startup(repeats: int) -> dict[str, Any]:
+    """Cold import time of every entry point, plus deferred modules it loaded."""
+    results = {}
+    for module in ENTRY_POINTS:
+        samples = [measure_import(module) for _ in range(repeats)]
+        results[module] = {
+            **summarize([sample["seconds"] for sample in samples]),
+            "deferred_loaded": samples[0]["deferred_loaded"],
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check that entry points import within the startup budget"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=5, help="Fresh interpreters per entry point"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=IMPORT_BUDGET_SECONDS,
+        help=f"Median import seconds allowed (default: {IMPORT_BUDGET_SECONDS})",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module, result in bench_startup(args.repeats).items():
+        over_budget = result["median"] > args.budget
+        failed |= over_budget or bool(result["deferred_loaded"])
+        print(
+            f"{'❌' if over_budget else '✅'} {module}: {result['median']:.3f}s "
+            f"(budget {args.budget:.2f}s)"
+        )
+        if result["deferred_loaded"]:
+            print(f"   ❌ Loaded at import: {', '.join(result['deferred_loaded'])}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
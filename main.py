@@ -1,36 +1,135 @@
+import argparse
 import asyncio
+import contextlib
 import os
 
+from tools.browser_pool import BrowserPool
 from utils.markdown_writer import generate_resume
+from utils.paths import expand_input_paths, is_url
+from utils.render_pool import RenderedDocument, RenderPool
 from workflows import ResumeTailorWorkflow
+from workflows.agents import CASCADE_AGENTS, configure_models
+from workflows.events import print_event
+from workflows.instrumentation import Instrumentation
+from workflows.journal import RunJournal
+from workflows.policy import CallPolicy, PolicyConfig, WorkflowError
 
 
-async def main():
-    # --- Inputs ---
+def parse_args() -> argparse.Namespace:
     files_path = os.path.join(os.getcwd(), "files")
-    job_content_file_path = os.path.join(files_path, "job_posting.md")
-    resume_file_path = os.path.join(files_path, "resume.md")
-    original_cv_text: str = ""
+    parser = argparse.ArgumentParser(
+        description="Tailor one or more resumes to one or more job postings."
+    )
+    parser.add_argument(
+        "--resume",
+        nargs="+",
+        default=[os.path.join(files_path, "resume.md")],
+        help="Resume files, directories or glob patterns (default: files/resume.md)",
+    )
+    parser.add_argument(
+        "--job-posting",
+        nargs="+",
+        default=[os.path.join(files_path, "job_posting.md")],
+        help="Job posting files, directories, glob patterns or URLs (default: files/job_posting.md)",
+    )
+    parser.add_argument(
+        "--browser-contexts",
+        type=int,
+        default=4,
+        help="Job posting URLs rendered at once by the headless browser (default: 4)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of resume/posting pairs tailored at once (default: 4)",
+    )
+    parser.add_argument(
+        "--writing-mode",
+        choices=["whole", "sections"],
+        default="whole",
+        help="Write the whole CV in one call, or the summary, skills and each role concurrently (default: whole)",
+    )
+    parser.add_argument(
+        "--refinement-mode",
+        choices=["rewrite", "patch"],
+        default="rewrite",
+        help="Apply review feedback by rewriting the CV, or as targeted edits (default: rewrite)",
+    )
+    parser.add_argument(
+        "--agent-model",
+        action="append",
+        default=[],
+        metavar="AGENT=MODEL",
+        help="Run one agent on another model, e.g. resume_parser=openai:gpt-5-nano (repeatable)",
+    )
+    parser.add_argument(
+        "--cascade-model",
+        metavar="MODEL",
+        help="Cheaper model the auditor and reviewer judge with first; borderline verdicts are escalated to their own model",
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=3,
+        help="Attempts per agent call on rate limits, server errors or unusable output (default: 3)",
+    )
+    parser.add_argument(
+        "--requests-per-minute",
+        type=float,
+        help="Limit agent calls to this many requests per minute (default: unlimited)",
+    )
+    parser.add_argument(
+        "--tokens-per-minute",
+        type=float,
+        help="Limit agent calls to this many tokens per minute (default: unlimited)",
+    )
+    parser.add_argument(
+        "--resume-run",
+        metavar="RUN_ID",
+        help="Continue an interrupted run: completed agent calls are replayed from its journal, with its inputs and options",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-stage time, tokens, calls and cost after the run",
+    )
+    parser.add_argument(
+        "--trace-file",
+        help="Append one JSON line per agent call to this file",
+    )
+    parser.add_argument(
+        "--otel",
+        action="store_true",
+        help="Export agent calls as OpenTelemetry spans",
+    )
+    return parser.parse_args()
 
+
+async def run_single(
+    workflow: ResumeTailorWorkflow,
+    resume_file_path: str,
+    job_content_file_path: str,
+) -> bool:
+    """Tailor one resume to one posting; False if the run failed."""
     # Reading the original CV from the file
     # ASSUME: This is markdown file.
     try:
         with open(resume_file_path, "r", encoding="utf-8") as f:
             original_cv_text = f.read()
-    except FileNotFoundError:
-        print(
-            f"⚠️ Resume file not found at {resume_file_path}. Continuing with empty resume."
-        )
-        original_cv_text = ""
-    except Exception as e:
-        print(f"⚠️ Error reading resume file: {e}")
-        original_cv_text = ""
+    except (OSError, UnicodeDecodeError) as e:
+        reason = e.strerror if isinstance(e, OSError) and e.strerror else e
+        print(f"❌ Couldn't read resume {resume_file_path}: {reason}")
+        return False
 
     # Run the workflow
-    workflow = ResumeTailorWorkflow()
-    result = await workflow.run(
-        original_cv_text, job_content_file_path=job_content_file_path
-    )
+    try:
+        result = await workflow.run(
+            original_cv_text, job_content_file_path=job_content_file_path
+        )
+    except WorkflowError as e:
+        print(f"\n❌ Run failed: {e}")
+        return False
 
     # If passed, save the file
     if result.passed:
@@ -40,6 +139,174 @@ async def main():
     else:
         print("\n❌ Audit Failed. Please review the feedback and try again.")
         print(f"Feedback: {result.audit_report.get('feedback_summary', '')}")
+    return True
+
+
+async def run_batch(
+    workflow: ResumeTailorWorkflow,
+    resumes: list[str],
+    postings: list[str],
+    concurrency: int,
+) -> bool:
+    """Tailor every resume to every posting; False if any pair failed."""
+    passed_count = 0
+    failed_count = 0
+    total = len(resumes) * len(postings)
+    renders: list[asyncio.Task[RenderedDocument]] = []
+
+    async with RenderPool() as render_pool:
+        # Results stream in as each pair finishes, render them in the
+        # background while the remaining pairs are still being tailored
+        async for item in workflow.run_many(
+            resumes, postings, max_concurrency=concurrency
+        ):
+            resume_stem = os.path.splitext(os.path.basename(item.resume_path))[0]
+            posting_stem = os.path.splitext(
+                os.path.basename(item.job_content_file_path)
+            )[0]
+            label = f"{resume_stem} × {posting_stem}"
+
+            if item.error or item.result is None:
+                print(f"\n❌ {label}: Failed with error: {item.error}")
+                failed_count += 1
+                continue
+
+            result = item.result
+            if result.passed:
+                passed_count += 1
+                print(f"\n✅ {label}: Audit Passed. Saving CV...")
+                renders.append(
+                    asyncio.ensure_future(
+                        render_pool.render(
+                            result,
+                            base_filename=f"tailored_resume_{result.company_name}_{resume_stem}_{posting_stem}",
+                        )
+                    )
+                )
+            else:
+                print(f"\n❌ {label}: Audit Failed.")
+                print(f"Feedback: {result.audit_report.get('feedback_summary', '')}")
+
+        for document in await asyncio.gather(*renders):
+            if document.error:
+                print(f"❌ Failed to save {document.markdown_path}: {document.error}")
+            else:
+                print(
+                    f"✅ Tailored CV saved in {document.render_seconds:.2f}s to:\n   - Markdown: {document.markdown_path}\n   - PDF: {document.pdf_path}"
+                )
+
+    print(f"\n📦 Batch finished: {passed_count}/{total} pair(s) passed the audit.")
+    return failed_count == 0
+
+
+def configure_agent_models(args: argparse.Namespace) -> bool:
+    """Apply --agent-model and --cascade-model; False if they are invalid."""
+    agent_models: dict[str, str] = {}
+    for option in args.agent_model:
+        agent, _, model = option.partition("=")
+        if not model:
+            print(f"❌ --agent-model expects AGENT=MODEL, got '{option}'")
+            return False
+        agent_models[agent.strip()] = model.strip()
+    cascade_models = (
+        dict.fromkeys(CASCADE_AGENTS, args.cascade_model) if args.cascade_model else {}
+    )
+    try:
+        configure_models(agent_models, cascade_models)
+    except KeyError as e:
+        print(f"❌ {e.args[0]}")
+        return False
+    return True
+
+
+def open_journal(args: argparse.Namespace) -> RunJournal | None:
+    """
+    The journal of the run being continued, with its inputs and options
+    restored into `args`, or a new one recording this run's.
+    """
+    if args.resume_run:
+        try:
+            journal = RunJournal.open(args.resume_run)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            return None
+        for option, value in journal.metadata.items():
+            setattr(args, option, value)
+        print(f"🧾 Continuing run {journal.run_id}")
+        return journal
+
+    RunJournal.evict()
+    journal = RunJournal()
+    journal.write_metadata(
+        {
+            "resume": expand_input_paths(args.resume),
+            "job_posting": expand_input_paths(args.job_posting),
+            "writing_mode": args.writing_mode,
+            "refinement_mode": args.refinement_mode,
+            "agent_model": args.agent_model,
+            "cascade_model": args.cascade_model,
+        }
+    )
+    print(f"🧾 Run id: {journal.run_id} (continue with --resume-run {journal.run_id})")
+    return journal
+
+
+async def main():
+    args = parse_args()
+    journal = open_journal(args)
+    if journal is None or not configure_agent_models(args):
+        return
+    resumes = expand_input_paths(args.resume)
+    postings = expand_input_paths(args.job_posting)
+
+    if not resumes or not postings:
+        print("❌ No resume or job posting files matched the given inputs.")
+        return
+
+    instrumentation = Instrumentation(trace_path=args.trace_file, otel=args.otel)
+    policy = CallPolicy(
+        PolicyConfig(
+            max_attempts=args.max_attempts,
+            requests_per_minute=args.requests_per_minute,
+            tokens_per_minute=args.tokens_per_minute,
+        )
+    )
+    async with contextlib.AsyncExitStack() as stack:
+        # Only launch a browser when there are postings to fetch
+        browser_pool = (
+            await stack.enter_async_context(BrowserPool(args.browser_contexts))
+            if any(is_url(posting) for posting in postings)
+            else None
+        )
+        workflow = ResumeTailorWorkflow(
+            instrumentation=instrumentation,
+            policy=policy,
+            journal=journal,
+            browser_pool=browser_pool,
+        )
+        workflow.writing_mode = args.writing_mode
+        workflow.refinement_mode = args.refinement_mode
+        # The console is just one subscriber of the workflow's events
+        workflow.subscribe(print_event)
+
+        if len(resumes) == 1 and len(postings) == 1:
+            completed = await run_single(workflow, resumes[0], postings[0])
+        else:
+            completed = await run_batch(workflow, resumes, postings, args.concurrency)
+
+        if browser_pool is not None:
+            print(f"\n{browser_pool.stats.format()}")
+
+    if journal.replayed:
+        print(f"\n⏩ Replayed {journal.replayed} agent call(s) from the run journal.")
+    if completed:
+        # Nothing left to resume
+        journal.delete()
+    else:
+        print(f"🧾 Retry the failed part with --resume-run {journal.run_id}")
+
+    if args.profile:
+        print("\n" + instrumentation.profile.format())
 
 
 if __name__ == "__main__":
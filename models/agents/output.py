@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -44,11 +46,75 @@ class CV(BaseModel):
     )
 
 
+class CVFragment(BaseModel):
+    """The part of a CV found in one section of a resume."""
+
+    full_name: str = ""
+    contact_info: str = Field(default="", description="Email, phone, location, etc.")
+    summary: str = ""
+    skills: list[str] = Field(
+        default_factory=list, description="Technical and soft skills"
+    )
+    projects: list[str] = Field(
+        default_factory=list, description="Project descriptions"
+    )
+    experience: list[WorkExperience] = Field(default_factory=list)
+    education: list[str] = Field(default_factory=list)
+    certifications: list[str] = Field(
+        default_factory=list, description="Professional certifications"
+    )
+    publications: list[str] = Field(
+        default_factory=list, description="Publications, blogs, talks, etc."
+    )
+
+
+# --- Models for writing a CV section by section ---
+class TailoredSummary(BaseModel):
+    summary: str = Field(description="The rewritten professional summary.")
+
+
+class TailoredSkills(BaseModel):
+    skills: list[str] = Field(
+        description="The original skills, most relevant to the job first."
+    )
+
+
+class TailoredHighlights(BaseModel):
+    highlights: list[str] = Field(
+        description="The rewritten bullet points of one role."
+    )
+
+
+# --- Models for patch-based refinement ---
+class CVEdit(BaseModel):
+    op: Literal["replace", "reorder", "remove"] = Field(
+        description="'replace' a text, 'reorder' a list, 'remove' a list item."
+    )
+    path: str = Field(
+        description="What to edit, e.g. 'summary', 'skills', "
+        "'experience[0].highlights', 'experience[0].highlights[2]', 'projects[1]'."
+    )
+    value: str | list[str] | None = Field(
+        default=None,
+        description="New text for 'replace', the full reordered list for 'reorder'.",
+    )
+
+
+class CVPatch(BaseModel):
+    edits: list[CVEdit] = Field(description="Targeted edits to the current CV.")
+
+
 # --- Model for the Audit/Validation ---
 class AuditIssue(BaseModel):
     severity: str = Field(description="'Critical' for lies, 'Minor' for style.")
     issue: str
     suggestion: str
+    section: str | None = Field(
+        default=None,
+        description="CV part the issue concerns: 'summary', 'skills', "
+        "'experience[i]' (0-based), 'projects', 'education', 'certifications' "
+        "or 'publications'.",
+    )
 
 
 class AuditResult(BaseModel):
@@ -1,8 +1,108 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from models.agents.output import CV
+
+
+class KeywordCoverage(BaseModel):
+    score: float = Field(ge=0, le=10, description="Weighted keyword coverage, 0-10.")
+    coverage: float = Field(
+        ge=0, le=1, description="Share of targetable keyword weight covered."
+    )
+    matched: dict[str, str] = Field(
+        default_factory=dict, description="Keyword -> best section it appears in."
+    )
+    missing: list[str] = Field(
+        default_factory=list,
+        description="Keywords in the original CV that the draft doesn't mention.",
+    )
+    misplaced: list[str] = Field(
+        default_factory=list,
+        description="Keywords only found outside the skills and summary sections.",
+    )
+    untargetable: list[str] = Field(
+        default_factory=list,
+        description="Keywords absent from the original CV, so not expected.",
+    )
+
+
+class NormalizedPosting(BaseModel):
+    text: str = Field(description="The posting as sent to the analyst.")
+    original_bytes: int
+    normalized_bytes: int
+    original_tokens: int = Field(description="Estimated tokens before normalizing.")
+    normalized_tokens: int = Field(description="Estimated tokens after normalizing.")
+    dropped_sections: list[str] = Field(
+        default_factory=list, description="Headings of boilerplate sections removed."
+    )
+    boilerplate_paragraphs: int = Field(
+        default=0, description="Boilerplate paragraphs and navigation lines removed."
+    )
+    duplicate_lines: int = Field(default=0, description="Repeated lines removed.")
+    truncated_sections: list[str] = Field(
+        default_factory=list,
+        description="Headings of sections cut or dropped to fit the length cap.",
+    )
+
+    def format(self) -> str:
+        """One line summary of what normalizing removed."""
+        byte_delta = self.normalized_bytes - self.original_bytes
+        change = byte_delta / self.original_bytes * 100 if self.original_bytes else 0
+        return (
+            f"🧹 Posting normalized: {byte_delta:+d} bytes "
+            f"(~{self.normalized_tokens - self.original_tokens:+d} tokens, "
+            f"{change:+.0f}%), "
+            f"{len(self.dropped_sections)} boilerplate section(s), "
+            f"{self.boilerplate_paragraphs} boilerplate block(s), "
+            f"{self.duplicate_lines} duplicate line(s), "
+            f"{len(self.truncated_sections)} truncated section(s)"
+        )
+
+
+class StageTiming(BaseModel):
+    name: str
+    started_at: float = Field(description="Seconds since the run started.")
+    finished_at: float = Field(description="Seconds since the run started.")
+    depends_on: list[str] = Field(
+        default_factory=list, description="Stages whose outputs this stage consumed."
+    )
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+
+class RunTimeline(BaseModel):
+    stages: list[StageTiming]
+    critical_path: list[str] = Field(
+        description="Chain of stages that determined the total wall-clock time."
+    )
+    total_seconds: float
+
+    def format(self) -> str:
+        """Render the timeline as a human readable report."""
+        name_width = max((len(stage.name) for stage in self.stages), default=0)
+        lines = [f"⏱️ Run timeline (total {self.total_seconds:.2f}s)"]
+        for stage in sorted(self.stages, key=lambda s: s.started_at):
+            marker = " ★" if stage.name in self.critical_path else ""
+            lines.append(
+                f"   {stage.name:<{name_width}}  {stage.started_at:7.2f}s → "
+                f"{stage.finished_at:7.2f}s  ({stage.duration:.2f}s){marker}"
+            )
+        lines.append(f"   Critical path: {' → '.join(self.critical_path)}")
+        return "\n".join(lines)
 
 
 class ResumeTailorResult(BaseModel):
     company_name: str
     tailored_resume: str
+    tailored_cv: CV | None = None
     audit_report: dict
     passed: bool
+    timeline: RunTimeline | None = None
+
+
+class ResumeTailorBatchResult(BaseModel):
+    resume_path: str
+    job_content_file_path: str
+    result: ResumeTailorResult | None = None
+    error: str | None = None
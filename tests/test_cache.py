@@ -0,0 +1,76 @@
+import asyncio
+import unittest
+
+from utils.cache import SingleFlight
+from workflows import ResumeTailorWorkflow
+
+
+class SingleFlightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_callers_share_one_call(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "analysis"
+
+        first = asyncio.ensure_future(flights.do("posting", work))
+        second = asyncio.ensure_future(flights.do("posting", work))
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await first, ("analysis", False))
+        self.assertEqual(await second, ("analysis", True))
+        self.assertEqual(calls, 1)
+        self.assertNotIn("posting", flights)
+
+    async def test_one_cancelled_caller_leaves_the_work_running(self):
+        flights = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return "analysis"
+
+        cancelled = asyncio.ensure_future(flights.do("posting", work))
+        waiting = asyncio.ensure_future(flights.do("posting", work))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.gather(cancelled, return_exceptions=True)
+        release.set()
+
+        self.assertEqual(await waiting, ("analysis", True))
+
+    async def test_work_every_caller_gave_up_on_is_cancelled(self):
+        flights = SingleFlight()
+        work_cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                work_cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(flights.do("posting", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        self.assertTrue(work_cancelled.is_set())
+        self.assertNotIn("posting", flights)
+
+    def test_flights_are_per_workflow(self):
+        first = ResumeTailorWorkflow(use_cache=False)
+        second = ResumeTailorWorkflow(use_cache=False)
+
+        self.assertIsNot(first._job_analysis_flights, second._job_analysis_flights)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+
+from models.agents.output import CV, CVEdit, CVPatch, WorkExperience
+from workflows.cv_patch import PatchError, apply_cv_patch
+
+
+def _cv() -> CV:
+    return CV(
+        full_name="Ada Lovelace",
+        contact_info="ada@example.com",
+        summary="Backend engineer.",
+        skills=["Python", "Go", "SQL"],
+        projects=["Analytical engine notes"],
+        experience=[
+            WorkExperience(
+                company="Acme",
+                role="Engineer",
+                dates="2020 - 2024",
+                highlights=["Built the API", "Ran the on-call rota"],
+            ),
+            WorkExperience(
+                company="Initech",
+                role="Developer",
+                dates="2018 - 2020",
+                highlights=["Migrated reports"],
+            ),
+        ],
+        education=["BSc Mathematics"],
+    )
+
+
+def _patch(*edits: tuple[str, str, str | list[str] | None]) -> CVPatch:
+    return CVPatch(
+        edits=[CVEdit(op=op, path=path, value=value) for op, path, value in edits]
+    )
+
+
+class ApplyCVPatchTest(unittest.TestCase):
+    def test_applies_allowed_edits_to_a_copy(self):
+        cv = _cv()
+        patched = apply_cv_patch(
+            cv,
+            _patch(
+                ("replace", "summary", "Platform engineer."),
+                ("reorder", "skills", ["go", "Python", "SQL"]),
+                ("replace", "experience[0].highlights[0]", "Built the public API"),
+                ("remove", "experience[0].highlights[1]", None),
+                ("replace", "projects[0]", "Engine notes"),
+            ),
+        )
+
+        self.assertEqual(patched.summary, "Platform engineer.")
+        self.assertEqual(patched.skills, ["Go", "Python", "SQL"])
+        self.assertEqual(patched.experience[0].highlights, ["Built the public API"])
+        self.assertEqual(patched.projects, ["Engine notes"])
+        self.assertEqual(cv, _cv())
+
+    def test_removals_use_the_original_indices(self):
+        cv = _cv()
+        cv.experience[0].highlights.append("Wrote the docs")
+        patched = apply_cv_patch(
+            cv,
+            _patch(
+                ("remove", "experience[0].highlights[0]", None),
+                ("replace", "experience[0].highlights[2]", "Wrote all the docs"),
+            ),
+        )
+
+        self.assertEqual(
+            patched.experience[0].highlights,
+            ["Ran the on-call rota", "Wrote all the docs"],
+        )
+
+    def test_rejects_invalid_paths(self):
+        for path in ("summary.text", "experience[a].highlights", "skills[0]", ""):
+            with self.subTest(path=path), self.assertRaises(PatchError):
+                apply_cv_patch(_cv(), _patch(("replace", path, "text")))
+
+    def test_rejects_out_of_range_indices(self):
+        for path in (
+            "experience[2].highlights[0]",
+            "experience[0].highlights[2]",
+            "projects[1]",
+        ):
+            with self.subTest(path=path), self.assertRaises(PatchError):
+                apply_cv_patch(_cv(), _patch(("replace", path, "text")))
+        with self.assertRaises(PatchError):
+            apply_cv_patch(
+                _cv(), _patch(("reorder", "experience[5].highlights", ["a"]))
+            )
+
+    def test_rejects_protected_fields(self):
+        for op, path in (
+            ("replace", "full_name"),
+            ("replace", "contact_info"),
+            ("replace", "experience[0].company"),
+            ("replace", "experience[0].dates"),
+            ("replace", "education[0]"),
+            ("remove", "projects[0]"),
+            ("replace", "experience[0].highlights"),
+        ):
+            with self.subTest(op=op, path=path), self.assertRaises(PatchError):
+                apply_cv_patch(_cv(), _patch((op, path, "Someone else")))
+
+    def test_rejects_invalid_values(self):
+        for edit in (
+            ("replace", "summary", "   "),
+            ("replace", "summary", ["a list"]),
+            ("reorder", "skills", ["Python", "Go"]),
+            ("reorder", "skills", ["Python", "Go", "Rust"]),
+            ("reorder", "experience[0].highlights", "not a list"),
+        ):
+            with self.subTest(edit=edit), self.assertRaises(PatchError):
+                apply_cv_patch(_cv(), _patch(edit))
+
+    def test_rejects_a_patch_leaving_a_role_without_highlights(self):
+        cv = _cv()
+        with self.assertRaises(PatchError):
+            apply_cv_patch(
+                cv,
+                _patch(
+                    ("replace", "summary", "Platform engineer."),
+                    ("remove", "experience[1].highlights[0]", None),
+                ),
+            )
+        self.assertEqual(cv, _cv())
+
+
+if __name__ == "__main__":
+    unittest.main()
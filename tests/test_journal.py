@@ -0,0 +1,56 @@
+import os
+import tempfile
+import time
+import unittest
+
+from workflows.journal import RunJournal
+
+
+class RunJournalCleanupTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _journal(self, run_id: str, age_seconds: float = 0) -> RunJournal:
+        journal = RunJournal(run_id, self.directory)
+        journal.write_metadata({"resume": ["resume.md"]})
+        written = time.time() - age_seconds
+        os.utime(journal.path, (written, written))
+        return journal
+
+    def _run_ids(self) -> list[str]:
+        return sorted(
+            name.removesuffix(".jsonl") for name in os.listdir(self.directory)
+        )
+
+    def test_delete_removes_the_journal(self):
+        journal = self._journal("done")
+        journal.delete()
+        self.assertEqual(self._run_ids(), [])
+        with self.assertRaises(FileNotFoundError):
+            RunJournal.open("done", self.directory)
+
+    def test_evict_drops_old_journals(self):
+        self._journal("old", age_seconds=3600)
+        self._journal("new")
+        removed = RunJournal.evict(self.directory, max_age_seconds=60)
+        self.assertEqual(removed, 1)
+        self.assertEqual(self._run_ids(), ["new"])
+
+    def test_evict_keeps_the_newest_journals(self):
+        for age, run_id in enumerate(["c", "b", "a"]):
+            self._journal(run_id, age_seconds=age * 10)
+        removed = RunJournal.evict(self.directory, max_journals=2)
+        self.assertEqual(removed, 1)
+        self.assertEqual(self._run_ids(), ["b", "c"])
+
+    def test_evict_without_journals(self):
+        missing = os.path.join(self.directory, "missing")
+        self.assertEqual(RunJournal.evict(missing), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+import asyncio
+import email.utils
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from pydantic_ai.exceptions import ModelHTTPError, UnexpectedModelBehavior
+
+from workflows.policy import (
+    AgentCallError,
+    CallPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+    PolicyConfig,
+    TokenBucket,
+    retry_after,
+)
+
+
+class FakeClock:
+    """Stands in for `time` and `asyncio.sleep` in workflows.policy."""
+
+    def __init__(self):
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+def _http_error(status: int, headers: dict[str, str]) -> ModelHTTPError:
+    """A provider error chained to a response with `headers`, as pydantic-ai does."""
+    error = ModelHTTPError(status, "test-model")
+    error.__cause__ = Exception("provider")
+    error.__cause__.response = SimpleNamespace(headers=headers)
+    return error
+
+
+class FakeClockTestCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        fake_time = SimpleNamespace(
+            monotonic=self.clock.monotonic, time=self.clock.time
+        )
+        fake_asyncio = SimpleNamespace(Lock=asyncio.Lock, sleep=self.clock.sleep)
+        for target, fake in (("time", fake_time), ("asyncio", fake_asyncio)):
+            patcher = mock.patch(f"workflows.policy.{target}", fake)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class CircuitBreakerTest(FakeClockTestCase):
+    def test_opens_after_threshold_then_lets_one_trial_through(self):
+        breaker = CircuitBreaker(threshold=2, reset_seconds=30)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+        self.assertEqual(breaker.retry_in(), 30)
+
+        self.clock.now += 30
+        self.assertEqual(breaker.state, "half_open")
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+        self.assertTrue(breaker.allow())
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(threshold=1, reset_seconds=30)
+        breaker.record_failure()
+        self.clock.now += 30
+        self.assertTrue(breaker.allow())
+
+        breaker.record_failure()
+
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(breaker.retry_in(), 30)
+
+    def test_released_trial_frees_the_slot(self):
+        breaker = CircuitBreaker(threshold=1, reset_seconds=30)
+        breaker.record_failure()
+        self.clock.now += 30
+        self.assertTrue(breaker.allow())
+
+        breaker.release_trial()
+
+        self.assertTrue(breaker.allow())
+
+
+class TokenBucketTest(FakeClockTestCase):
+    async def test_waits_for_the_refill(self):
+        bucket = TokenBucket(rate_per_minute=60)
+
+        self.assertEqual(await bucket.acquire(60), 0)
+        self.assertAlmostEqual(await bucket.acquire(3), 3)
+        self.assertEqual(self.clock.sleeps, [3])
+
+    async def test_refills_while_idle_up_to_capacity(self):
+        bucket = TokenBucket(rate_per_minute=60, capacity=10)
+        await bucket.acquire(10)
+        self.clock.now += 600
+
+        self.assertEqual(await bucket.acquire(10), 0)
+
+    async def test_adjust_gives_back_tokens(self):
+        bucket = TokenBucket(rate_per_minute=60)
+        await bucket.acquire(60)
+        bucket.adjust(-30)
+
+        self.assertEqual(await bucket.acquire(30), 0)
+        self.assertEqual(self.clock.sleeps, [])
+
+
+class RetryAfterTest(FakeClockTestCase):
+    def test_reads_the_hint_headers(self):
+        http_date = email.utils.formatdate(self.clock.now + 20, usegmt=True)
+        for headers, expected in (
+            ({"retry-after-ms": "1500"}, 1.5),
+            ({"retry-after": "7"}, 7),
+            ({"retry-after": http_date}, 20),
+            ({"retry-after": "soon"}, None),
+            ({}, None),
+        ):
+            with self.subTest(headers=headers):
+                self.assertEqual(retry_after(_http_error(429, headers)), expected)
+
+    def test_backoff_honours_the_hint_up_to_max_delay(self):
+        policy = CallPolicy(PolicyConfig(base_delay=0, max_delay=10))
+
+        self.assertEqual(policy.backoff(1, _http_error(429, {"retry-after": "4"})), 4)
+        self.assertEqual(policy.backoff(1, _http_error(429, {"retry-after": "99"})), 10)
+
+
+class CallPolicyTest(FakeClockTestCase):
+    async def test_retry_after_pauses_every_call(self):
+        policy = CallPolicy(PolicyConfig(base_delay=0))
+        attempts = []
+
+        async def rate_limited():
+            attempts.append(self.clock.now)
+            if len(attempts) == 1:
+                raise _http_error(429, {"retry-after": "5"})
+            return "ok"
+
+        self.assertEqual(await policy.call("writer", rate_limited), "ok")
+        self.assertEqual(attempts, [1_000, 1_005])
+
+        # A call started before the pause ends waits it out too
+        self.clock.now -= 2
+        self.assertEqual(await policy.call("writer", rate_limited), "ok")
+        self.assertEqual(self.clock.sleeps, [5, 2])
+
+    async def test_open_breaker_refuses_calls(self):
+        policy = CallPolicy(PolicyConfig(max_attempts=1, breaker_threshold=1))
+
+        async def server_error():
+            raise _http_error(503, {})
+
+        with self.assertRaises(AgentCallError):
+            await policy.call("writer", server_error)
+        with self.assertRaises(CircuitOpenError) as raised:
+            await policy.call("writer", server_error)
+        self.assertEqual(raised.exception.retry_in, 30)
+
+    async def test_cancelled_trial_frees_the_slot(self):
+        policy = CallPolicy(
+            PolicyConfig(max_attempts=1, breaker_threshold=1, breaker_reset_seconds=30)
+        )
+        policy.breaker.record_failure()
+        self.clock.now += 30
+
+        async def cancelled():
+            raise asyncio.CancelledError
+
+        async def ok():
+            return "ok"
+
+        with self.assertRaises(asyncio.CancelledError):
+            await policy.call("writer", cancelled)
+        self.assertEqual(await policy.call("writer", ok), "ok")
+        self.assertEqual(policy.breaker.state, "closed")
+
+    async def test_trial_with_unusable_output_closes_the_breaker(self):
+        policy = CallPolicy(PolicyConfig(max_attempts=1, breaker_threshold=1))
+        policy.breaker.record_failure()
+        self.clock.now += 30
+
+        async def bad_output():
+            raise UnexpectedModelBehavior("not a CV")
+
+        with self.assertRaises(AgentCallError):
+            await policy.call("writer", bad_output)
+        self.assertEqual(policy.breaker.state, "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+
+from utils.text import estimate_tokens
+from workflows.posting_normalizer import normalize_posting
+
+CLEAN = """# Backend Engineer at Acme
+
+## Responsibilities
+- Build Python services
+- Own the billing API
+
+## Requirements
+- 5 years of Python
+- PostgreSQL"""
+
+
+class NormalizePostingTest(unittest.TestCase):
+    def test_clean_posting_passes_through_unchanged(self):
+        report = normalize_posting(CLEAN)
+
+        self.assertEqual(report.text, CLEAN)
+        self.assertEqual(report.normalized_tokens, report.original_tokens)
+        self.assertEqual(report.dropped_sections, [])
+        self.assertEqual(report.truncated_sections, [])
+
+    def test_drops_boilerplate_sections_paragraphs_and_navigation(self):
+        posting = (
+            "Skip to main content\n\n"
+            f"{CLEAN}\n\n"
+            "Acme is an equal opportunity employer and hires without regard to "
+            "race or religion.\n\n"
+            "## Benefits\n- Free lunch\n\n"
+            "## Equal Opportunity\nWe welcome everyone.\n\n"
+            "Apply now"
+        )
+
+        report = normalize_posting(posting)
+
+        self.assertEqual(report.text, CLEAN)
+        self.assertEqual(report.dropped_sections, ["Benefits", "Equal Opportunity"])
+        self.assertEqual(report.boilerplate_paragraphs, 2)
+
+    def test_normalizes_whitespace_and_promotes_pseudo_headings(self):
+        posting = (
+            "Backend Engineer at Acme  \r\n\r\n\r\n\r\n"
+            "Responsibilities:\r\n- Build Python services\t\r\n\r\n"
+            "**Requirements**\n- 5 years of Python\n"
+        )
+
+        report = normalize_posting(posting)
+
+        self.assertEqual(
+            report.text,
+            "Backend Engineer at Acme\n\n"
+            "### Responsibilities\n- Build Python services\n\n"
+            "### Requirements\n- 5 years of Python",
+        )
+
+    def test_removes_repeated_lines_but_not_short_ones(self):
+        posting = (
+            "# Engineer\n\n## Requirements\n- 5 years of Python\n- Go\n\n"
+            "## Nice to have\n- 5 years of Python\n- Go\n- Rust"
+        )
+
+        report = normalize_posting(posting)
+
+        self.assertEqual(report.duplicate_lines, 1)
+        self.assertEqual(report.text.count("5 years of Python"), 1)
+        self.assertEqual(report.text.count("- Go"), 2)
+
+    def test_cuts_company_blurbs_before_requirements(self):
+        blurb = "\n".join(f"We have grown fast in year {i}." for i in range(200))
+        posting = f"{CLEAN}\n\n## About us\n{blurb}"
+
+        report = normalize_posting(posting, max_tokens=200)
+
+        self.assertTrue(report.text.startswith(CLEAN))
+        self.assertEqual(report.truncated_sections, ["About us"])
+        self.assertLessEqual(estimate_tokens(report.text), 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import unittest
+
+from models.agents.output import CV, WorkExperience
+from workflows.pre_audit import pre_audit_cv
+
+
+def _cv(dates: str, highlight: str) -> CV:
+    return CV(
+        full_name="Jane Doe",
+        contact_info="jane@example.com",
+        summary="Backend engineer.",
+        skills=["Python"],
+        experience=[
+            WorkExperience(
+                company="Acme",
+                role="Backend Engineer",
+                dates=dates,
+                highlights=[highlight],
+            )
+        ],
+        education=["BSc Computer Science"],
+    )
+
+
+class PreAuditDatesTest(unittest.TestCase):
+    def test_month_spellings_are_the_same_date(self):
+        original = _cv("Jan 2020 - Present", "Built Python APIs")
+        for dates in (
+            "January 2020 - Present",
+            "01/2020 – current",
+            "2020-01 to now",
+        ):
+            with self.subTest(dates=dates):
+                audit = pre_audit_cv(original, _cv(dates, "Built Python APIs"))
+                self.assertTrue(audit.passed, audit.issues)
+
+    def test_changed_date_is_flagged(self):
+        original = _cv("Jan 2020 - Present", "Built Python APIs")
+        audit = pre_audit_cv(original, _cv("Mar 2019 - Present", "Built Python APIs"))
+        self.assertFalse(audit.passed)
+        self.assertIn("Dates", audit.issues[0].issue)
+
+
+class PreAuditHeaderTest(unittest.TestCase):
+    def test_changed_name_or_contact_is_flagged(self):
+        original = _cv("2020 - 2021", "Built Python APIs")
+        for field, value in (
+            ("full_name", "Janet Doe"),
+            ("contact_info", "jane@example.org"),
+        ):
+            with self.subTest(field=field):
+                new = original.model_copy(update={field: value})
+                audit = pre_audit_cv(original, new)
+                self.assertFalse(audit.passed)
+                self.assertEqual(audit.issues[0].section, "header")
+
+    def test_whitespace_in_contact_is_not_a_change(self):
+        original = _cv("2020 - 2021", "Built Python APIs")
+        new = original.model_copy(update={"contact_info": " jane@example.com "})
+        self.assertTrue(pre_audit_cv(original, new).passed)
+
+
+class PreAuditNumbersTest(unittest.TestCase):
+    def test_thousands_separators_are_the_same_figure(self):
+        original = _cv("2020 - 2021", "Served 1,000 customers with Python APIs")
+        new = _cv("2020 - 2021", "Served 1000 customers with Python APIs")
+        self.assertTrue(pre_audit_cv(original, new).passed)
+        self.assertTrue(pre_audit_cv(new, original).passed)
+
+    def test_invented_figure_is_flagged(self):
+        original = _cv("2020 - 2021", "Served 1,000 customers with Python APIs")
+        new = _cv("2020 - 2021", "Served 10,000 customers with Python APIs")
+        audit = pre_audit_cv(original, new)
+        self.assertFalse(audit.passed)
+        self.assertIn("10000", audit.issues[0].issue)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from models.agents.output import CV, JobAnalysis, WorkExperience
+from workflows.relevance import prune_cv, restore_pruned
+
+# Related to the job, so kept; the rest share no terms with it
+_RELATED = {0: "Python services on Kubernetes", 3: "Python data pipelines"}
+_UNRELATED = ["Organised the office party", "Painted the lobby", "Led choir practice"]
+
+
+def _cv() -> CV:
+    highlights = [
+        _RELATED.get(i) or f"{_UNRELATED[i % 3]} in year {i}" for i in range(8)
+    ]
+    return CV(
+        full_name="Ada Lovelace",
+        summary="Backend engineer.",
+        skills=[f"Hobby {i}" for i in range(20)] + ["Python", "Kubernetes"],
+        projects=["Garden shed", "Python job scheduler", "Bird box", "Quilt"],
+        experience=[
+            WorkExperience(
+                company="Acme", role="Engineer", dates="2020", highlights=highlights
+            )
+        ],
+        education=["BSc Mathematics"],
+    )
+
+
+def _job() -> JobAnalysis:
+    return JobAnalysis(
+        job_title="Platform Engineer",
+        company_name="Initech",
+        summary="Runs services.",
+        hard_skills=["Python", "Kubernetes"],
+        soft_skills=[],
+        key_responsibilities=["Build data pipelines"],
+        keywords_to_target=["Python"],
+    )
+
+
+class PruneRestoreTest(unittest.TestCase):
+    def test_prune_leaves_items_out(self):
+        pruned = prune_cv(_cv(), _job())
+
+        self.assertEqual(pruned.cv.experience[0].highlights, [_RELATED[0], _RELATED[3]])
+        self.assertEqual(pruned.cv.projects, ["Python job scheduler"])
+        self.assertEqual(len(pruned.cv.skills), 12)
+        self.assertEqual(pruned.omitted_count, 6 + 3 + 10)
+
+    def test_restore_brings_back_every_item_in_the_original_order(self):
+        cv = _cv()
+        pruned = prune_cv(cv, _job())
+
+        self.assertEqual(restore_pruned(pruned.cv, pruned), cv)
+
+    def test_restore_keeps_positions_around_rewritten_items(self):
+        cv = _cv()
+        pruned = prune_cv(cv, _job())
+        written = pruned.cv.model_copy(deep=True)
+        written.experience[0].highlights = ["Rewritten first", "Rewritten second"]
+        written.projects = ["Rewritten scheduler"]
+
+        restored = restore_pruned(written, pruned)
+
+        expected = cv.experience[0].highlights
+        expected[0], expected[3] = "Rewritten first", "Rewritten second"
+        self.assertEqual(restored.experience[0].highlights, expected)
+        self.assertEqual(
+            restored.projects,
+            ["Garden shed", "Rewritten scheduler", "Bird box", "Quilt"],
+        )
+
+    def test_restore_skips_items_the_writer_included(self):
+        cv = _cv()
+        pruned = prune_cv(cv, _job())
+        written = pruned.cv.model_copy(deep=True)
+        written.projects.append("Quilt")
+
+        restored = restore_pruned(written, pruned)
+
+        self.assertEqual(sorted(restored.projects), sorted(cv.projects))
+        self.assertEqual(restore_pruned(restored, pruned), restored)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import re
+import unittest
+
+from models.agents.output import CV, CVFragment, WorkExperience
+from utils.markdown_sections import MarkdownSection, split_markdown_sections
+from utils.resume_renderer import ResumeRenderer
+from workflows.resume_sections import merge_cv_fragments, resume_parse_units
+
+_ROLE_RE = re.compile(r"^(.*) at (.*) \((.*)\)$")
+_LIST_FIELDS = {
+    "Skills": "skills",
+    "Education": "education",
+    "Certifications": "certifications",
+    "Publications": "publications",
+}
+
+
+def _cv() -> CV:
+    return CV(
+        full_name="Ada Lovelace",
+        contact_info="ada@example.com | London",
+        summary="Backend engineer who likes **clear** APIs.",
+        skills=["Python", "Go", "PostgreSQL"],
+        projects=["Analytical engine notes", "A Bernoulli number program"],
+        experience=[
+            WorkExperience(
+                company="Acme",
+                role="Senior Engineer",
+                dates="2020 - 2024",
+                highlights=["Built the billing API", "Cut p99 latency by 40%"],
+            ),
+            WorkExperience(
+                company="Initech",
+                role="Developer",
+                dates="2018 - 2020",
+                highlights=["Migrated reports to Python"],
+            ),
+        ],
+        education=["BSc Mathematics, University of London"],
+        certifications=["AWS Solutions Architect"],
+        publications=["Notes on the engine"],
+    )
+
+
+def _parse(section: MarkdownSection) -> CVFragment:
+    """What the parser agent reads from a section of a rendered resume."""
+    body = section.text.split("\n", 1)[1].strip() if "\n" in section.text else ""
+    bullets = [line[2:] for line in body.splitlines() if line.startswith("- ")]
+    if section.level == 1:
+        return CVFragment(full_name=section.heading, contact_info=body)
+    if section.path == ["Work Experience"]:
+        role, company, dates = _ROLE_RE.match(section.heading).groups()
+        experience = [
+            WorkExperience(company=company, role=role, dates=dates, highlights=bullets)
+        ]
+        return CVFragment(experience=experience)
+    if section.heading == "Professional Summary":
+        return CVFragment(summary=body)
+    if section.heading == "Projects":
+        return CVFragment(projects=body.split("\n\n"))
+    return CVFragment(**{_LIST_FIELDS[section.heading]: bullets})
+
+
+class ResumeSectionsRoundTripTest(unittest.TestCase):
+    def test_split_and_merge_reproduce_the_cv(self):
+        cv = _cv()
+        units = resume_parse_units(ResumeRenderer().render(cv))
+
+        self.assertEqual(merge_cv_fragments([_parse(unit) for unit in units]), cv)
+
+    def test_units_cover_every_line_in_order(self):
+        markdown = ResumeRenderer().render(_cv())
+        sections = split_markdown_sections(markdown)
+
+        self.assertEqual(
+            [line for s in sections for line in s.text.splitlines() if line.strip()],
+            [line for line in markdown.splitlines() if line.strip()],
+        )
+        self.assertEqual(
+            [s.heading for s in resume_parse_units(markdown)],
+            [
+                "Ada Lovelace",
+                "Professional Summary",
+                "Skills",
+                "Projects",
+                "Senior Engineer at Acme (2020 - 2024)",
+                "Developer at Initech (2018 - 2020)",
+                "Education",
+                "Certifications",
+                "Publications",
+            ],
+        )
+
+    def test_headings_in_code_fences_do_not_split(self):
+        markdown = "# Ada\n\n## Projects\n```\n# not a heading\n```\n"
+
+        sections = split_markdown_sections(markdown)
+
+        self.assertEqual([s.heading for s in sections], ["Ada", "Projects"])
+        self.assertIn("# not a heading", sections[1].text)
+
+    def test_merge_dedupes_skills_and_keeps_document_order(self):
+        role = WorkExperience(
+            company="Acme", role="Engineer", dates="2020", highlights=["Shipped"]
+        )
+        merged = merge_cv_fragments(
+            [
+                CVFragment(full_name="Ada", skills=["Python", "Go"]),
+                CVFragment(experience=[role], skills=["python", "SQL"]),
+            ]
+        )
+
+        self.assertEqual(merged.skills, ["Python", "Go", "SQL"])
+        self.assertEqual(merged.experience, [role])
+
+    def test_merge_needs_a_name_and_experience(self):
+        role = WorkExperience(
+            company="Acme", role="Engineer", dates="2020", highlights=["Shipped"]
+        )
+
+        self.assertIsNone(merge_cv_fragments([CVFragment(experience=[role])]))
+        self.assertIsNone(merge_cv_fragments([CVFragment(full_name="Ada")]))
+
+
+if __name__ == "__main__":
+    unittest.main()
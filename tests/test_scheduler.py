@@ -0,0 +1,140 @@
+import asyncio
+import unittest
+
+from workflows.scheduler import Stage, StageScheduler
+
+
+def _stage(name: str, inputs: tuple[str, ...] = (), output: str | None = None):
+    async def fn(**kwargs):
+        return f"{name}({', '.join(str(kwargs[i]) for i in inputs)})"
+
+    return Stage(name, fn, inputs, (output or name,))
+
+
+class StageSchedulerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_stages_after_their_inputs(self):
+        order = []
+
+        def recorded(stage: Stage) -> Stage:
+            async def fn(**kwargs):
+                order.append(stage.name)
+                return await stage.fn(**kwargs)
+
+            return Stage(stage.name, fn, stage.inputs, stage.outputs)
+
+        scheduler = StageScheduler(
+            [
+                recorded(_stage("write", ("analysis", "cv"))),
+                recorded(_stage("analysis", ("posting",))),
+                recorded(_stage("cv", ("resume",))),
+            ]
+        )
+
+        values, timeline = await scheduler.run({"posting": "p", "resume": "r"})
+
+        self.assertEqual(values["write"], "write(analysis(p), cv(r))")
+        self.assertEqual(order[-1], "write")
+        self.assertEqual(
+            {t.name: t.depends_on for t in timeline.stages},
+            {"analysis": [], "cv": [], "write": ["analysis", "cv"]},
+        )
+
+    async def test_splits_several_outputs(self):
+        async def both():
+            return {"a": 1, "b": 2}
+
+        values, _ = await StageScheduler([Stage("both", both, (), ("a", "b"))]).run({})
+
+        self.assertEqual((values["a"], values["b"]), (1, 2))
+
+    async def test_missing_output_fails(self):
+        async def partial():
+            return {"a": 1}
+
+        with self.assertRaisesRegex(ValueError, "did not produce"):
+            await StageScheduler([Stage("both", partial, (), ("a", "b"))]).run({})
+
+    def test_rejects_an_output_with_two_producers(self):
+        with self.assertRaisesRegex(ValueError, "produced by both"):
+            StageScheduler([_stage("a", output="x"), _stage("b", output="x")])
+
+    async def test_unknown_dependency_fails(self):
+        scheduler = StageScheduler([_stage("a"), _stage("b", ("missing",))])
+
+        with self.assertRaisesRegex(ValueError, "can never start: b"):
+            await scheduler.run({})
+
+    async def test_cycle_fails(self):
+        scheduler = StageScheduler([_stage("a", ("b",)), _stage("b", ("a",))])
+
+        with self.assertRaisesRegex(ValueError, "can never start: a, b"):
+            await scheduler.run({})
+
+    async def test_failure_cancels_running_stages_and_propagates(self):
+        slow_cancelled = asyncio.Event()
+        dependent_ran = False
+
+        async def slow():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                slow_cancelled.set()
+                raise
+
+        async def failing():
+            raise RuntimeError("scrape failed")
+
+        async def dependent(failing):
+            nonlocal dependent_ran
+            dependent_ran = True
+
+        scheduler = StageScheduler(
+            [
+                Stage("slow", slow, (), ("slow",)),
+                Stage("failing", failing, (), ("failing",)),
+                Stage("dependent", dependent, ("failing",), ("dependent",)),
+            ]
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "scrape failed"):
+            await scheduler.run({})
+        self.assertTrue(slow_cancelled.is_set())
+        self.assertFalse(dependent_ran)
+
+    async def test_critical_path_follows_the_last_dependency_to_finish(self):
+        fast_done = asyncio.Event()
+
+        async def fast():
+            fast_done.set()
+            return "fast"
+
+        async def slow():
+            # Finishes after `fast`, without depending on it
+            await fast_done.wait()
+            await asyncio.sleep(0.01)
+            return "slow"
+
+        async def combine(fast, slow):
+            return fast + slow
+
+        scheduler = StageScheduler(
+            [
+                Stage("fast", fast, (), ("fast",)),
+                Stage("slow", slow, (), ("slow",)),
+                Stage("combine", combine, ("fast", "slow"), ("combined",)),
+            ]
+        )
+
+        values, timeline = await scheduler.run({})
+
+        self.assertEqual(values["combined"], "fastslow")
+        self.assertEqual(timeline.critical_path, ["slow", "combine"])
+        stages = {t.name: t for t in timeline.stages}
+        self.assertGreaterEqual(
+            stages["combine"].started_at, stages["slow"].finished_at
+        )
+        self.assertGreaterEqual(timeline.total_seconds, stages["combine"].finished_at)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import os
+import tempfile
+import unittest
+
+from utils.simhash import SimHashIndex, hamming_distance, simhash
+
+# A fingerprint with bits set in every band
+BASE = 0x0123_4567_89AB_CDEF
+
+
+def _flip(fingerprint: int, *bits: int) -> int:
+    for bit in bits:
+        fingerprint ^= 1 << bit
+    return fingerprint
+
+
+class SimHashTest(unittest.TestCase):
+    def test_near_duplicate_texts_are_close(self):
+        text = " ".join(f"word{i}" for i in range(200))
+        edited = text.replace("word100", "changed")
+
+        self.assertEqual(simhash(text), simhash(text))
+        self.assertLessEqual(hamming_distance(simhash(text), simhash(edited)), 8)
+        self.assertGreater(
+            hamming_distance(simhash(text), simhash("an unrelated posting")), 8
+        )
+
+
+class SimHashIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "index", "simhash.jsonl")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _lines(self) -> int:
+        with open(self.path, encoding="utf-8") as f:
+            return len(f.readlines())
+
+    def test_finds_matches_differing_in_several_bands(self):
+        index = SimHashIndex()
+        band_bits = 64 // index.bands
+        # One differing bit in each of four bands, so only one band agrees
+        near = _flip(BASE, *(band * band_bits for band in range(4)))
+        far = _flip(BASE, *(band * band_bits for band in range(5)))
+        index.add(near, "near")
+        index.add(far, "far")
+
+        self.assertEqual(list(index.find(BASE)), [("near", 4)])
+
+    def test_finds_closest_first(self):
+        index = SimHashIndex()
+        index.add(_flip(BASE, 1, 2, 3), "three")
+        index.add(_flip(BASE, 1), "one")
+        index.add(BASE, "exact")
+
+        self.assertEqual(
+            list(index.find(BASE)), [("exact", 0), ("one", 1), ("three", 3)]
+        )
+
+    def test_rejects_a_max_distance_bands_cannot_guarantee(self):
+        with self.assertRaises(ValueError):
+            SimHashIndex(bands=4, max_distance=4)
+
+    def test_removed_keys_are_not_found_after_reload(self):
+        index = SimHashIndex(self.path)
+        index.add(BASE, "kept")
+        index.add(_flip(BASE, 1), "removed")
+        index.remove("removed")
+
+        self.assertEqual(list(index.find(BASE)), [("kept", 0)])
+        reloaded = SimHashIndex(self.path)
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(list(reloaded.find(BASE)), [("kept", 0)])
+
+    def test_removing_while_iterating_skips_removed_keys(self):
+        index = SimHashIndex()
+        for bit in range(3):
+            index.add(_flip(BASE, bit), f"k{bit}")
+        matches = index.find(BASE)
+        self.assertEqual(next(matches)[0], "k0")
+        # Enough removals to compact and renumber the entries
+        index.remove("k1")
+        index.remove("k2")
+
+        self.assertEqual(list(matches), [])
+        self.assertEqual(len(index), 1)
+
+    def test_compacts_once_tombstones_outnumber_entries(self):
+        index = SimHashIndex(self.path)
+        for bit in range(4):
+            index.add(_flip(BASE, bit), f"k{bit}")
+        index.remove("k0")
+        index.remove("k1")
+        self.assertEqual(self._lines(), 6)
+
+        index.remove("k2")
+
+        self.assertEqual(self._lines(), 1)
+        self.assertEqual(list(index.find(BASE)), [("k3", 1)])
+        self.assertEqual(list(SimHashIndex(self.path).find(BASE)), [("k3", 1)])
+
+    def test_max_entries_removes_the_oldest(self):
+        index = SimHashIndex(self.path, max_entries=2)
+        for bit in range(4):
+            index.add(_flip(BASE, bit), f"k{bit}")
+
+        self.assertEqual(sorted(key for key, _ in index.find(BASE)), ["k2", "k3"])
+        self.assertEqual(len(SimHashIndex(self.path, max_entries=2)), 2)
+
+    def test_skips_a_line_cut_short(self):
+        index = SimHashIndex(self.path)
+        index.add(BASE, "kept")
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"fingerprint": 12')
+
+        self.assertEqual(list(SimHashIndex(self.path).find(BASE)), [("kept", 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+import statistics
+import unittest
+
+from benchmarks.startup import ENTRY_POINTS, IMPORT_BUDGET_SECONDS, measure_import
+
+# Fresh interpreters per entry point; the median evens out a slow start
+REPEATS = 3
+
+
+class StartupTest(unittest.TestCase):
+    def test_entry_points_import_within_budget(self):
+        for module in ENTRY_POINTS:
+            with self.subTest(module=module):
+                samples = [measure_import(module) for _ in range(REPEATS)]
+                seconds = statistics.median(sample["seconds"] for sample in samples)
+                self.assertLess(seconds, IMPORT_BUDGET_SECONDS)
+
+    def test_entry_points_defer_heavy_modules(self):
+        for module in ENTRY_POINTS:
+            with self.subTest(module=module):
+                self.assertEqual(measure_import(module)["deferred_loaded"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
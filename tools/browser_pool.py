@@ -0,0 +1,314 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, Self
+
+from pydantic import BaseModel, Field
+
+from utils.cache import DiskCache, SingleFlight
+from utils.text import content_hash
+
+if TYPE_CHECKING:
+    from playwright.async_api import (
+        APIRequestContext,
+        Browser,
+        BrowserContext,
+        Playwright,
+        Route,
+    )
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+# Not needed for the text of a posting, and most of the bytes of a page
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# Element holding the posting; the whole body is used when a page has none
+CONTENT_SELECTOR = "main"
+# Longest wait for client-rendered postings to finish loading after the DOM
+# is ready; pages that keep polling fall back to the load event
+NETWORK_IDLE_TIMEOUT_SECONDS = 10.0
+# Characters of Markdown kept per posting, to bound the analysis prompt
+MAX_MARKDOWN_CHARS = 20000
+
+
+class CachedPage(BaseModel):
+    url: str
+    markdown: str
+    etag: str | None = Field(default=None, description="ETag response header.")
+    last_modified: str | None = Field(
+        default=None, description="Last-Modified response header."
+    )
+
+
+class FetchedPage(BaseModel):
+    url: str
+    markdown: str = ""
+    status: Literal["rendered", "not_modified", "failed"] = "failed"
+    seconds: float = Field(
+        default=0.0, description="Cache lookup to Markdown, including queueing."
+    )
+    error: str | None = None
+
+
+@dataclass
+class IngestionStats:
+    rendered: int = 0
+    not_modified: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def pages(self) -> int:
+        return self.rendered + self.not_modified
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.busy_seconds if self.busy_seconds else 0.0
+
+    def format(self) -> str:
+        return (
+            f"🌐 Fetched {self.pages} posting(s) at {self.pages_per_second:.1f} pages/s "
+            f"({self.rendered} rendered, {self.not_modified} not modified, "
+            f"{self.failed} failed)"
+        )
+
+
+def html_to_markdown(html: str, max_chars: int = MAX_MARKDOWN_CHARS) -> str:
+    """Convert posting HTML to Markdown, without links and images."""
+    import html2text
+
+    converter = html2text.HTML2Text()
+    converter.ignore_links = True
+    converter.ignore_images = True
+    converter.body_width = 0
+    return converter.handle(html)[:max_chars]
+
+
+async def _skip_heavy_resources(route: "Route") -> None:
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class BrowserPool:
+    """
+    Fetches job postings from URLs as Markdown with one long-lived headless
+    Chromium and a bounded pool of browser contexts, so many postings render
+    concurrently without launching a browser per URL.
+
+    Postings are cached on disk by URL. A cached posting is revalidated with
+    a conditional request (If-None-Match / If-Modified-Since) and only
+    rendered again when the server reports a change. HTML is converted to
+    Markdown in a thread, off the event loop.
+
+    Usage:
+        async with BrowserPool() as pool:
+            page = await pool.fetch(url)
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = 4,
+        cache: DiskCache | None = None,
+        use_cache: bool = True,
+        timeout_seconds: float = 30.0,
+    ):
+        """
+        Args:
+            max_contexts: Pages rendered at once, one browser context each
+            cache: Cache for fetched postings, defaults to `job_pages`
+            use_cache: Set False to render every URL, without revalidation
+            timeout_seconds: Navigation and revalidation timeout per URL
+        """
+        self.max_contexts = max_contexts
+        self.cache = (cache or DiskCache("job_pages")) if use_cache else None
+        self.timeout_ms = timeout_seconds * 1000
+        self.stats = IngestionStats()
+        self._contexts: asyncio.Queue[BrowserContext] = asyncio.Queue()
+        self._flights = SingleFlight()
+        self._active = 0
+        self._busy_since = 0.0
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._request: APIRequestContext | None = None
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Launch the browser and open its contexts."""
+        # Only runs with URL postings, so not imported at startup
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._request = await self._playwright.request.new_context(
+                user_agent=USER_AGENT
+            )
+            for context in await asyncio.gather(
+                *(
+                    self._browser.new_context(user_agent=USER_AGENT)
+                    for _ in range(self.max_contexts)
+                )
+            ):
+                await context.route("**/*", _skip_heavy_resources)
+                self._contexts.put_nowait(context)
+        except BaseException:
+            # e.g. Chromium isn't installed: don't leave the driver running
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Close the contexts and the browser."""
+        while not self._contexts.empty():
+            await self._contexts.get_nowait().close()
+        if self._request is not None:
+            await self._request.dispose()
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = self._request = None
+
+    async def fetch(self, url: str) -> FetchedPage:
+        """
+        Fetch one posting as Markdown, from cache when it didn't change.
+        Concurrent fetches of the same URL share one fetch.
+
+        Returns:
+            The posting, with `error` set on failure
+        """
+        page, _ = await self._flights.do(url, lambda: self._fetch(url))
+        return page
+
+    async def fetch_many(self, urls: Iterable[str]) -> AsyncIterator[FetchedPage]:
+        """
+        Fetch many postings concurrently, as many at once as there are
+        contexts.
+
+        Yields:
+            One FetchedPage per URL, in completion order
+        """
+        tasks = [asyncio.ensure_future(self.fetch(url)) for url in urls]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch(self, url: str) -> FetchedPage:
+        start = time.perf_counter()
+        if self._active == 0:
+            self._busy_since = start
+        self._active += 1
+        page = FetchedPage(url=url)
+        key = content_hash(url)
+        try:
+            cached = self.cache.get(key, CachedPage) if self.cache else None
+            if cached is not None and await self._not_modified(cached):
+                page.markdown = cached.markdown
+                page.status = "not_modified"
+            else:
+                html, headers = await self._render(url)
+                page.markdown = await asyncio.to_thread(html_to_markdown, html)
+                page.status = "rendered"
+                if self.cache:
+                    self.cache.set(
+                        key,
+                        CachedPage(
+                            url=url,
+                            markdown=page.markdown,
+                            etag=headers.get("etag"),
+                            last_modified=headers.get("last-modified"),
+                        ),
+                    )
+        except Exception as e:
+            page.error = f"Error fetching {url}: {e}"
+        finally:
+            now = time.perf_counter()
+            page.seconds = now - start
+            self._active -= 1
+            if self._active == 0:
+                self.stats.busy_seconds += now - self._busy_since
+        if page.status == "rendered":
+            self.stats.rendered += 1
+        elif page.status == "not_modified":
+            self.stats.not_modified += 1
+        else:
+            self.stats.failed += 1
+        return page
+
+    async def _not_modified(self, cached: CachedPage) -> bool:
+        """Whether the server confirms the cached posting is still current."""
+        headers = {}
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+        if not headers or self._request is None:
+            return False
+        response = await self._request.get(
+            cached.url,
+            headers=headers,
+            fail_on_status_code=False,
+            timeout=self.timeout_ms,
+        )
+        try:
+            return response.status == 304
+        finally:
+            await response.dispose()
+
+    async def _render(self, url: str) -> tuple[str, dict[str, Any]]:
+        """
+        Render `url` in a pooled context.
+
+        Returns:
+            The posting HTML and the response headers
+
+        Raises:
+            RuntimeError: If the pool wasn't started or the server returned an error
+        """
+        if self._browser is None:
+            raise RuntimeError("BrowserPool used before start()")
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+        context = await self._contexts.get()
+        try:
+            page = await context.new_page()
+            try:
+                response = await page.goto(
+                    url, wait_until="domcontentloaded", timeout=self.timeout_ms
+                )
+                if response is None or not response.ok:
+                    status = response.status if response is not None else "no response"
+                    raise RuntimeError(f"HTTP {status}")
+                # Client-rendered postings fill in after the DOM is loaded
+                try:
+                    await page.wait_for_load_state(
+                        "networkidle",
+                        timeout=min(
+                            self.timeout_ms, NETWORK_IDLE_TIMEOUT_SECONDS * 1000
+                        ),
+                    )
+                except PlaywrightTimeoutError:
+                    await page.wait_for_load_state("load", timeout=self.timeout_ms)
+                # Most job boards have no <main>; don't wait for one to appear
+                content = await page.query_selector(CONTENT_SELECTOR)
+                html = await (
+                    content.inner_html() if content else page.inner_html("body")
+                )
+                return html, response.headers
+            finally:
+                await page.close()
+        finally:
+            self._contexts.put_nowait(context)
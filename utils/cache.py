@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+DEFAULT_CACHE_DIR = os.path.join(os.getcwd(), ".cache")
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_AGE_SECONDS = 30 * 24 * 60 * 60  # 30 days
+
+
+class DiskCache:
+    """
+    Content-addressed on-disk cache for validated Pydantic models.
+
+    Each entry is one JSON file named after its key inside
+    `<directory>/<namespace>/`. Entries older than `max_age_seconds` are
+    dropped, and the least recently used entries are evicted once the
+    namespace holds more than `max_entries` files.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        directory: str | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_seconds: float = DEFAULT_MAX_AGE_SECONDS,
+    ):
+        self.namespace = namespace
+        self.path = os.path.join(directory or DEFAULT_CACHE_DIR, namespace)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.json")
+
+    def get(self, key: str, model_type: type[T]) -> T | None:
+        """
+        Return the cached model for `key`, or None on a miss.
+
+        Expired or unreadable entries are removed and reported as misses.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            self._remove(entry_path)
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.max_age_seconds:
+            self._remove(entry_path)
+            return None
+
+        try:
+            value = model_type.model_validate(entry.get("value"))
+        except ValidationError:
+            # Stale schema, the model changed since this entry was written
+            self._remove(entry_path)
+            return None
+
+        # Touch the file so eviction keeps recently used entries
+        os.utime(entry_path)
+        return value
+
+    def set(self, key: str, value: BaseModel) -> None:
+        """Store `value` under `key` and evict old entries if needed."""
+        os.makedirs(self.path, exist_ok=True)
+        entry = {
+            "created_at": time.time(),
+            "model": type(value).__name__,
+            "value": value.model_dump(mode="json"),
+        }
+        # Write to a temp file first so readers never see a partial entry
+        tmp_path = f"{self._entry_path(key)}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, self._entry_path(key))
+        self.evict()
+
+    def invalidate(self, key: str | None = None) -> int:
+        """
+        Remove one entry, or the whole namespace when `key` is None.
+
+        Returns:
+            Number of entries removed
+        """
+        if key is not None:
+            return int(self._remove(self._entry_path(key)))
+
+        if not os.path.isdir(self.path):
+            return 0
+        removed = len(self._entries())
+        shutil.rmtree(self.path, ignore_errors=True)
+        return removed
+
+    def evict(self) -> int:
+        """
+        Drop expired entries, then the least recently used ones above
+        `max_entries`.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        removed = 0
+        alive: list[tuple[float, str]] = []
+        for entry_path in self._entries():
+            try:
+                mtime = os.path.getmtime(entry_path)
+            except OSError:
+                continue
+            # mtime is refreshed on every hit, so it also tracks last use;
+            # expiry itself is checked against created_at in get()
+            if now - mtime > self.max_age_seconds:
+                removed += self._remove(entry_path)
+            else:
+                alive.append((mtime, entry_path))
+
+        alive.sort()
+        while len(alive) > self.max_entries:
+            _, entry_path = alive.pop(0)
+            removed += self._remove(entry_path)
+        return removed
+
+    def _entries(self) -> list[str]:
+        if not os.path.isdir(self.path):
+            return []
+        return [
+            os.path.join(self.path, name)
+            for name in os.listdir(self.path)
+            if name.endswith(".json")
+        ]
+
+    @staticmethod
+    def _remove(entry_path: str) -> bool:
+        try:
+            os.remove(entry_path)
+            return True
+        except FileNotFoundError:
+            return False
+
+
+class SingleFlight:
+    """
+    De-duplicates concurrent async calls that share a key.
+
+    The first caller for a key starts the work; callers arriving while it is
+    still running await the same task instead of starting their own. Work
+    every caller gave up on (e.g. their runs were cancelled) is cancelled
+    too, so no task outlives the calls that wanted its result.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        # Callers still awaiting each in-flight task
+        self._waiters: dict[asyncio.Task, int] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[R]]) -> tuple[R, bool]:
+        """
+        Run `fn` once per in-flight `key`.
+
+        Returns:
+            The result and whether it was shared from another caller's call
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            # Shield so one cancelled caller doesn't cancel the work for the others
+            return await asyncio.shield(task), shared
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                task.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the Resume Tailorator cache")
+    parser.add_argument(
+        "--dir", default=DEFAULT_CACHE_DIR, help="Cache directory (default: .cache)"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    clear_parser = subparsers.add_parser("clear", help="Invalidate cached entries")
+    clear_parser.add_argument(
+        "namespace",
+        nargs="*",
+        help="Namespaces to clear, e.g. resume_parser (default: all)",
+    )
+    args = parser.parse_args()
+
+    if args.command == "clear":
+        namespaces = args.namespace or (
+            sorted(
+                name
+                for name in os.listdir(args.dir)
+                if os.path.isdir(os.path.join(args.dir, name))
+            )
+            if os.path.isdir(args.dir)
+            else []
+        )
+        if not namespaces:
+            print("ℹ️ Cache is already empty.")
+            sys.exit(0)
+        for namespace in namespaces:
+            removed = DiskCache(namespace, args.dir).invalidate()
+            print(f"🧹 Cleared {removed} entries from '{namespace}' cache.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import aiofiles
+
+# Tried in order; latin-1 maps every byte so decoding always succeeds
+FALLBACK_ENCODINGS = ("utf-8-sig", "cp1252", "latin-1")
+
+
+async def read_text_file(file_path: str) -> str:
+    """
+    Read a text file without blocking the event loop.
+
+    Files that aren't valid UTF-8 (e.g. postings saved from Word or a
+    Windows browser) are decoded with the first fallback encoding that works.
+
+    Args:
+        file_path: Path to the text file
+
+    Returns:
+        The decoded file content
+    """
+    async with aiofiles.open(file_path, "rb") as f:
+        raw = await f.read()
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return raw.decode("utf-8", errors="replace")
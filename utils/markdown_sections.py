@@ -0,0 +1,77 @@
+import re
+
+from pydantic import BaseModel, Field
+
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)")
+
+
+class MarkdownSection(BaseModel):
+    heading: str = Field(description="Heading text, empty for the preamble.")
+    level: int = Field(description="Heading level 1-6, 0 for the preamble.")
+    path: list[str] = Field(
+        default_factory=list,
+        description="Headings of the enclosing sections, outermost first, "
+        "not counting the level 1 document title.",
+    )
+    text: str = Field(description="The heading line and body, as written.")
+    has_body: bool = Field(
+        default=True, description="Whether there is content besides the heading."
+    )
+
+
+def split_markdown_sections(markdown: str) -> list[MarkdownSection]:
+    """
+    Split a Markdown document at every ATX heading (`#` to `######`).
+
+    Each section runs from its heading to the next heading of any level, so
+    a "## Experience" section with "### Role" subsections yields one section
+    per role with "Experience" in its `path`. Headings inside fenced code
+    blocks are ignored.
+
+    Args:
+        markdown: The Markdown document
+
+    Returns:
+        Sections in document order; text before the first heading is a
+        level 0 preamble section
+    """
+    sections: list[MarkdownSection] = []
+    # (level, heading) of the sections enclosing the current line
+    stack: list[tuple[int, str]] = []
+    heading, level, lines = "", 0, []
+    in_fence = False
+
+    def flush() -> None:
+        text = "\n".join(lines).strip("\n")
+        body = "\n".join(lines[1:] if level else lines).strip()
+        if text.strip():
+            sections.append(
+                MarkdownSection(
+                    heading=heading,
+                    level=level,
+                    path=[name for _, name in stack],
+                    text=text,
+                    has_body=bool(body),
+                )
+            )
+
+    for line in markdown.replace("\r\n", "\n").split("\n"):
+        if _FENCE_RE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING_RE.match(line)
+        if match is None:
+            lines.append(line)
+            continue
+
+        flush()
+        # The level 1 title (usually the candidate's name) encloses everything
+        # and says nothing about what a section is
+        if level > 1:
+            stack.append((level, heading))
+        level, heading, lines = len(match.group(1)), match.group(2), [line]
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+
+    flush()
+    return sections
@@ -1,75 +1,90 @@
 # Add this import at the top
 import os
-import json
 
+from models.agents.output import CV
 from models.workflow import ResumeTailorResult
 from utils.pdf_converter import markdown_to_pdf
+from utils.resume_renderer import ResumeRenderer
 
+# Shared so batch output reuses sections rendered for earlier variants
+_renderer = ResumeRenderer()
 
-def generate_resume(result: ResumeTailorResult) -> None:
+
+def resume_output_paths(
+    result: ResumeTailorResult,
+    base_filename: str | None = None,
+    output_dir: str | None = None,
+) -> tuple[str, str]:
     """
-    Convert Markdown content to PDF with professional styling.
+    Markdown and PDF paths a tailored resume is saved to.
 
     Args:
         result: ResumeTailorResult object containing tailored resume and company name
-    """
-    files_path = os.path.join(os.getcwd(), "files")
-    base_filename = f"tailored_resume_{result.company_name}"
-    md_output_path = os.path.join(files_path, f"{base_filename}.md")
-    pdf_output_path = os.path.join(files_path, f"{base_filename}.pdf")
-
-    # Parse the CV JSON back to CV object
-    cv_data = json.loads(result.tailored_resume)
-
-    # Build markdown content
-    md_content = [f"# {cv_data.get('full_name', 'N/A')}\n"]
-
-    if cv_data.get("contact_info"):
-        md_content.append(f"{cv_data.get('contact_info')}\n")
-    md_content.append("\n")
+        base_filename: Optional output file name without extension, defaults to
+            tailored_resume_<company_name>
+        output_dir: Directory to save to, defaults to ./files
 
-    md_content.append(f"## Professional Summary\n{cv_data.get('summary', '')}\n\n")
-
-    md_content.append("## Skills\n")
-    for skill in cv_data.get("skills", []):
-        md_content.append(f"- {skill}\n")
+    Returns:
+        (markdown_path, pdf_path)
+    """
+    files_path = output_dir or os.path.join(os.getcwd(), "files")
+    base_filename = base_filename or f"tailored_resume_{result.company_name}"
+    return (
+        os.path.join(files_path, f"{base_filename}.md"),
+        os.path.join(files_path, f"{base_filename}.pdf"),
+    )
 
-    if cv_data.get("projects"):
-        md_content.append("\n## Projects\n")
-        for project in cv_data.get("projects", []):
-            md_content.append(f"{project}\n\n")
 
-    md_content.append("\n## Work Experience\n")
-    for exp in cv_data.get("experience", []):
-        md_content.append(
-            f"### {exp.get('role', '')} at {exp.get('company', '')} ({exp.get('dates', '')})\n\n"
-        )
-        for hl in exp.get("highlights", []):
-            md_content.append(f"- {hl}\n")
-        md_content.append("\n")
+def build_resume_markdown(result: ResumeTailorResult) -> str:
+    """
+    Render a tailored resume as Markdown.
 
-    md_content.append("## Education\n")
-    for edu in cv_data.get("education", []):
-        md_content.append(f"- {edu}\n")
+    Args:
+        result: ResumeTailorResult object containing tailored resume and company name
 
-    if cv_data.get("certifications"):
-        md_content.append("\n## Certifications\n")
-        for cert in cv_data.get("certifications", []):
-            md_content.append(f"- {cert}\n")
+    Returns:
+        The resume as Markdown text
+    """
+    cv = result.tailored_cv or CV.model_validate_json(result.tailored_resume)
+    return _renderer.render(cv)
 
-    if cv_data.get("publications"):
-        md_content.append("\n## Publications\n")
-        for pub in cv_data.get("publications", []):
-            md_content.append(f"- {pub}\n")
 
-    markdown_text = "".join(md_content)
+def write_resume_files(
+    markdown_text: str,
+    md_output_path: str,
+    pdf_output_path: str,
+    css_style: str | None = None,
+) -> None:
+    """
+    Save a Markdown resume and its PDF rendering.
 
+    Args:
+        markdown_text: The resume as Markdown
+        md_output_path: Where to save the Markdown
+        pdf_output_path: Where to save the PDF
+        css_style: Optional CSS string for the PDF
+    """
     # Save Markdown
     with open(md_output_path, "w", encoding="utf-8") as f:
         f.write(markdown_text)
 
     # Save PDF
-    markdown_to_pdf(markdown_text, pdf_output_path)
+    markdown_to_pdf(markdown_text, pdf_output_path, css_style)
+
+
+def generate_resume(
+    result: ResumeTailorResult, base_filename: str | None = None
+) -> None:
+    """
+    Convert Markdown content to PDF with professional styling.
+
+    Args:
+        result: ResumeTailorResult object containing tailored resume and company name
+        base_filename: Optional output file name without extension, defaults to
+            tailored_resume_<company_name>
+    """
+    md_output_path, pdf_output_path = resume_output_paths(result, base_filename)
+    write_resume_files(build_resume_markdown(result), md_output_path, pdf_output_path)
 
     print(
         f"✅ Tailored CV saved to:\n   - Markdown: {md_output_path}\n   - PDF: {pdf_output_path}"
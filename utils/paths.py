@@ -0,0 +1,54 @@
+import glob
+import os
+
+DEFAULT_INPUT_EXTENSIONS = (".md", ".txt")
+URL_SCHEMES = ("http://", "https://")
+
+
+def is_url(path: str) -> bool:
+    return path.startswith(URL_SCHEMES)
+
+
+def expand_input_paths(
+    patterns: list[str], extensions: tuple[str, ...] = DEFAULT_INPUT_EXTENSIONS
+) -> list[str]:
+    """
+    Expand files, directories and glob patterns into a list of input files.
+
+    Directories contribute their direct children with one of `extensions`.
+    URLs are kept as they are. Duplicates are dropped while keeping the
+    first-seen order.
+
+    Args:
+        patterns: File paths, directory paths, glob patterns or URLs
+        extensions: File extensions picked up from directories
+
+    Returns:
+        Absolute paths of the matching files, and the URLs
+    """
+    paths: list[str] = []
+    for pattern in patterns:
+        if is_url(pattern):
+            if pattern not in paths:
+                paths.append(pattern)
+            continue
+        if os.path.isdir(pattern):
+            matches = sorted(
+                os.path.join(pattern, name)
+                for name in os.listdir(pattern)
+                if name.endswith(extensions)
+            )
+        elif glob.has_magic(pattern):
+            matches = sorted(
+                match
+                for match in glob.glob(pattern, recursive=True)
+                if os.path.isfile(match)
+            )
+        else:
+            matches = [pattern]
+
+        for match in matches:
+            path = os.path.abspath(match)
+            if path not in paths:
+                paths.append(path)
+    return paths
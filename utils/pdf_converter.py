@@ -1,6 +1,3 @@
-from markdown_pdf import MarkdownPdf, Section
-
-
 def markdown_to_pdf(
     markdown_content: str, output_path: str, css_style: str | None = None
 ) -> None:
@@ -12,11 +9,15 @@ def markdown_to_pdf(
         output_path: Path where PDF will be saved
         css_style: Optional CSS string for custom styling
     """
+    # Imported on first use: loading the PDF library takes a noticeable part
+    # of startup for commands that never render
+    from markdown_pdf import MarkdownPdf, Section
+
     # Create PDF generator with custom CSS
     pdf = MarkdownPdf(toc_level=2)
 
     # Add Markdown content as a section
-    pdf.add_section(Section(markdown_content))
+    pdf.add_section(Section(markdown_content), user_css=css_style)
 
     # Save to output path
     pdf.save(output_path)
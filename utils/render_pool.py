@@ -0,0 +1,187 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from collections.abc import AsyncIterator, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Self
+
+from pydantic import BaseModel, Field
+
+from models.workflow import ResumeTailorResult
+from utils.markdown_writer import (
+    build_resume_markdown,
+    resume_output_paths,
+    write_resume_files,
+)
+
+# Per-worker state, set once by the pool initializer
+_worker_css: str | None = None
+
+
+def _init_worker(css_style: str | None) -> None:
+    global _worker_css
+    _worker_css = css_style
+    # Pay for the PDF library import once per worker, not on the first document
+    import markdown_pdf  # noqa: F401
+
+
+def _ready() -> None:
+    pass
+
+
+def _render_in_worker(
+    markdown_text: str, md_output_path: str, pdf_output_path: str
+) -> float:
+    start = time.perf_counter()
+    write_resume_files(markdown_text, md_output_path, pdf_output_path, _worker_css)
+    return time.perf_counter() - start
+
+
+class RenderedDocument(BaseModel):
+    base_filename: str | None = None
+    markdown_path: str
+    pdf_path: str
+    render_seconds: float = Field(
+        default=0.0, description="Writing Markdown and rendering PDF in the worker."
+    )
+    wall_seconds: float = Field(
+        default=0.0, description="Submission to completion, including queueing."
+    )
+    error: str | None = None
+
+
+class RenderPool:
+    """
+    Saves tailored resumes as Markdown and PDF in a pool of worker processes,
+    so the CPU-heavy PDF rendering never blocks the event loop.
+
+    Each worker loads the stylesheet and the PDF library once at startup.
+    Workers start with the first document, so a batch where nothing passes
+    never spawns them.
+
+    Usage:
+        async with RenderPool() as pool:
+            document = await pool.render(result)
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        css_style: str | None = None,
+        css_path: str | None = None,
+        output_dir: str | None = None,
+    ):
+        """
+        Args:
+            max_workers: Worker processes, defaults to the CPU count (max 4)
+            css_style: CSS string applied to every PDF
+            css_path: File to read the CSS from instead of `css_style`
+            output_dir: Directory to save to, defaults to ./files
+        """
+        if css_path:
+            with open(css_path, encoding="utf-8") as f:
+                css_style = f.read()
+        self.output_dir = output_dir
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            # Forking a process that runs an event loop and threads is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(css_style,),
+        )
+        self._started: asyncio.Future | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def start(self) -> asyncio.Future:
+        """
+        Start every worker process without waiting for them; called again,
+        it returns the first call's future.
+
+        Returns:
+            A future that resolves once all workers are up
+        """
+        if self._started is None:
+            loop = asyncio.get_running_loop()
+            self._started = asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, _ready)
+                    for _ in range(self.max_workers)
+                )
+            )
+        return self._started
+
+    async def close(self) -> None:
+        """Wait for submitted documents and stop the workers."""
+        if self._started is not None:
+            # Startup failures surface on the documents themselves
+            await asyncio.gather(self._started, return_exceptions=True)
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    async def render(
+        self, result: ResumeTailorResult, base_filename: str | None = None
+    ) -> RenderedDocument:
+        """
+        Save one tailored resume as Markdown and PDF.
+
+        Args:
+            result: ResumeTailorResult object containing tailored resume and company name
+            base_filename: Optional output file name without extension, defaults to
+                tailored_resume_<company_name>
+
+        Returns:
+            Paths and timings of the saved files, with `error` set on failure
+        """
+        md_output_path, pdf_output_path = resume_output_paths(
+            result, base_filename, self.output_dir
+        )
+        document = RenderedDocument(
+            base_filename=base_filename,
+            markdown_path=md_output_path,
+            pdf_path=pdf_output_path,
+        )
+        start = time.perf_counter()
+        # Spin up the other workers too, so the next documents find them ready
+        self.start()
+        try:
+            document.render_seconds = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                _render_in_worker,
+                build_resume_markdown(result),
+                md_output_path,
+                pdf_output_path,
+            )
+        except Exception as e:
+            document.error = str(e)
+        document.wall_seconds = time.perf_counter() - start
+        return document
+
+    async def render_many(
+        self, items: Iterable[tuple[ResumeTailorResult, str | None]]
+    ) -> AsyncIterator[RenderedDocument]:
+        """
+        Save many tailored resumes in parallel.
+
+        Args:
+            items: (result, base_filename) pairs
+
+        Yields:
+            One RenderedDocument per item, in completion order
+        """
+        tasks = [
+            asyncio.ensure_future(self.render(result, base_filename))
+            for result, base_filename in items
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,133 @@
+import json
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import lru_cache
+from string import Template
+
+from models.agents.output import CV, WorkExperience
+from utils.text import content_hash
+
+# One template per resume section, compiled once at import
+HEADER = Template("# ${full_name}\n${contact_info}\n")
+SUMMARY = Template("## Professional Summary\n${summary}\n\n")
+SKILLS = Template("## Skills\n${items}")
+PROJECTS = Template("\n## Projects\n${items}")
+EXPERIENCE = Template("\n## Work Experience\n${roles}")
+ROLE = Template("### ${role} at ${company} (${dates})\n\n${highlights}\n")
+EDUCATION = Template("## Education\n${items}")
+CERTIFICATIONS = Template("\n## Certifications\n${items}")
+PUBLICATIONS = Template("\n## Publications\n${items}")
+
+
+def _bullets(items: list[str] | tuple[str, ...]) -> str:
+    return "".join(f"- {item}\n" for item in items)
+
+
+@lru_cache(maxsize=1024)
+def _render_role_cached(
+    role: str, company: str, dates: str, highlights: tuple[str, ...]
+) -> str:
+    return ROLE.substitute(
+        role=role, company=company, dates=dates, highlights=_bullets(highlights)
+    )
+
+
+def _render_role(role: WorkExperience) -> str:
+    # Roles are cached on their own too, so editing one role of a long
+    # experience section doesn't re-render the others
+    return _render_role_cached(
+        role.role, role.company, role.dates, tuple(role.highlights)
+    )
+
+
+def _render_header(cv: CV) -> str:
+    contact_info = f"{cv.contact_info}\n" if cv.contact_info else ""
+    return HEADER.substitute(full_name=cv.full_name, contact_info=contact_info)
+
+
+def _optional(template: Template, items: list[str], item_format: str) -> str:
+    if not items:
+        return ""
+    return template.substitute(
+        items="".join(item_format.format(item) for item in items)
+    )
+
+
+# Section name -> (fields it depends on, render function), in document order
+SECTIONS: dict[str, tuple[tuple[str, ...], Callable[[CV], str]]] = {
+    "header": (("full_name", "contact_info"), _render_header),
+    "summary": (("summary",), lambda cv: SUMMARY.substitute(summary=cv.summary)),
+    "skills": (("skills",), lambda cv: SKILLS.substitute(items=_bullets(cv.skills))),
+    "projects": (
+        ("projects",),
+        lambda cv: _optional(PROJECTS, cv.projects, "{}\n\n"),
+    ),
+    "experience": (
+        ("experience",),
+        lambda cv: EXPERIENCE.substitute(
+            roles="".join(_render_role(role) for role in cv.experience)
+        ),
+    ),
+    "education": (
+        ("education",),
+        lambda cv: EDUCATION.substitute(items=_bullets(cv.education)),
+    ),
+    "certifications": (
+        ("certifications",),
+        lambda cv: _optional(CERTIFICATIONS, cv.certifications, "- {}\n"),
+    ),
+    "publications": (
+        ("publications",),
+        lambda cv: _optional(PUBLICATIONS, cv.publications, "- {}\n"),
+    ),
+}
+
+
+class ResumeRenderer:
+    """
+    Renders a CV model to Markdown section by section.
+
+    Rendered sections are cached by a hash of the fields they depend on, so
+    rendering a variant that differs from an earlier one in a few sections
+    only re-renders those sections.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._sections: OrderedDict[str, str] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.last_changed: list[str] = []
+
+    def render(self, cv: CV) -> str:
+        """
+        Render the full resume.
+
+        Args:
+            cv: The resume to render
+
+        Returns:
+            The resume as Markdown text
+        """
+        self.last_changed = []
+        return "".join(self.render_section(name, cv) for name in SECTIONS)
+
+    def render_section(self, name: str, cv: CV) -> str:
+        """Render one section, from cache when its fields haven't changed."""
+        fields, render = SECTIONS[name]
+        data = cv.model_dump(mode="json", include=set(fields))
+        key = content_hash(name, json.dumps(data, sort_keys=True))
+
+        cached = self._sections.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._sections.move_to_end(key)
+            return cached
+
+        self.misses += 1
+        self.last_changed.append(name)
+        rendered = render(cv)
+        self._sections[key] = rendered
+        if len(self._sections) > self.max_entries:
+            self._sections.popitem(last=False)
+        return rendered
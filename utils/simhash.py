@@ -0,0 +1,227 @@
+import hashlib
+import json
+import os
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+
+from utils.text import tokenize
+
+FINGERPRINT_BITS = 64
+# Features are runs of this many words, so reordering counts as a change
+SHINGLE_SIZE = 3
+
+
+def simhash(text: str, shingle_size: int = SHINGLE_SIZE) -> int:
+    """
+    64-bit SimHash fingerprint of a text: texts that differ in a few words
+    get fingerprints that differ in a few bits.
+
+    Args:
+        text: The text, e.g. a normalized job posting
+        shingle_size: Words per feature
+
+    Returns:
+        The fingerprint as an int
+    """
+    tokens = tokenize(text, drop_stopwords=True)
+    features = Counter(
+        " ".join(tokens[i : i + shingle_size])
+        for i in range(max(1, len(tokens) - shingle_size + 1))
+    )
+    weights = [0] * FINGERPRINT_BITS
+    for feature, count in features.items():
+        digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+        bits = int.from_bytes(digest, "big")
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if bits >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class SimHashIndex:
+    """
+    Finds the indexed fingerprints closest to a query, within `max_distance`
+    differing bits, without scanning the whole index.
+
+    Fingerprints are split into `bands` bit ranges and bucketed by each
+    band's value. Two fingerprints at most `bands - 1` bits apart agree on
+    at least one whole band, so only the fingerprints sharing a bucket with
+    the query are compared. Entries are appended to a JSON-lines file, read
+    on first use; removals are appended as tombstones, and the file is
+    rewritten once they outnumber the live entries.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        bands: int = 5,
+        max_distance: int = 4,
+        max_entries: int | None = None,
+    ):
+        """
+        Args:
+            path: File the index is kept in, None for an in-memory index
+            bands: Number of bit ranges fingerprints are bucketed by
+            max_distance: Most differing bits a match may have
+            max_entries: Entries kept, the oldest are removed beyond it;
+                None for no limit
+
+        Raises:
+            ValueError: If `max_distance` isn't below `bands`, in which
+                case matches could be missed
+        """
+        if max_distance >= bands:
+            raise ValueError(
+                f"max_distance ({max_distance}) must be below bands ({bands})"
+            )
+        self.path = path
+        self.bands = bands
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._band_bits = FINGERPRINT_BITS // bands
+        self._loaded = path is None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._buckets: list[defaultdict[int, list[int]]] = [
+            defaultdict(list) for _ in range(self.bands)
+        ]
+        self._fingerprints: list[int] = []
+        # None for removed entries, whose ids stay in the buckets until compacted
+        self._keys: list[str | None] = []
+        self._ids: dict[str, int] = {}
+        self._tombstones = 0
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._ids)
+
+    def _band_values(self, fingerprint: int) -> list[int]:
+        mask = (1 << self._band_bits) - 1
+        return [
+            fingerprint >> (band * self._band_bits) & mask for band in range(self.bands)
+        ]
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+                if entry.get("removed"):
+                    self._delete(str(entry["key"]))
+                    self._tombstones += 1
+                else:
+                    self._insert(int(entry["fingerprint"]), str(entry["key"]))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                # A line cut short by a crash mid-write
+                continue
+
+    def _insert(self, fingerprint: int, key: str) -> bool:
+        if key in self._ids:
+            return False
+        entry_id = len(self._keys)
+        self._ids[key] = entry_id
+        self._keys.append(key)
+        self._fingerprints.append(fingerprint)
+        for band, value in enumerate(self._band_values(fingerprint)):
+            self._buckets[band][value].append(entry_id)
+        return True
+
+    def _delete(self, key: str) -> bool:
+        entry_id = self._ids.pop(key, None)
+        if entry_id is None:
+            return False
+        self._keys[entry_id] = None
+        return True
+
+    def _append(self, entries: list[dict]) -> None:
+        if self.path is None or not entries:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+
+    def add(self, fingerprint: int, key: str) -> None:
+        """
+        Index `key` under `fingerprint`; keys already indexed are ignored.
+        Beyond `max_entries`, the oldest entries are removed.
+        """
+        self._load()
+        if not self._insert(fingerprint, key):
+            return
+        self._append([{"fingerprint": fingerprint, "key": key}])
+        if self.max_entries is not None and len(self._ids) > self.max_entries:
+            # Ids grow with insertion order, so the smallest are the oldest
+            oldest = sorted(self._ids.values())[: len(self._ids) - self.max_entries]
+            self._remove_keys([self._keys[entry_id] for entry_id in oldest])
+
+    def remove(self, key: str) -> None:
+        """Drop `key` from the index, e.g. once what it points to is gone."""
+        self._load()
+        self._remove_keys([key])
+
+    def _remove_keys(self, keys: list[str]) -> None:
+        removed = [key for key in keys if self._delete(key)]
+        self._tombstones += len(removed)
+        self._append([{"key": key, "removed": True} for key in removed])
+        if self._tombstones > len(self._ids):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Rebuild the index and its file from the live entries only."""
+        live = [
+            (fingerprint, key)
+            for fingerprint, key in zip(self._fingerprints, self._keys)
+            if key is not None
+        ]
+        self._reset()
+        for fingerprint, key in live:
+            self._insert(fingerprint, key)
+        if self.path is None:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Write to a temp file first so readers never see a partial index
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(
+                json.dumps({"fingerprint": fingerprint, "key": key}) + "\n"
+                for fingerprint, key in live
+            )
+        os.replace(tmp_path, self.path)
+
+    def find(self, fingerprint: int) -> Iterator[tuple[str, int]]:
+        """
+        The indexed keys within `max_distance`, closest first, so a caller
+        can fall through to the next one when a match is unusable.
+
+        Yields:
+            (key, differing bits)
+        """
+        self._load()
+        matches: list[tuple[int, int]] = []
+        seen: set[int] = set()
+        for band, value in enumerate(self._band_values(fingerprint)):
+            for entry_id in self._buckets[band].get(value, ()):
+                if entry_id in seen or self._keys[entry_id] is None:
+                    continue
+                seen.add(entry_id)
+                distance = hamming_distance(fingerprint, self._fingerprints[entry_id])
+                if distance <= self.max_distance:
+                    matches.append((distance, entry_id))
+        # Keys, not ids: removals while the caller iterates may compact
+        # the index and renumber its entries
+        for distance, key in sorted(
+            (distance, self._keys[entry_id]) for distance, entry_id in matches
+        ):
+            if key in self._ids:
+                yield key, distance
@@ -0,0 +1,78 @@
+import hashlib
+import math
+import re
+
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so cosmetic edits (line endings, trailing spaces, extra
+    blank lines) don't change its content hash.
+
+    Args:
+        text: Raw text, e.g. a Markdown resume or job posting
+
+    Returns:
+        The normalized text
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [line.rstrip() for line in text.split("\n")]
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(lines)).strip()
+
+
+def content_hash(*parts: str) -> str:
+    """
+    Build a stable SHA-256 hex digest from one or more text parts.
+
+    Args:
+        parts: Text parts to hash, order matters
+
+    Returns:
+        Hex digest identifying the combined content
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        # Separator so ("ab", "c") and ("a", "bc") hash differently
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+# Keeps tech tokens intact: "c++", "c#", "node.js", "ci/cd", "gpt-4"
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9+#]")
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "been", "by", "for", "from",
+    "has", "have", "in", "into", "is", "it", "its", "of", "on", "or", "our",
+    "over", "that", "the", "their", "this", "to", "was", "were", "will", "with",
+    "within", "without", "you", "your", "we", "i", "my", "me", "using", "used",
+    "use", "via", "per", "across", "through", "while", "who", "which", "what",
+})  # fmt: skip
+
+
+def tokenize(text: str, drop_stopwords: bool = False) -> list[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+        drop_stopwords: Whether to drop common English filler words
+
+    Returns:
+        Tokens in the order they appear
+    """
+    tokens = _TOKEN_RE.findall(text.casefold())
+    if drop_stopwords:
+        return [token for token in tokens if token not in STOPWORDS]
+    return tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Uses the common ~4 characters per token rule of thumb for English and
+    JSON, which is close enough to track prompt size trends.
+    """
+    return max(1, math.ceil(len(text) / 4)) if text else 0
@@ -1,293 +1,1041 @@
-import sys
-from pydantic_ai import AgentRunResult
-
+import asyncio
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Literal
+
+from models.agents.deps import JobContentDeps
+from models.agents.output import (
+    CV,
+    AuditIssue,
+    AuditResult,
+    CVFragment,
+    CVPatch,
+    JobAnalysis,
+    ReviewResult,
+    TailoredHighlights,
+    TailoredSkills,
+    TailoredSummary,
+    WorkExperience,
+)
+from models.workflow import (
+    KeywordCoverage,
+    ResumeTailorBatchResult,
+    ResumeTailorResult,
+)
+from utils.cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_ENTRIES, DiskCache, SingleFlight
+from utils.files import read_text_file
+from utils.paths import is_url
+from utils.simhash import FINGERPRINT_BITS, SimHashIndex, simhash
+from utils.text import content_hash, estimate_tokens, normalize_text, tokenize
+from workflows import prompts
 from workflows.agents import (
-    analyst_agent,
-    writer_agent,
-    auditor_agent,
-    resume_parser_agent,
-    reviewer_agent,
+    ANALYST_SYSTEM_PROMPT,
+    AUDITOR_SYSTEM_PROMPT,
+    RESUME_PARSER_SYSTEM_PROMPT,
+    REVIEWER_SYSTEM_PROMPT,
+    WRITER_SYSTEM_PROMPT,
+    cascade_model_name,
+    get_agent,
+    get_model,
+    model_name,
+)
+from workflows.cv_patch import PatchError, apply_cv_patch
+from workflows.events import (
+    AuditVerdict,
+    CacheHit,
+    CascadeVerdict,
+    CheckpointReplayed,
+    Message,
+    PostingNormalized,
+    ReviewScored,
+    RunFinished,
+    StageFinished,
+    StageStarted,
+    WorkflowEvent,
+    WriterPartial,
+    event_source,
+)
+from workflows.instrumentation import Instrumentation
+from workflows.journal import RunJournal
+from workflows.keyword_coverage import coverage_to_review, score_keyword_coverage
+from workflows.policy import (
+    CallPolicy,
+    IncompleteOutputError,
+    StageFailedError,
+    WorkflowError,
+)
+from workflows.posting_normalizer import MAX_POSTING_TOKENS, normalize_posting
+from workflows.pre_audit import match_experience, pre_audit_cv
+from workflows.relevance import PrunedCV, prune_cv, restore_pruned
+from workflows.resume_sections import merge_cv_fragments, resume_parse_units
+from workflows.scheduler import Stage, StageScheduler
+from workflows.section_writer import (
+    assemble_cv,
+    find_repeated_phrasing,
+    reorder_skills,
 )
-from models.agents.output import JobAnalysis, CV
-from models.workflow import ResumeTailorResult
+from workflows.targeted_retry import (
+    FACT_SECTIONS,
+    issue_sections,
+    section_values,
+)
+
+if TYPE_CHECKING:
+    from pydantic_ai import AgentRunResult
+
+    from tools.browser_pool import BrowserPool
 
 
 class ResumeTailorWorkflow:
-    MAX_RETRIES = 3
     max_review_iterations = 3
     max_write_attempts = 3
+    # Local keyword-coverage scores (0-10) at or above the pass score, or
+    # below the fail score, decide the review without calling the reviewer
+    local_review_pass_score = 8.5
+    local_review_fail_score = 5.0
+    # Stop refining once a refinement gains less coverage than this
+    min_coverage_gain = 0.25
+    # Stream partial writer output to subscribers as WriterPartial events
+    stream_writer_output = True
+    # Parse resumes heading by heading, caching each section, so an edited
+    # resume only sends its changed sections to the parser
+    incremental_resume_parsing = True
+    # "sections" writes the summary, skills order and each role as
+    # concurrent agent calls on the first attempt, instead of one call
+    # for the whole CV
+    writing_mode: Literal["whole", "sections"] = "whole"
+    # "patch" has the writer return targeted edits to the draft for review
+    # feedback, applied and validated locally, instead of a whole new CV
+    refinement_mode: Literal["rewrite", "patch"] = "rewrite"
+    # After a failed audit, regenerate and re-audit only the sections the
+    # audit issues point at, keeping the rest of the draft as it passed
+    targeted_retries = True
+    # Strip boilerplate, repeated lines and excess length from postings
+    # before analysis, cutting the analyst's input tokens
+    normalize_postings = True
+    max_posting_tokens = MAX_POSTING_TOKENS
+    # A posting at most this many SimHash bits (of 64) from one analyzed
+    # before reuses its analysis; reposts with a few words changed are 1-4
+    # bits apart, different roles 15 or more
+    near_duplicate_max_distance = 4
+    # Leave the bullets, projects and skills least relevant to the job (by
+    # BM25) out of the writer prompt, and restore them verbatim afterwards
+    prune_writer_input = True
+    # Reuse the passing CV tailored before for the same resume and analysis
+    reuse_tailored_results = True
+    # With a cascade model configured (workflows.agents.configure_models),
+    # the auditor's and reviewer's cheap verdicts stand only when clear-cut:
+    # a passing audit with hallucination and AI cliché scores both at or
+    # below the pass scores, a failing one with either at or above the fail
+    # scores, and likewise for review quality scores. Anything in between
+    # is asked again of the strong model.
+    cascade_audit_pass_score = 0
+    cascade_audit_fail_score = 5
+    cascade_audit_pass_cliche_score = 1
+    cascade_audit_fail_cliche_score = 6
+    cascade_review_pass_score = 9
+    cascade_review_fail_score = 5
+    min_resume_sections = 3
+    max_section_parses = 8
+
+    def __init__(
+        self,
+        use_cache: bool = True,
+        cache_dir: str | None = None,
+        instrumentation: Instrumentation | None = None,
+        policy: CallPolicy | None = None,
+        journal: RunJournal | None = None,
+        browser_pool: "BrowserPool | None" = None,
+    ):
+        self.resume_cache = DiskCache("resume_parser", cache_dir) if use_cache else None
+        self.resume_section_cache = (
+            DiskCache("resume_sections", cache_dir) if use_cache else None
+        )
+        self.job_analysis_cache = (
+            DiskCache("job_analysis", cache_dir) if use_cache else None
+        )
+        # Fingerprints of analyzed postings; one index per analyst prompt
+        # and model, like the analysis cache keys it points to, and no
+        # bigger than that cache
+        self.posting_index = (
+            SimHashIndex(
+                os.path.join(
+                    cache_dir or DEFAULT_CACHE_DIR,
+                    "near_duplicates",
+                    f"{content_hash(ANALYST_SYSTEM_PROMPT, model_name('analyst'))[:16]}.jsonl",
+                ),
+                max_distance=self.near_duplicate_max_distance,
+                max_entries=DEFAULT_MAX_ENTRIES,
+            )
+            if use_cache
+            else None
+        )
+        self.tailored_result_cache = (
+            DiskCache("tailored_results", cache_dir) if use_cache else None
+        )
+        self.instrumentation = instrumentation or Instrumentation()
+        self.policy = policy or CallPolicy()
+        # Checkpoints every agent output; None runs without a journal
+        self.journal = journal
+        # Fetches job postings given as URLs; None accepts files only
+        self.browser_pool = browser_pool
+        # Concurrent runs of this workflow on the same posting wait for one
+        # analysis instead of each starting their own
+        self._job_analysis_flights = SingleFlight()
+        self._subscribers: list[Callable[[WorkflowEvent], None]] = []
+
+    def subscribe(
+        self, callback: Callable[[WorkflowEvent], None]
+    ) -> Callable[[], None]:
+        """
+        Call `callback` with every event this workflow emits.
+
+        Returns:
+            A function that removes the subscription
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def _emit(self, event: WorkflowEvent) -> None:
+        for callback in list(self._subscribers):
+            callback(event)
+
+    def _say(self, text: str) -> None:
+        self._emit(Message(text=text))
+
+    def _report_prompt(self, name: str, prompt: str) -> int:
+        tokens = estimate_tokens(prompt)
+        self._say(f"   [Debug] {name} prompt: ~{tokens} tokens")
+        return tokens
+
+    def _emit_audit_verdict(
+        self,
+        audit: AuditResult,
+        write_attempt: int,
+        source: Literal["pre_audit", "llm"],
+    ) -> None:
+        self._emit(
+            AuditVerdict(
+                attempt=write_attempt + 1,
+                passed=audit.passed,
+                hallucination_score=audit.hallucination_score,
+                ai_cliche_score=audit.ai_cliche_score,
+                issue_count=len(audit.issues),
+                source_of_verdict=source,
+            )
+        )
 
-    def __init__(self):
-        pass
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Emit start/finish events around a block of work."""
+        self._emit(StageStarted(stage=name))
+        start = time.perf_counter()
+        error: str | None = None
+        try:
+            yield
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            self._emit(
+                StageFinished(
+                    stage=name, seconds=time.perf_counter() - start, error=error
+                )
+            )
 
-    async def run(
-        self, resume_text: str, job_content_file_path: str
-    ) -> ResumeTailorResult:
-        print("🚀 STARTING MULTI-AGENT PIPELINE\n")
+    def _staged(
+        self, name: str, fn: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        async def staged(**kwargs: Any) -> Any:
+            with self._stage(name):
+                return await fn(**kwargs)
+
+        return staged
+
+    def _report_retry(
+        self, agent_name: str, attempt: int, delay: float, error: BaseException
+    ) -> None:
+        self._say(
+            f"⚠️ {agent_name} attempt {attempt}/{self.policy.config.max_attempts} "
+            f"failed ({error!r}), retrying in {delay:.1f}s..."
+        )
 
-        # --- STEP 0: PARSE ORIGINAL RESUME ---
-        print("🤖 Agent 0 (Parser): Parsing original resume...")
-        original_cv_result: AgentRunResult[CV] | None = None
-        for attempt in range(self.MAX_RETRIES):
-            try:
-                original_cv_result = await resume_parser_agent.run(
-                    f"Parse this resume into structured format:\n\n{resume_text}"
+    async def _run_agent(
+        self,
+        stage: str,
+        agent_name: str,
+        prompt: str,
+        check: Callable[[Any], str | None] | None = None,
+        model: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run the agent called `agent_name` through the call policy, with the
+        time, token usage, retries and cost of every attempt recorded, and
+        return its output. Outputs are checkpointed to the run journal, and
+        replayed from it when a resumed run makes the same call again.
+
+        Args:
+            check: Returns what's wrong with an output that is valid but
+                unusable, or None; such outputs are retried like failures
+            model: Model name to run the agent on instead of its own
+
+        Raises:
+            WorkflowError: If the call failed after the policy's retries
+        """
+        agent = get_agent(agent_name)
+        estimated_tokens = estimate_tokens(prompt)
+        if model is not None:
+            kwargs["model"] = get_model(model)
+
+        async def attempt() -> "AgentRunResult":
+            with self.instrumentation.agent_call(
+                stage, agent_name, model or model_name(agent_name)
+            ) as record:
+                result = await agent.run(prompt, **kwargs)
+                self.instrumentation.add_usage(
+                    record, result.usage(), result.new_messages()
                 )
+            self.policy.settle_tokens(estimated_tokens, result.usage().total_tokens)
+            if check and (problem := check(result.output)):
+                raise IncompleteOutputError(problem)
+            return result
+
+        async def call() -> Any:
+            result = await self.policy.call(
+                agent_name, attempt, estimated_tokens, on_retry=self._report_retry
+            )
+            return result.output
+
+        return await self._checkpointed(
+            stage,
+            # Another model's output is a different checkpoint
+            agent_name if model is None else f"{agent_name}@{model}",
+            prompt,
+            kwargs.get("output_type", agent.output_type),
+            call,
+        )
 
-                if original_cv_result.output is None:
-                    raise ValueError("Resume parsing returned None")
-
-                if (
-                    original_cv_result.output.full_name
-                    and original_cv_result.output.experience
-                ):
-                    break  # Success
+    async def _judge(
+        self,
+        stage: str,
+        agent_name: str,
+        prompt: str,
+        clear_cut: Callable[[Any], tuple[int | None, bool]],
+    ) -> Any:
+        """
+        Run the auditor or reviewer cheap-first: with a cascade model
+        configured it judges first, and the agent's own model is only
+        called when that verdict isn't clear-cut.
+
+        Args:
+            clear_cut: The verdict's score and whether it stands as is
+        """
+        cheap_model = cascade_model_name(agent_name)
+        if cheap_model is None:
+            return await self._run_agent(stage, agent_name, prompt)
+
+        verdict = await self._run_agent(stage, agent_name, prompt, model=cheap_model)
+        score, settled = (None, False) if verdict is None else clear_cut(verdict)
+        self.instrumentation.count_cascade(agent_name, escalated=not settled)
+        self._emit(
+            CascadeVerdict(
+                agent=agent_name,
+                cheap_model=cheap_model,
+                score=score,
+                escalated=not settled,
+            )
+        )
+        if settled:
+            self._say(f"   ⚡ {cheap_model} verdict is clear-cut (score {score})")
+            return verdict
+        self._say(
+            f"   ⤴️ {cheap_model} verdict is borderline (score {score}), "
+            f"asking {model_name(agent_name)}"
+        )
+        return await self._run_agent(stage, agent_name, prompt)
+
+    def _audit_is_clear_cut(self, audit: AuditResult) -> tuple[int | None, bool]:
+        score = audit.hallucination_score
+        if audit.passed:
+            return score, (
+                score <= self.cascade_audit_pass_score
+                and audit.ai_cliche_score <= self.cascade_audit_pass_cliche_score
+            )
+        return score, (
+            score >= self.cascade_audit_fail_score
+            or audit.ai_cliche_score >= self.cascade_audit_fail_cliche_score
+        )
 
-                print(
-                    f"⚠️ Attempt {attempt + 1}/{self.MAX_RETRIES}: Incomplete resume parse, retrying..."
+    def _review_is_clear_cut(self, review: ReviewResult) -> tuple[int | None, bool]:
+        score = review.quality_score
+        if review.needs_improvement:
+            return score, score <= self.cascade_review_fail_score
+        return score, score >= self.cascade_review_pass_score
+
+    async def _checkpointed(
+        self,
+        stage: str,
+        agent_name: str,
+        prompt: str,
+        output_type: Any,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Replay an agent call from the run journal, or make it and record it."""
+        if self.journal is None:
+            return await call()
+        key = self.journal.call_key(stage, agent_name, prompt)
+        output = self.journal.get(key, output_type)
+        if output is not None:
+            self._emit(CheckpointReplayed(stage=stage, agent=agent_name))
+            self._say(
+                f"   ⏩ Replayed {agent_name} output from run {self.journal.run_id}"
+            )
+            return output
+        output = await call()
+        self.journal.record(key, stage, agent_name, output)
+        return output
+
+    async def _run_writer(self, stage: str, prompt: str) -> CV | None:
+        """
+        Run the writer agent, streaming partial CVs to subscribers while it
+        generates.
+        """
+        if not (self.stream_writer_output and self._subscribers):
+            return await self._run_agent(stage, "writer", prompt)
+
+        estimated_tokens = estimate_tokens(prompt)
+
+        async def attempt() -> CV | None:
+            with self.instrumentation.agent_call(
+                stage, "writer", model_name("writer")
+            ) as record:
+                async with get_agent("writer").run_stream(prompt) as streamed:
+                    async for partial_cv in streamed.stream_output(debounce_by=0.2):
+                        self._emit(WriterPartial(cv=partial_cv))
+                    output = await streamed.get_output()
+                self.instrumentation.add_usage(
+                    record, streamed.usage(), streamed.new_messages()
                 )
+            self.policy.settle_tokens(estimated_tokens, streamed.usage().total_tokens)
+            return output
 
-            except Exception as e:
-                print(f"⚠️ Attempt {attempt + 1}/{self.MAX_RETRIES} failed: {e}")
-                if attempt == self.MAX_RETRIES - 1:
-                    sys.exit("❌ Failed to parse original resume after retries.")
-
-        if original_cv_result is None or original_cv_result.output is None:
-            sys.exit("❌ Failed to parse original resume after retries.")
+        async def call() -> CV | None:
+            return await self.policy.call(
+                "writer", attempt, estimated_tokens, on_retry=self._report_retry
+            )
 
-        original_cv = original_cv_result.output
-        print(f"   ✅ Resume Parsed: {original_cv.full_name}")
-        print(
-            f"   📋 Found {len(original_cv.skills)} skills, {len(original_cv.experience)} work experiences\n"
+        return await self._checkpointed(stage, "writer", prompt, CV, call)
+
+    async def _write_section(self, prompt: str, output_type: type) -> Any:
+        return await self._run_agent("write", "writer", prompt, output_type=output_type)
+
+    async def _write_sections(
+        self, original_cv: CV, job_analysis: JobAnalysis
+    ) -> CV | None:
+        """
+        Write the CV section by section: the summary, the skills order and
+        every role are rewritten concurrently and assembled locally, then
+        roles that picked up phrasing used elsewhere are rewritten again.
+
+        Returns:
+            The assembled CV, or None if any section failed
+        """
+        roles = original_cv.experience
+        section_prompts = [
+            prompts.summary_prompt(original_cv, job_analysis),
+            prompts.skills_prompt(original_cv, job_analysis),
+            *(prompts.experience_prompt(role, job_analysis) for role in roles),
+        ]
+        self._say(
+            f"   [Debug] Writer: {len(section_prompts)} section prompts, "
+            f"largest ~{max(map(estimate_tokens, section_prompts))} tokens"
         )
 
-        # Store original CV as JSON for prompts
-        original_cv_json = original_cv.model_dump_json()
+        try:
+            summary, skills, *highlights = await asyncio.gather(
+                self._write_section(section_prompts[0], TailoredSummary),
+                self._write_section(section_prompts[1], TailoredSkills),
+                *(
+                    self._write_section(p, TailoredHighlights)
+                    for p in section_prompts[2:]
+                ),
+            )
+            new_cv = assemble_cv(
+                original_cv,
+                summary.summary,
+                skills.skills,
+                [h.highlights for h in highlights],
+            )
 
-        # --- STEP 1: ANALYZE JOB (Agent 1) ---
-        print("🤖 Agent 1 (Analyst): Reading job post...")
-        job_analysis_result: AgentRunResult[JobAnalysis] | None = None
-        for attempt in range(self.MAX_RETRIES):
+            # --- Consistency pass: repeated phrasing across roles ---
+            repeated = find_repeated_phrasing(new_cv, original_cv)
+            if repeated:
+                self._say(
+                    f"   🔁 Consistency pass: rephrasing {len(repeated)} role(s) with repeated wording"
+                )
+                rewrites = await asyncio.gather(
+                    *(
+                        self._write_section(
+                            prompts.experience_prompt(roles[i], job_analysis, avoid),
+                            TailoredHighlights,
+                        )
+                        for i, avoid in repeated.items()
+                    )
+                )
+                for i, rewrite in zip(repeated, rewrites):
+                    highlights[i] = rewrite
+                new_cv = assemble_cv(
+                    original_cv,
+                    summary.summary,
+                    skills.skills,
+                    [h.highlights for h in highlights],
+                )
+        except Exception as e:
+            self._say(f"   ⚠️ Section writing failed ({e}), writing the whole CV")
+            return None
+
+        self._emit(WriterPartial(cv=new_cv))
+        return new_cv
+
+    @staticmethod
+    def _keep_header(cv: CV, original_cv: CV) -> CV:
+        """
+        The draft with the original name and contact details: no agent is
+        asked to change them, and the LLM auditor doesn't see them.
+        """
+        cv.full_name = original_cv.full_name
+        cv.contact_info = original_cv.contact_info
+        return cv
+
+    async def _refine(
+        self,
+        cv: CV,
+        original_cv: CV,
+        job_analysis: JobAnalysis,
+        suggestions: list[str],
+    ) -> CV | None:
+        """
+        Apply reviewer suggestions to a draft: as validated local edits in
+        "patch" refinement mode, falling back to a full rewrite when the
+        edits can't be applied.
+        """
+        if self.refinement_mode == "patch":
+            patch_prompt = prompts.patch_prompt(
+                cv, original_cv, job_analysis, suggestions
+            )
+            self._report_prompt("Patch", patch_prompt)
+            patch = await self._run_agent(
+                "refine", "writer", patch_prompt, output_type=CVPatch
+            )
             try:
-                job_analysis_result = await analyst_agent.run(
-                    f"Analyze the job content located at this file path {job_content_file_path} and extract structured job data.",
+                refined_cv = apply_cv_patch(cv, patch)
+                self._say(f"   🩹 Applied {len(patch.edits)} edit(s)")
+                return refined_cv
+            except PatchError as e:
+                self._say(f"   ⚠️ Invalid edit ({e}), rewriting the CV instead")
+
+        improvement_prompt = prompts.improvement_prompt(
+            cv, original_cv, job_analysis, suggestions
+        )
+        self._report_prompt("Improvement", improvement_prompt)
+        return await self._run_writer("refine", improvement_prompt)
+
+    async def _retry_sections(
+        self,
+        cv: CV,
+        original_cv: CV,
+        job_analysis: JobAnalysis,
+        audit: AuditResult,
+        write_attempt: int,
+    ) -> tuple[CV, AuditResult | None] | None:
+        """
+        Retry a draft that failed the audit by regenerating only the sections
+        its issues point at, then re-audit those sections. The rest of the
+        draft passed and is kept as it is, so it isn't reviewed again.
+
+        A draft the LLM auditor failed is audited whole again when some of
+        its issues couldn't be located or no section was rewritten, so its
+        verdict is never overturned by the pre-audit alone.
+
+        Returns:
+            The new draft and its audit, or None when the issues can't all be
+            located or a section failed, and the whole CV should be rewritten
+        """
+        sections = issue_sections(audit, cv)
+        if sections is None:
+            return None
+
+        self._say(f"   🎯 Regenerating only the failed sections: {', '.join(sections)}")
+        with self._stage("write"):
+            regenerated = await self._regenerate_sections(
+                cv, original_cv, job_analysis, sections
+            )
+        if regenerated is None:
+            return None
+        self.instrumentation.count_write_attempt()
+        new_cv, rewritten = regenerated
+        self._emit(WriterPartial(cv=new_cv))
+        self._say(f"   ✅ CV Drafted. Summary: {new_cv.summary[:100]}...\n")
+
+        # The draft passed the pre-audit, so the auditor agent failed it
+        failed_by_llm = pre_audit_cv(original_cv, cv).passed
+        all_located = sum(map(len, sections.values())) == len(audit.issues)
+        if failed_by_llm and not (all_located and rewritten):
+            audit = await self._audit(original_cv, new_cv, job_analysis, write_attempt)
+        else:
+            audit = await self._audit_sections(
+                original_cv, new_cv, job_analysis, rewritten, write_attempt
+            )
+        return new_cv, audit
+
+    async def _regenerate_sections(
+        self,
+        cv: CV,
+        original_cv: CV,
+        job_analysis: JobAnalysis,
+        sections: dict[str, list[AuditIssue]],
+    ) -> tuple[CV, list[str]] | None:
+        """
+        Regenerate the given sections of a draft. The summary and roles are
+        rewritten concurrently by the writer with their issues, roles that
+        don't match an original role are dropped, skills are reordered back
+        to the original skills, and fact sections are restored from the
+        original.
+
+        Returns:
+            The new draft and the sections the writer rewrote, or None if a
+            section failed
+        """
+        new_cv = cv.model_copy(deep=True)
+        writes: dict[str, Awaitable[Any]] = {}
+        original_roles: dict[int, WorkExperience] = {}
+        dropped: list[int] = []
+
+        for section, issues in sections.items():
+            if section == "summary":
+                writes[section] = self._write_section(
+                    prompts.summary_prompt(original_cv, job_analysis, issues),
+                    TailoredSummary,
+                )
+            elif section == "skills":
+                new_cv.skills = reorder_skills(cv.skills, original_cv)
+            elif section == "header":
+                new_cv.full_name = original_cv.full_name
+                new_cv.contact_info = original_cv.contact_info
+            elif section in FACT_SECTIONS:
+                setattr(new_cv, section, list(getattr(original_cv, section)))
+            else:
+                index = int(section.removeprefix("experience[").rstrip("]"))
+                original_role = match_experience(
+                    cv.experience[index], original_cv.experience
+                )
+                if original_role is None:
+                    dropped.append(index)
+                    continue
+                original_roles[index] = original_role
+                writes[section] = self._write_section(
+                    prompts.experience_prompt(
+                        original_role, job_analysis, issues=issues
+                    ),
+                    TailoredHighlights,
                 )
 
-                print(f"   [Debug] Job Data: {job_analysis_result.output}")
-
-                if job_analysis_result.output is None:
-                    raise ValueError("Job analysis data is None")
+        try:
+            outputs = await asyncio.gather(*writes.values())
+        except Exception as e:
+            self._say(f"   ⚠️ Section rewrite failed ({e}), rewriting the whole CV")
+            return None
+
+        rewritten: list[str] = []
+        for section, output in zip(writes, outputs):
+            if section == "summary":
+                new_cv.summary = output.summary or original_cv.summary
+                rewritten.append(section)
+                continue
+            index = int(section.removeprefix("experience[").rstrip("]"))
+            role = original_roles[index]
+            new_cv.experience[index] = WorkExperience(
+                company=role.company,
+                role=role.role,
+                dates=role.dates,
+                highlights=output.highlights or role.highlights,
+            )
+            # Indexes as they will be once invented roles are dropped
+            shift = sum(dropped_index < index for dropped_index in dropped)
+            rewritten.append(f"experience[{index - shift}]")
+
+        for index in sorted(dropped, reverse=True):
+            del new_cv.experience[index]
+        if not new_cv.experience:
+            return None
+        return new_cv, rewritten
+
+    async def _audit_sections(
+        self,
+        original_cv: CV,
+        new_cv: CV,
+        job_analysis: JobAnalysis,
+        rewritten: list[str],
+        write_attempt: int,
+    ) -> AuditResult | None:
+        """
+        Audit a draft after a targeted retry: the whole draft is pre-audited
+        locally, but only the sections the writer rewrote go to the auditor.
+        With no rewritten sections the pre-audit is the verdict, since
+        everything else is original content or already passed.
+        """
+        self._say("🔎 Pre-Audit: Checking draft against the original CV...")
+        audit = pre_audit_cv(original_cv, new_cv)
+        if not audit.passed or not rewritten:
+            self._emit_audit_verdict(audit, write_attempt, "pre_audit")
+            if audit.passed:
+                self._say(
+                    "   ✅ Pre-audit passed, no rewritten sections left to audit\n"
+                )
+            else:
+                critical_count = sum(i.severity == "Critical" for i in audit.issues)
+                self._say(
+                    f"   ❌ Pre-audit rejected the draft with {critical_count} critical issue(s), skipping Agent 3"
+                )
+            return audit
 
-                if (
-                    job_analysis_result.output.job_title
-                    and job_analysis_result.output.company_name
-                ):
-                    break  # Success
+        self._say("   ✅ Pre-audit passed\n")
+        self._say(
+            f"🤖 Agent 3 (Auditor): Validating the rewritten sections ({', '.join(rewritten)})..."
+        )
+        audit_prompt = prompts.section_audit_prompt(
+            original_cv, section_values(new_cv, rewritten), job_analysis
+        )
+        self._report_prompt("Section audit", audit_prompt)
+        with self._stage("audit"):
+            audit = await self._judge(
+                "audit", "auditor", audit_prompt, self._audit_is_clear_cut
+            )
+        if audit is not None:
+            self._emit_audit_verdict(audit, write_attempt, "llm")
+        return audit
+
+    @staticmethod
+    def resume_cache_key(resume_text: str) -> str:
+        """Cache key for a parsed resume: its text, the parser prompt and model."""
+        return content_hash(
+            normalize_text(resume_text),
+            RESUME_PARSER_SYSTEM_PROMPT,
+            model_name("resume_parser"),
+        )
 
-                print(
-                    f"⚠️ Attempt {attempt + 1}/{self.MAX_RETRIES}: Incomplete job data, retrying..."
-                )
+    @staticmethod
+    def resume_section_cache_key(section_prompt: str) -> str:
+        """Cache key for one parsed resume section: its prompt (heading path and text), the parser prompt and model."""
+        return content_hash(
+            normalize_text(section_prompt),
+            RESUME_PARSER_SYSTEM_PROMPT,
+            model_name("resume_parser"),
+        )
 
-            except Exception as e:
-                print(f"⚠️ Attempt {attempt + 1}/{self.MAX_RETRIES} failed: {e}")
-                if attempt == self.MAX_RETRIES - 1:
-                    sys.exit("❌ Failed to get complete job analysis after retries.")
+    @staticmethod
+    def job_analysis_cache_key(job_content: str) -> str:
+        """Cache key for a job analysis: the posting text (not its path), the analyst prompt and model."""
+        return content_hash(
+            normalize_text(job_content), ANALYST_SYSTEM_PROMPT, model_name("analyst")
+        )
 
-        if job_analysis_result is None or job_analysis_result.output is None:
-            sys.exit("❌ Failed to get complete job analysis after retries.")
+    @staticmethod
+    def tailored_result_key(original_cv: CV, job_analysis: JobAnalysis) -> str:
+        """Cache key for a tailored CV: the parsed resume, the analysis, and the prompts and models that wrote and checked it."""
+        return content_hash(
+            original_cv.model_dump_json(),
+            job_analysis.model_dump_json(),
+            WRITER_SYSTEM_PROMPT,
+            REVIEWER_SYSTEM_PROMPT,
+            AUDITOR_SYSTEM_PROMPT,
+            model_name("writer"),
+            model_name("reviewer"),
+            model_name("auditor"),
+            # A cascade may let through verdicts the strong model wouldn't
+            cascade_model_name("reviewer") or "",
+            cascade_model_name("auditor") or "",
+        )
 
-        print(
-            f"   ✅ Job Analyzed: {job_analysis_result.output.job_title} at {job_analysis_result.output.company_name}"
+    async def run(
+        self, resume_text: str, job_content_file_path: str
+    ) -> ResumeTailorResult:
+        self._say("🚀 STARTING MULTI-AGENT PIPELINE\n")
+
+        stages = [
+            replace(stage, fn=self._staged(stage.name, stage.fn))
+            for stage in self.build_stages()
+        ]
+        values, timeline = await StageScheduler(stages).run(
+            {
+                "resume_text": resume_text,
+                "job_content_file_path": job_content_file_path,
+            }
         )
-        print(
-            f"   🎯 Keywords found: {job_analysis_result.output.keywords_to_target}\n"
+
+        result: ResumeTailorResult = values["result"]
+        result.timeline = timeline
+        self._say("\n" + timeline.format())
+        self._emit(RunFinished(result=result))
+        return result
+
+    async def stream(
+        self, resume_text: str, job_content_file_path: str
+    ) -> AsyncIterator[WorkflowEvent]:
+        """
+        Run the pipeline and yield its events as they happen.
+
+        The last event is RunFinished with the result. Closing the iterator
+        early (e.g. `break` in an `async for`) cancels the run.
+
+        Args:
+            resume_text: The original resume in Markdown
+            job_content_file_path: Path to the job posting file
+
+        Yields:
+            WorkflowEvent instances: progress messages, stage boundaries,
+            partial writer output, review scores and audit verdicts
+        """
+        queue: asyncio.Queue[WorkflowEvent | None] = asyncio.Queue()
+        unsubscribe = self.subscribe(queue.put_nowait)
+        task = asyncio.ensure_future(self.run(resume_text, job_content_file_path))
+        task.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (event := await queue.get()) is not None:
+                yield event
+            # Re-raise a failed run to the consumer
+            task.result()
+        finally:
+            unsubscribe()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def build_stages(self) -> list[Stage]:
+        """
+        The single-run pipeline as a DAG.
+
+        Parsing the resume (Step 0) and analyzing the job (Step 1) are
+        independent, so they run concurrently; tailoring waits for both.
+        """
+        return [
+            Stage(
+                "parse_resume",
+                self._get_original_cv,
+                inputs=("resume_text",),
+                outputs=("original_cv",),
+            ),
+            Stage(
+                "analyze_job",
+                self._get_job_analysis,
+                inputs=("job_content_file_path",),
+                outputs=("job_analysis",),
+            ),
+            Stage(
+                "tailor",
+                self._tailor,
+                inputs=("original_cv", "job_analysis"),
+                outputs=("result",),
+            ),
+        ]
+
+    async def run_many(
+        self,
+        resumes: list[str],
+        postings: list[str],
+        max_concurrency: int = 4,
+    ) -> AsyncIterator[ResumeTailorBatchResult]:
+        """
+        Tailor every resume against every job posting.
+
+        Each resume is parsed once and each posting analyzed once, then the
+        writer/reviewer/auditor loop fans out over all pairs with at most
+        `max_concurrency` pairs in flight. Results are yielded as soon as
+        each pair finishes.
+
+        Args:
+            resumes: Paths to Markdown resume files
+            postings: Paths to job posting files
+            max_concurrency: Maximum number of pairs tailored concurrently
+
+        Yields:
+            One ResumeTailorBatchResult per (resume, posting) pair
+        """
+        self._say(
+            f"🚀 STARTING BATCH: {len(resumes)} resume(s) × {len(postings)} posting(s)\n"
         )
 
-        # Prepare a JSON/string representation of the job data for prompts
-        job_data_json = job_analysis_result.output.model_dump_json()
+        async def parse(resume_path: str) -> CV:
+            event_source.set(os.path.basename(resume_path))
+            resume_text = await read_text_file(resume_path)
+            return await self._get_original_cv(resume_text)
+
+        async def analyze(posting_path: str) -> JobAnalysis:
+            event_source.set(os.path.basename(posting_path))
+            return await self._get_job_analysis(posting_path)
+
+        # One task per distinct input, awaited by every pair that needs it
+        cv_tasks = {path: asyncio.ensure_future(parse(path)) for path in resumes}
+        analysis_tasks = {
+            path: asyncio.ensure_future(analyze(path)) for path in postings
+        }
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def tailor_pair(
+            resume_path: str, posting_path: str
+        ) -> ResumeTailorBatchResult:
+            event_source.set(
+                f"{os.path.basename(resume_path)} × {os.path.basename(posting_path)}"
+            )
+            try:
+                original_cv = await cv_tasks[resume_path]
+                job_analysis = await analysis_tasks[posting_path]
+                async with semaphore:
+                    result = await self._tailor(original_cv, job_analysis)
+                return ResumeTailorBatchResult(
+                    resume_path=resume_path,
+                    job_content_file_path=posting_path,
+                    result=result,
+                )
+            except Exception as e:
+                return ResumeTailorBatchResult(
+                    resume_path=resume_path,
+                    job_content_file_path=posting_path,
+                    error=str(e),
+                )
+
+        pair_tasks = [
+            asyncio.ensure_future(tailor_pair(resume_path, posting_path))
+            for resume_path in resumes
+            for posting_path in postings
+        ]
+        try:
+            for next_done in asyncio.as_completed(pair_tasks):
+                yield await next_done
+        finally:
+            # The caller may stop iterating early, don't leave work running
+            tasks = [*pair_tasks, *cv_tasks.values(), *analysis_tasks.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _tailor(
+        self, original_cv: CV, job_analysis: JobAnalysis
+    ) -> ResumeTailorResult:
+        """
+        Tailor one parsed resume to one job, reusing the passing result of an
+        earlier run with the same resume and analysis. A near-duplicate
+        posting reuses the analysis, so its CV is reused too.
+        """
+        key = self.tailored_result_key(original_cv, job_analysis)
+        if self.tailored_result_cache and self.reuse_tailored_results:
+            cached_result = self.tailored_result_cache.get(key, ResumeTailorResult)
+            if cached_result is not None:
+                self._emit(CacheHit(stage="tailor"))
+                self._say(
+                    "♻️ Reusing the CV that passed the audit for this resume and job."
+                )
+                return cached_result
+
+        result = await self._write_and_audit(original_cv, job_analysis)
+        if result.passed and self.tailored_result_cache:
+            self.tailored_result_cache.set(key, result)
+        return result
+
+    def _prune_writer_input(
+        self, original_cv: CV, job_analysis: JobAnalysis
+    ) -> PrunedCV | None:
+        """The CV the writer sees, without its least relevant items, or None if nothing is left out."""
+        if not self.prune_writer_input:
+            return None
+        pruned = prune_cv(original_cv, job_analysis)
+        if not pruned.omitted_count:
+            return None
+        saved = estimate_tokens(prompts.compact_json(original_cv)) - estimate_tokens(
+            prompts.compact_json(pruned.cv)
+        )
+        self._say(
+            f"   ✂️ Left {pruned.omitted_count} less relevant item(s) out of the "
+            f"writer prompt (~{saved} tokens), restored after writing"
+        )
+        return pruned
 
+    async def _write_and_audit(
+        self, original_cv: CV, job_analysis: JobAnalysis
+    ) -> ResumeTailorResult:
+        """Run the writer/reviewer/auditor loop for one parsed resume and job."""
         # --- STEP 2: WRITE CV (Agent 2) with AUDIT LOOP ---
         new_cv = None
         audit = None
+        pruned = self._prune_writer_input(original_cv, job_analysis)
+        writer_cv = pruned.cv if pruned else original_cv
+        omitted = pruned.references() if pruned else None
 
         for write_attempt in range(self.max_write_attempts):
-            print(
+            self._say(
                 f"🤖 Agent 2 (Writer): Tailoring CV (Attempt {write_attempt + 1}/{self.max_write_attempts})..."
             )
-            if write_attempt == 0:
-                print(f"   [Debug] Original CV has {len(original_cv.skills)} skills")
-                writer_prompt = f"""
-Here is the Job Analysis:
-{job_data_json}
-
-Here is the Original CV (structured):
-{original_cv_json}
-
-Rewrite the CV to match the Job Analysis. Use ONLY the information from the Original CV.
-Rephrase and reorganize to highlight relevant experience, but do NOT add new skills or experiences.
-"""
-            else:
-                # Retry with audit feedback
-                print("   🔄 Retrying with audit feedback...")
-                issues_text = "\n".join(
-                    [
-                        f"- [{getattr(i, 'severity', 'Unknown')}] {getattr(i, 'issue', str(i))} -> {getattr(i, 'suggestion', '')}"
-                        for i in getattr(audit, "issues", [])
-                    ]
+            regenerated = None
+            if self.targeted_retries and new_cv is not None and audit is not None:
+                regenerated = await self._retry_sections(
+                    new_cv, original_cv, job_analysis, audit, write_attempt
                 )
-                writer_prompt = f"""
-The previous CV draft failed the audit. Here is the feedback:
-
-Audit Feedback: {getattr(audit, "feedback_summary", "")}
-
-Issues to fix:
-{issues_text}
-
-Here is the Job Analysis:
-{job_data_json}
-
-Here is the Original CV (structured):
-{original_cv_json}
-
-CRITICAL RULES:
-1. ONLY use skills and experience from the Original CV - DO NOT add new skills
-2. Fix all the issues mentioned in the audit feedback
-3. Ensure all job requirements are addressed using ONLY existing skills from the original CV
-4. Avoid AI clichés and use natural language
-5. You may rephrase existing content but cannot add new information
-
-Rewrite the CV to match the Job Analysis while addressing all audit feedback.
-"""
-
-            writer_result = await writer_agent.run(writer_prompt)
-
-            new_cv = writer_result.output or None
-            if new_cv is None:
-                if write_attempt == self.max_write_attempts - 1:
-                    return ResumeTailorResult(
-                        company_name="",
-                        tailored_resume="",
-                        audit_report={},
-                        passed=False,
+            if regenerated is not None:
+                new_cv, audit = regenerated
+            else:
+                if write_attempt == 0:
+                    self._say(
+                        f"   [Debug] Original CV has {len(original_cv.skills)} skills"
                     )
-                continue
-
-            print(f"   ✅ CV Drafted. Summary: {new_cv.summary[:100]}...\n")
-
-            # --- STEP 2.5: QUALITY REVIEW (Agent 2.5) ---
-            for review_iteration in range(self.max_review_iterations):
-                print(
-                    f"🤖 Agent 2.5 (Reviewer): Checking CV quality (Iteration {review_iteration + 1}/{self.max_review_iterations})..."
-                )
-
-                review_prompt = f"""
-Review this CV against job requirements:
-
-CV: {new_cv.model_dump_json() if hasattr(new_cv, "model_dump_json") else str(new_cv)}
-Job Analysis: {job_data_json}
-
-Assess quality and suggest improvements if needed.
-"""
-
-                try:
-                    review_result = await reviewer_agent.run(review_prompt)
-                    review = review_result.output
-
-                    if review is None:
-                        print("   ⚠️ Review returned None, skipping quality check\n")
-                        break
-
-                    print(f"   📊 Quality Score: {review.quality_score}/10")
-
-                    if review.strengths:
-                        print(f"   ✨ Strengths: {', '.join(review.strengths[:2])}")
-
-                    if (
-                        review.needs_improvement
-                        and review_iteration < self.max_review_iterations - 1
-                    ):
-                        print("   🔄 Quality improvements needed, refining...\n")
-
-                        # Prepare suggestions text
-                        suggestions_text = "\n".join(
-                            f"- {s}" for s in review.specific_suggestions
+                    writer_prompt = prompts.writer_prompt(
+                        writer_cv, job_analysis, omitted
+                    )
+                else:
+                    # Retry with audit feedback
+                    self._say("   🔄 Retrying with audit feedback...")
+                    writer_prompt = prompts.writer_retry_prompt(
+                        writer_cv, job_analysis, audit, omitted
+                    )
+                self.instrumentation.count_write_attempt()
+                with self._stage("write"):
+                    new_cv = None
+                    if write_attempt == 0 and self.writing_mode == "sections":
+                        new_cv = await self._write_sections(writer_cv, job_analysis)
+                    if new_cv is None:
+                        self._report_prompt("Writer", writer_prompt)
+                        new_cv = await self._run_writer("write", writer_prompt)
+                    if new_cv is not None:
+                        new_cv = self._keep_header(new_cv, original_cv)
+                    if new_cv is not None and pruned:
+                        new_cv = restore_pruned(new_cv, pruned)
+                if new_cv is None:
+                    if write_attempt == self.max_write_attempts - 1:
+                        return ResumeTailorResult(
+                            company_name="",
+                            tailored_resume="",
+                            audit_report={},
+                            passed=False,
                         )
+                    continue
 
-                        # Refine CV based on review
-                        improvement_prompt = f"""
-Improve this CV based on reviewer feedback:
-
-Current CV: {new_cv.model_dump_json() if hasattr(new_cv, "model_dump_json") else str(new_cv)}
-Original CV: {original_cv_json}
-Job Analysis: {job_data_json}
-
-Specific improvements to address:
-{suggestions_text}
-
-CRITICAL RULES:
-1. ONLY use information from the Original CV - DO NOT add new skills or experiences
-2. Apply the suggestions to improve quality and relevance
-3. Maintain accuracy and honesty
-4. Use natural language, avoid AI clichés
-5. Keep all dates and facts accurate
-
-Focus on better highlighting relevant experience and incorporating job keywords naturally.
-"""
-
-                        refined_result = await writer_agent.run(improvement_prompt)
-                        if refined_result.output:
-                            new_cv = refined_result.output
-                            print("   ✅ CV refined based on feedback\n")
-                        else:
-                            print("   ⚠️ Refinement returned None, keeping current CV\n")
-                            break
-                    else:
-                        if review.needs_improvement:
-                            print("   ℹ️ Max review iterations reached\n")
-                        else:
-                            print("   ✅ Quality check passed!\n")
-                        break
+                self._say(f"   ✅ CV Drafted. Summary: {new_cv.summary[:100]}...\n")
 
-                except Exception as e:
-                    print(f"   ⚠️ Review failed: {e}, continuing with current CV\n")
-                    break
+                new_cv = await self._review(new_cv, original_cv, job_analysis)
 
-            # For auditor prompt, prepare serializations
-            new_cv_json = (
-                new_cv.model_dump_json()
-                if hasattr(new_cv, "model_dump_json")
-                else str(new_cv)
-            )
+                audit = await self._audit(
+                    original_cv, new_cv, job_analysis, write_attempt
+                )
 
-            # --- STEP 3: AUDIT (Agent 3) ---
-            print("🤖 Agent 3 (Auditor): Validating for hallucinations and AI-speak...")
-            audit_prompt = f"""
-ORIGINAL CV (structured):
-{original_cv_json}
-
-NEW GENERATED CV (structured):
-{new_cv_json}
-
-JOB REQUIREMENTS:
-{job_data_json}
-
-Compare the two structured CVs carefully. Ensure that:
-1. No new skills appear in the new CV that weren't in the original
-2. No new companies or roles were invented
-3. All experiences in the new CV can be traced back to the original
-4. The language is professional and not AI-generated sounding
-5. The new CV properly targets the job requirements using only original information
-"""
-            audit_result = await auditor_agent.run(audit_prompt)
-
-            audit = audit_result.output
             if audit is None:
-                print(f"   ⚠️ Audit result is None on attempt {write_attempt + 1}")
+                self._say(f"   ⚠️ Audit result is None on attempt {write_attempt + 1}")
                 if write_attempt < self.max_write_attempts - 1:
-                    print("   🔄 Will retry...\n")
+                    self._say("   🔄 Will retry...\n")
                     continue
                 else:
-                    print("   ❌ Max attempts reached\n")
+                    self._say("   ❌ Max attempts reached\n")
                     # Return failure result
                     return ResumeTailorResult(
                         company_name="",
@@ -305,12 +1053,13 @@ Compare the two structured CVs carefully. Ensure that:
             # Check if audit passed
             passed = getattr(audit, "passed", False)
             if passed:
-                print(f"   ✅ Audit passed on attempt {write_attempt + 1}!\n")
+                self._say(f"   ✅ Audit passed on attempt {write_attempt + 1}!\n")
                 return ResumeTailorResult(
-                    company_name=job_analysis_result.output.company_name,
+                    company_name=job_analysis.company_name,
                     tailored_resume=new_cv.model_dump_json()
                     if new_cv and hasattr(new_cv, "model_dump_json")
                     else str(new_cv),
+                    tailored_cv=new_cv,
                     audit_report={
                         "passed": getattr(audit, "passed", None),
                         "hallucination_score": getattr(
@@ -330,22 +1079,22 @@ Compare the two structured CVs carefully. Ensure that:
                     passed=True,
                 )
             else:
-                print(f"   ⚠️ Audit failed on attempt {write_attempt + 1}")
+                self._say(f"   ⚠️ Audit failed on attempt {write_attempt + 1}")
                 if write_attempt < self.max_write_attempts - 1:
-                    print("   🔄 Will retry with feedback...\n")
+                    self._say("   🔄 Will retry with feedback...\n")
                 else:
-                    print("   ❌ Max attempts reached\n")
+                    self._say("   ❌ Max attempts reached\n")
 
         # --- REPORTING ---
-        print("\n" + "=" * 30)
-        print("📋 FINAL AUDIT REPORT")
-        print("=" * 30)
+        self._say("\n" + "=" * 30)
+        self._say("📋 FINAL AUDIT REPORT")
+        self._say("=" * 30)
 
         # Ensure audit has a value, provide defaults if it's somehow None
         if audit is None:
-            print("⚠️ Warning: No audit result available")
+            self._say("⚠️ Warning: No audit result available")
             return ResumeTailorResult(
-                company_name=job_analysis_result.output.company_name,
+                company_name=job_analysis.company_name,
                 tailored_resume="",
                 audit_report={
                     "passed": False,
@@ -362,28 +1111,29 @@ Compare the two structured CVs carefully. Ensure that:
         ai_cliche_score = getattr(audit, "ai_cliche_score", None)
         feedback_summary = getattr(audit, "feedback_summary", "")
 
-        print(f"Passed: {passed}")
-        print(f"Hallucination Score (0 is best): {hallucination_score}")
-        print(f"AI Cliche Score (0 is best): {ai_cliche_score}")
-        print(f"Feedback: {feedback_summary}")
+        self._say(f"Passed: {passed}")
+        self._say(f"Hallucination Score (0 is best): {hallucination_score}")
+        self._say(f"AI Cliche Score (0 is best): {ai_cliche_score}")
+        self._say(f"Feedback: {feedback_summary}")
 
         issues = getattr(audit, "issues", []) or []
         if issues:
-            print("\n⚠️ Issues Found:")
+            self._say("\n⚠️ Issues Found:")
             for i in issues:
                 sev = getattr(i, "severity", "Unknown")
                 issue_text = getattr(i, "issue", str(i))
                 suggestion = getattr(i, "suggestion", "")
-                print(f" - [{sev}] {issue_text} -> {suggestion}")
+                self._say(f" - [{sev}] {issue_text} -> {suggestion}")
 
         # Return final result (even if audit failed)
         return ResumeTailorResult(
-            company_name=job_analysis_result.output.company_name,
+            company_name=job_analysis.company_name,
             tailored_resume=new_cv.model_dump_json()
             if new_cv and hasattr(new_cv, "model_dump_json")
             else str(new_cv)
             if new_cv
             else "",
+            tailored_cv=new_cv,
             audit_report={
                 "passed": passed,
                 "hallucination_score": hallucination_score,
@@ -400,3 +1150,399 @@ Compare the two structured CVs carefully. Ensure that:
             },
             passed=passed or False,
         )
+
+    async def _review(
+        self, new_cv: CV, original_cv: CV, job_analysis: JobAnalysis
+    ) -> CV:
+        """Run the quality review loop on a draft and return the refined draft."""
+        # --- STEP 2.5: QUALITY REVIEW (Agent 2.5) ---
+        # A local keyword-coverage score settles clear-cut drafts, the LLM
+        # reviewer is only asked when that score is ambiguous
+        previous_coverage: KeywordCoverage | None = None
+        previous_cv = new_cv
+        for review_iteration in range(self.max_review_iterations):
+            coverage = score_keyword_coverage(new_cv, original_cv, job_analysis)
+            self._say(
+                f"📈 Keyword Coverage: {coverage.score:.1f}/10 ({len(coverage.matched)} matched, {len(coverage.missing)} missing)"
+            )
+            if previous_coverage is not None and (
+                coverage.score < previous_coverage.score + self.min_coverage_gain
+            ):
+                if coverage.score < previous_coverage.score:
+                    new_cv = previous_cv
+                    self._say(
+                        "   ↩️ Refinement lowered keyword coverage, keeping the previous draft\n"
+                    )
+                else:
+                    self._say("   ℹ️ Keyword coverage stopped improving\n")
+                break
+            previous_coverage, previous_cv = coverage, new_cv
+            self.instrumentation.count_review_iteration()
+
+            try:
+                if (
+                    coverage.score >= self.local_review_pass_score
+                    or coverage.score < self.local_review_fail_score
+                ):
+                    self._say("   ⚡ Local score is decisive, skipping Agent 2.5")
+                    review = coverage_to_review(coverage)
+                    review_is_local = True
+                else:
+                    review_is_local = False
+                    self._say(
+                        f"🤖 Agent 2.5 (Reviewer): Checking CV quality (Iteration {review_iteration + 1}/{self.max_review_iterations})..."
+                    )
+
+                    review_prompt = prompts.review_prompt(new_cv, job_analysis)
+                    self._report_prompt("Review", review_prompt)
+
+                    with self._stage("review"):
+                        review = await self._judge(
+                            "review",
+                            "reviewer",
+                            review_prompt,
+                            self._review_is_clear_cut,
+                        )
+
+                if review is None:
+                    self._say("   ⚠️ Review returned None, skipping quality check\n")
+                    break
+
+                self._emit(
+                    ReviewScored(
+                        iteration=review_iteration + 1,
+                        quality_score=review.quality_score,
+                        needs_improvement=review.needs_improvement,
+                        source_of_score="local" if review_is_local else "llm",
+                        keyword_coverage=coverage.coverage,
+                    )
+                )
+                self._say(f"   📊 Quality Score: {review.quality_score}/10")
+
+                if review.strengths:
+                    self._say(f"   ✨ Strengths: {', '.join(review.strengths[:2])}")
+
+                if (
+                    review.needs_improvement
+                    and review_iteration < self.max_review_iterations - 1
+                ):
+                    self._say("   🔄 Quality improvements needed, refining...\n")
+
+                    # Refine CV based on review
+                    with self._stage("refine"):
+                        refined_cv = await self._refine(
+                            new_cv,
+                            original_cv,
+                            job_analysis,
+                            review.specific_suggestions,
+                        )
+                    if refined_cv:
+                        new_cv = self._keep_header(refined_cv, original_cv)
+                        self._say("   ✅ CV refined based on feedback\n")
+                    else:
+                        self._say("   ⚠️ Refinement returned None, keeping current CV\n")
+                        break
+                else:
+                    if review.needs_improvement:
+                        self._say("   ℹ️ Max review iterations reached\n")
+                    else:
+                        self._say("   ✅ Quality check passed!\n")
+                    break
+
+            except Exception as e:
+                self._say(f"   ⚠️ Review failed: {e}, continuing with current CV\n")
+                break
+        return new_cv
+
+    async def _audit(
+        self,
+        original_cv: CV,
+        new_cv: CV,
+        job_analysis: JobAnalysis,
+        write_attempt: int,
+    ) -> AuditResult | None:
+        """Pre-audit a draft locally, then with the auditor agent if it passes."""
+        # --- STEP 2.9: DETERMINISTIC PRE-AUDIT ---
+        # Unsupported skills, roles, dates or bullets fail fast here,
+        # without spending an auditor round trip on them
+        self._say("🔎 Pre-Audit: Checking draft against the original CV...")
+        audit = pre_audit_cv(original_cv, new_cv)
+        if audit.passed:
+            self._say("   ✅ Pre-audit passed\n")
+            # --- STEP 3: AUDIT (Agent 3) ---
+            self._say(
+                "🤖 Agent 3 (Auditor): Validating for hallucinations and AI-speak..."
+            )
+            audit_prompt = prompts.audit_prompt(original_cv, new_cv, job_analysis)
+            self._report_prompt("Audit", audit_prompt)
+            with self._stage("audit"):
+                audit = await self._judge(
+                    "audit", "auditor", audit_prompt, self._audit_is_clear_cut
+                )
+
+            if audit is not None:
+                self._emit_audit_verdict(audit, write_attempt, "llm")
+        else:
+            self._emit_audit_verdict(audit, write_attempt, "pre_audit")
+            critical_count = sum(i.severity == "Critical" for i in audit.issues)
+            self._say(
+                f"   ❌ Pre-audit rejected the draft with {critical_count} critical issue(s), skipping Agent 3"
+            )
+        return audit
+
+    async def _get_original_cv(self, resume_text: str) -> CV:
+        """Return the parsed resume, from cache when the same resume was parsed before."""
+        resume_key = self.resume_cache_key(resume_text)
+        if self.resume_cache:
+            cached_cv = self.resume_cache.get(resume_key, CV)
+            if cached_cv is not None:
+                self._emit(CacheHit(stage="parse_resume"))
+                self._say("♻️ Agent 0 (Parser): Cache hit, skipping resume parsing.")
+                self._report_original_cv(cached_cv)
+                return cached_cv
+
+        original_cv = None
+        if self.incremental_resume_parsing and self.resume_section_cache:
+            original_cv = await self._parse_resume_sections(resume_text)
+        if original_cv is None:
+            original_cv = await self._parse_resume(resume_text)
+        if self.resume_cache:
+            self.resume_cache.set(resume_key, original_cv)
+        self._report_original_cv(original_cv)
+        return original_cv
+
+    def _report_original_cv(self, original_cv: CV) -> None:
+        self._say(f"   ✅ Resume Parsed: {original_cv.full_name}")
+        self._say(
+            f"   📋 Found {len(original_cv.skills)} skills, {len(original_cv.experience)} work experiences\n"
+        )
+
+    async def _parse_resume_sections(self, resume_text: str) -> CV | None:
+        """
+        Parse the resume one Markdown section at a time, reusing cached
+        sections and parsing the changed ones concurrently.
+
+        Returns:
+            The merged CV, or None when the resume has too few sections or
+            the sections don't merge into a complete CV
+        """
+        sections = resume_parse_units(resume_text)
+        if len(sections) < self.min_resume_sections:
+            return None
+
+        section_prompts = [prompts.resume_section_prompt(s) for s in sections]
+        keys = [self.resume_section_cache_key(p) for p in section_prompts]
+        fragments: list[CVFragment | None] = [
+            self.resume_section_cache.get(key, CVFragment) for key in keys
+        ]
+        changed = [i for i, fragment in enumerate(fragments) if fragment is None]
+        if len(changed) < len(sections):
+            self._emit(CacheHit(stage="parse_resume"))
+        self._say(
+            f"🤖 Agent 0 (Parser): Parsing {len(changed)} of {len(sections)} resume section(s), "
+            f"{len(sections) - len(changed)} unchanged..."
+        )
+
+        semaphore = asyncio.Semaphore(self.max_section_parses)
+
+        async def parse(index: int) -> None:
+            async with semaphore:
+                fragment = await self._run_agent(
+                    "parse_resume",
+                    "resume_parser",
+                    section_prompts[index],
+                    output_type=CVFragment,
+                )
+            fragments[index] = fragment
+            self.resume_section_cache.set(keys[index], fragment)
+
+        try:
+            await asyncio.gather(*(parse(i) for i in changed))
+        except Exception as e:
+            self._say(f"⚠️ Section parsing failed ({e}), parsing the whole resume")
+            return None
+
+        original_cv = merge_cv_fragments(fragments)
+        if original_cv is None:
+            self._say(
+                "⚠️ Sections didn't merge into a complete CV, parsing the whole resume"
+            )
+        return original_cv
+
+    async def _parse_resume(self, resume_text: str) -> CV:
+        """Run the parser agent on the raw resume, retrying incomplete parses."""
+        self._say("🤖 Agent 0 (Parser): Parsing original resume...")
+        try:
+            original_cv = await self._run_agent(
+                "parse_resume",
+                "resume_parser",
+                prompts.resume_parse_prompt(resume_text),
+                check=lambda cv: (
+                    None
+                    if cv is not None and cv.full_name and cv.experience
+                    else "Incomplete resume parse"
+                ),
+            )
+        except WorkflowError as e:
+            raise StageFailedError(
+                "parse_resume", "Failed to parse original resume after retries."
+            ) from e
+
+        return original_cv
+
+    async def _get_job_analysis(self, job_content_file_path: str) -> JobAnalysis:
+        """
+        Return the job analysis for a posting, from cache when its content
+        was analyzed before, sharing in-flight analyses between concurrent runs.
+        """
+        job_content = await self._read_job_posting(job_content_file_path)
+        if self.normalize_postings:
+            job_content = self._normalize_posting(job_content)
+        job_key = self.job_analysis_cache_key(job_content)
+        fingerprint = simhash(job_content) if self.posting_index is not None else None
+
+        if self.job_analysis_cache:
+            cached_analysis = self.job_analysis_cache.get(job_key, JobAnalysis)
+            if cached_analysis is not None:
+                self._emit(CacheHit(stage="analyze_job"))
+                self._say("♻️ Agent 1 (Analyst): Cache hit, skipping job analysis.")
+                self._index_posting(fingerprint, job_key)
+                self._report_job_analysis(cached_analysis)
+                return cached_analysis
+            near_duplicate = self._near_duplicate_analysis(fingerprint, job_content)
+            if near_duplicate is not None:
+                self._report_job_analysis(near_duplicate)
+                return near_duplicate
+
+        async def analyze() -> JobAnalysis:
+            job_analysis = await self._analyze_job(job_content, job_content_file_path)
+            if self.job_analysis_cache:
+                self.job_analysis_cache.set(job_key, job_analysis)
+                self._index_posting(fingerprint, job_key)
+            return job_analysis
+
+        job_analysis, shared = await self._job_analysis_flights.do(job_key, analyze)
+        if shared:
+            self._emit(CacheHit(stage="analyze_job", shared_in_flight=True))
+            self._say(
+                "♻️ Agent 1 (Analyst): Reused an in-flight analysis of the same posting."
+            )
+        self._report_job_analysis(job_analysis)
+        return job_analysis
+
+    def _index_posting(self, fingerprint: int | None, job_key: str) -> None:
+        if self.posting_index is not None and fingerprint is not None:
+            self.posting_index.add(fingerprint, job_key)
+
+    def _near_duplicate_analysis(
+        self, fingerprint: int | None, job_content: str
+    ) -> JobAnalysis | None:
+        """
+        The cached analysis of the closest almost identical posting that
+        names a company this posting mentions too (the same ad template
+        cross-posted for another client is analyzed afresh). Index entries
+        whose analysis was evicted from the cache are pruned on the way.
+        """
+        if (
+            self.posting_index is None
+            or fingerprint is None
+            or self.job_analysis_cache is None
+        ):
+            return None
+        posting_tokens = set(tokenize(job_content))
+        for job_key, distance in self.posting_index.find(fingerprint):
+            job_analysis = self.job_analysis_cache.get(job_key, JobAnalysis)
+            if job_analysis is None:
+                self.posting_index.remove(job_key)
+                continue
+            if set(tokenize(job_analysis.company_name)) <= posting_tokens:
+                break
+        else:
+            return None
+        similarity = 1 - distance / FINGERPRINT_BITS
+        self._emit(CacheHit(stage="analyze_job", similarity=similarity))
+        self._say(
+            f"♻️ Agent 1 (Analyst): Near-duplicate of an analyzed posting "
+            f"({similarity:.0%} similar), reusing its analysis."
+        )
+        return job_analysis
+
+    async def _read_job_posting(self, source: str) -> str:
+        """
+        Read a job posting from a file, or fetch it as Markdown when `source`
+        is a URL.
+
+        Raises:
+            StageFailedError: If the file couldn't be read or the URL
+                couldn't be fetched
+        """
+        if not is_url(source):
+            try:
+                return await read_text_file(source)
+            except OSError as e:
+                raise StageFailedError(
+                    "analyze_job", f"Couldn't read {source}: {e.strerror or e}"
+                ) from e
+        if self.browser_pool is None:
+            raise StageFailedError(
+                "analyze_job", f"{source} is a URL, but no browser pool was given"
+            )
+        page = await self.browser_pool.fetch(source)
+        if page.error:
+            raise StageFailedError("analyze_job", page.error)
+        self._say(
+            f"🌐 Fetched {source} ({page.status.replace('_', ' ')}, "
+            f"{page.seconds:.2f}s)"
+        )
+        return page.markdown
+
+    def _normalize_posting(self, job_content: str) -> str:
+        posting = normalize_posting(job_content, self.max_posting_tokens)
+        self._emit(
+            PostingNormalized(
+                original_bytes=posting.original_bytes,
+                normalized_bytes=posting.normalized_bytes,
+                original_tokens=posting.original_tokens,
+                normalized_tokens=posting.normalized_tokens,
+            )
+        )
+        self._say(posting.format())
+        # Never send less than the original when everything looked like boilerplate
+        return posting.text or job_content
+
+    def _report_job_analysis(self, job_analysis: JobAnalysis) -> None:
+        self._say(
+            f"   ✅ Job Analyzed: {job_analysis.job_title} at {job_analysis.company_name}"
+        )
+        self._say(f"   🎯 Keywords found: {job_analysis.keywords_to_target}\n")
+
+    async def _analyze_job(
+        self, job_content: str, job_content_file_path: str
+    ) -> JobAnalysis:
+        """Run the analyst agent on the posting, retrying incomplete analyses."""
+        self._say("🤖 Agent 1 (Analyst): Reading job post...")
+        analysis_prompt = prompts.analysis_prompt(job_content)
+        self._report_prompt("Analysis", analysis_prompt)
+        try:
+            job_analysis = await self._run_agent(
+                "analyze_job",
+                "analyst",
+                analysis_prompt,
+                check=lambda analysis: (
+                    None
+                    if analysis is not None
+                    and analysis.job_title
+                    and analysis.company_name
+                    else "Incomplete job data"
+                ),
+                deps=JobContentDeps(
+                    content=job_content, file_path=job_content_file_path
+                ),
+            )
+        except WorkflowError as e:
+            raise StageFailedError(
+                "analyze_job", "Failed to get complete job analysis after retries."
+            ) from e
+
+        self._say(f"   [Debug] Job Data: {job_analysis}")
+        return job_analysis
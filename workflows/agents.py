@@ -1,45 +1,40 @@
-from pydantic_ai import Agent
+from typing import TYPE_CHECKING, Any
 
-from models.agents.output import JobAnalysis, CV, AuditResult, ReviewResult
-from tools.playwright import read_job_content_file
+if TYPE_CHECKING:
+    import httpx
+    from pydantic_ai import Agent
+    from pydantic_ai.models import Model
+
+# Agents are built on first use by `get_agent`, so importing this module
+# (and `workflows`) doesn't load pydantic-ai or the OpenAI client.
+# `workflows.agents.writer_agent` etc. still work and build the agent.
 
 MODLE_NAME = "openai:gpt-5-mini"
+# Model of each agent, where it differs from MODLE_NAME (e.g. a smaller
+# model for "resume_parser"); set with `configure_models`
+AGENT_MODELS: dict[str, str] = {}
+# Cheaper model that judges first for the agents listed here (the auditor
+# and reviewer); the workflow escalates to the agent's own model when the
+# cheap verdict is borderline
+CASCADE_MODELS: dict[str, str] = {}
+# Agents whose verdicts can go through a cascade
+CASCADE_AGENTS = ("auditor", "reviewer")
 
-# --- Agent 0: The Scraper ---
-# Responsibility: Fetch the job posting content.
-scraper_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
-    You are an expert Technical Recruiter.
-    Your job is to analyze a raw job posting and extract structured data.
-    Identify the core requirements, not just the 'nice to haves'.
-    Look for 'hidden' keywords that ATS systems might scan for.
-    """,
-    output_type=JobAnalysis,
-    tools=[read_job_content_file],
-    retries=3,
-)
+# Connection pool shared by every agent, sized for a batch's concurrent calls
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 16
+REQUEST_TIMEOUT_SECONDS = 600
 
-# --- Agent 1: The Job Analyst ---
-# Responsibility: Turn Markdown or raw text into a structured JobAnalysis object.
-analyst_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+ANALYST_SYSTEM_PROMPT = """
     You are an expert Technical Recruiter.
     Your job is to analyze a raw job posting and extract structured data.
     Identify the core requirements, not just the 'nice to haves'.
     Look for 'hidden' keywords that ATS systems might scan for.
-    """,
-    output_type=JobAnalysis,
-    tools=[read_job_content_file],
-    retries=3,
-)
+    """
 
 # --- Agent 1.5: The Resume Parser ---
 # Responsibility: Parse markdown resume into structured CV object
-resume_parser_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+RESUME_PARSER_SYSTEM_PROMPT = """
     You are an expert Resume Parser.
     Your job is to parse a resume in Markdown format and extract all information into a structured format.
     
@@ -51,16 +46,11 @@ resume_parser_agent = Agent(
     5. Structure work experience with company, role, dates, and highlight bullets
     6. Extract all technical and soft skills mentioned
     7. Include all projects with their descriptions
-    """,
-    output_type=CV,
-    retries=3,
-)
+    """
 
 # --- Agent 2: The Writer ---
 # Responsibility: Rewrite the CV based on the Analysis.
-writer_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+WRITER_SYSTEM_PROMPT = """
     You are a Senior Resume Writer.
     Input: A structured CV object and a Job Analysis.
     Task: Rewrite the CV to target the Job Analysis while preserving all original information.
@@ -76,16 +66,11 @@ writer_agent = Agent(
     8. Maintain chronological order and accurate dates
     9. If the original CV lacks a required skill, do NOT add it - focus on highlighting transferable skills instead
     10. Group all the skills so that the most relevant skills to the job are at the top of the skills section
-    """,
-    output_type=CV,
-    retries=3,
-)
+    """
 
 # --- Agent 3: The Auditor ---
 # Responsibility: Compare Original vs New to catch lies and AI-speak.
-auditor_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+AUDITOR_SYSTEM_PROMPT = """
     You are a strict Compliance Auditor and Resume Quality Checker.
     Input: Original CV (structured), New CV (structured), and Job Analysis.
 
@@ -122,16 +107,11 @@ auditor_agent = Agent(
     - All critical issues must be resolved
     
     Return a detailed structured Audit Result with specific issues and actionable suggestions.
-    """,
-    output_type=AuditResult,
-    retries=3,
-)
+    """
 
 # --- Agent 4: The Cover Letter Writer ---
 # Responsibility: Write a personalized, human-sounding cover letter.
-cover_letter_writer_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+COVER_LETTER_SYSTEM_PROMPT = """
     You are an experienced Career Coach specializing in authentic, human cover letters.
     Input: A structured CV object and a Job Analysis.
     Task: Write a compelling cover letter that sounds genuinely human, not AI-generated.
@@ -154,17 +134,11 @@ cover_letter_writer_agent = Agent(
     - Close: Brief statement of fit and next step
 
     TONE: Professional but personable. Write like you're explaining to a friend why you're applying.
-    """,
-    output_type=str,  # or create a CoverLetter pydantic model if you want structured output
-    retries=3,
-)
-
+    """
 
 # --- Agent 3.5: The Reviewer ---
 # Responsibility: Review quality and suggest specific improvements
-reviewer_agent = Agent(
-    MODLE_NAME,
-    system_prompt="""
+REVIEWER_SYSTEM_PROMPT = """
     You are a Senior Resume Quality Reviewer.
     Input: A tailored CV and Job Analysis.
     Task: Review the CV quality and provide specific, actionable improvement suggestions.
@@ -195,7 +169,167 @@ reviewer_agent = Agent(
     - needs_improvement (bool): True if score < 8
     - specific_suggestions (list): Concrete improvements needed
     - strengths (list): What's working well
-    """,
-    output_type=ReviewResult,  # You'll need to create this model
-    retries=3,
+    """
+
+AGENT_NAMES = (
+    "scraper",
+    "analyst",
+    "resume_parser",
+    "writer",
+    "auditor",
+    "cover_letter_writer",
+    "reviewer",
 )
+
+_agents: dict[str, "Agent"] = {}
+_models: dict[str, "Model | str"] = {}
+_http_client: "httpx.AsyncClient | None" = None
+
+
+def _agent_options(name: str) -> dict[str, Any]:
+    # Only called while building an agent, when pydantic-ai is loaded anyway
+    from models.agents.deps import JobContentDeps
+    from models.agents.output import CV, AuditResult, JobAnalysis, ReviewResult
+    from tools.playwright import read_job_content_file
+
+    options: dict[str, dict[str, Any]] = {
+        # --- Agent 0: The Scraper ---
+        # Responsibility: Fetch the job posting content.
+        "scraper": {
+            "system_prompt": ANALYST_SYSTEM_PROMPT,
+            "output_type": JobAnalysis,
+            "tools": [read_job_content_file],
+        },
+        # --- Agent 1: The Job Analyst ---
+        # Responsibility: Turn Markdown or raw text into a structured JobAnalysis
+        # object. The workflow reads the posting itself and passes it inline, so
+        # the analysis takes a single model call instead of a tool-call round trip.
+        "analyst": {
+            "system_prompt": ANALYST_SYSTEM_PROMPT,
+            "output_type": JobAnalysis,
+            "deps_type": JobContentDeps,
+        },
+        "resume_parser": {
+            "system_prompt": RESUME_PARSER_SYSTEM_PROMPT,
+            "output_type": CV,
+        },
+        "writer": {"system_prompt": WRITER_SYSTEM_PROMPT, "output_type": CV},
+        "auditor": {"system_prompt": AUDITOR_SYSTEM_PROMPT, "output_type": AuditResult},
+        # or create a CoverLetter pydantic model if you want structured output
+        "cover_letter_writer": {
+            "system_prompt": COVER_LETTER_SYSTEM_PROMPT,
+            "output_type": str,
+        },
+        "reviewer": {
+            "system_prompt": REVIEWER_SYSTEM_PROMPT,
+            "output_type": ReviewResult,
+        },
+    }
+    if name not in options:
+        raise KeyError(f"Unknown agent '{name}'")
+    return options[name]
+
+
+def http_client() -> "httpx.AsyncClient":
+    """The pooled HTTP client every agent's model sends its requests with."""
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=10),
+        )
+    return _http_client
+
+
+def configure_models(
+    agent_models: dict[str, str] | None = None,
+    cascade_models: dict[str, str] | None = None,
+) -> None:
+    """
+    Set the model of individual agents and of their cheap cascade tier.
+    Agents already built are rebuilt on next use.
+
+    Args:
+        agent_models: Agent name -> model name, e.g. {"resume_parser": "openai:gpt-5-nano"}
+        cascade_models: Agent name -> model that judges before the agent's own
+
+    Raises:
+        KeyError: If an agent doesn't exist, or can't have a cascade
+    """
+    for name in agent_models or {}:
+        if name not in AGENT_NAMES:
+            raise KeyError(f"Unknown agent '{name}'")
+    for name in cascade_models or {}:
+        if name not in CASCADE_AGENTS:
+            raise KeyError(
+                f"Agent '{name}' has no cascade, only {', '.join(CASCADE_AGENTS)}"
+            )
+    AGENT_MODELS.update(agent_models or {})
+    CASCADE_MODELS.update(cascade_models or {})
+    for name in agent_models or {}:
+        _agents.pop(name, None)
+
+
+def model_name(agent_name: str) -> str:
+    """The model the agent called `agent_name` runs on."""
+    return AGENT_MODELS.get(agent_name, MODLE_NAME)
+
+
+def cascade_model_name(agent_name: str) -> str | None:
+    """The cheap model judging first for `agent_name`, None without a cascade."""
+    return CASCADE_MODELS.get(agent_name)
+
+
+def get_model(model_name: str) -> "Model | str":
+    """The model called `model_name`, built once and shared by every agent."""
+    model = _models.get(model_name)
+    if model is None:
+        model = _models[model_name] = build_model(model_name)
+    return model
+
+
+def build_model(model_name: str = MODLE_NAME) -> "Model | str":
+    """
+    The model agents run on. OpenAI models share `http_client()` and leave
+    retries to the workflow's CallPolicy; other providers are resolved by
+    pydantic-ai from the name.
+    """
+    provider, _, name = model_name.partition(":")
+    if provider != "openai":
+        return model_name
+
+    from openai import AsyncOpenAI
+    from pydantic_ai.models.openai import OpenAIChatModel
+    from pydantic_ai.providers.openai import OpenAIProvider
+
+    client = AsyncOpenAI(http_client=http_client(), max_retries=0)
+    return OpenAIChatModel(name, provider=OpenAIProvider(openai_client=client))
+
+
+def get_agent(name: str) -> "Agent":
+    """
+    The agent called `name` (e.g. "writer"), built on first use.
+
+    Raises:
+        KeyError: If there is no such agent
+    """
+    agent = _agents.get(name)
+    if agent is None:
+        from pydantic_ai import Agent
+
+        agent = _agents[name] = Agent(
+            get_model(model_name(name)), retries=3, **_agent_options(name)
+        )
+    return agent
+
+
+def __getattr__(name: str) -> "Agent":
+    # `writer_agent` -> get_agent("writer")
+    if name.endswith("_agent") and name.removesuffix("_agent") in AGENT_NAMES:
+        return get_agent(name.removesuffix("_agent"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,96 @@
+import re
+
+from models.agents.output import CV, CVEdit, CVPatch
+
+# The only parts of a draft a patch may touch. Names, contact details,
+# companies, roles, dates, education, certifications and publications are
+# facts from the original CV and are never edited.
+_SUMMARY_RE = re.compile(r"^summary$")
+_SKILLS_RE = re.compile(r"^skills$")
+_HIGHLIGHTS_RE = re.compile(r"^experience\[(\d+)\]\.highlights$")
+_HIGHLIGHT_RE = re.compile(r"^experience\[(\d+)\]\.highlights\[(\d+)\]$")
+_PROJECT_RE = re.compile(r"^projects\[(\d+)\]$")
+
+
+class PatchError(ValueError):
+    """An edit that can't be applied to the draft."""
+
+
+def _require_text(edit: CVEdit) -> str:
+    if not isinstance(edit.value, str) or not edit.value.strip():
+        raise PatchError(f"'{edit.op} {edit.path}' needs a non-empty text value")
+    return edit.value.strip()
+
+
+def _reordered(current: list[str], edit: CVEdit) -> list[str]:
+    if not isinstance(edit.value, list):
+        raise PatchError(f"'reorder {edit.path}' needs the reordered list")
+    by_key = {item.strip().casefold(): item for item in current}
+    proposed = [item.strip().casefold() for item in edit.value]
+    if sorted(proposed) != sorted(by_key) or len(proposed) != len(current):
+        raise PatchError(f"'reorder {edit.path}' must keep exactly the same items")
+    return [by_key[key] for key in proposed]
+
+
+def _index(items: list, index: str, path: str) -> int:
+    position = int(index)
+    if position >= len(items):
+        raise PatchError(f"'{path}' is out of range")
+    return position
+
+
+def apply_cv_patch(cv: CV, patch: CVPatch) -> CV:
+    """
+    Apply a patch to a draft without modifying the draft.
+
+    Paths address the draft as given, so removals are applied last, from
+    the highest index down, and never shift the target of another edit.
+
+    Args:
+        cv: The current draft
+        patch: Edits returned by the writer
+
+    Returns:
+        The edited copy of the draft
+
+    Raises:
+        PatchError: If any edit targets a path that can't be edited, is out
+            of range or has an invalid value; nothing is applied then
+    """
+    new_cv = cv.model_copy(deep=True)
+    removals: list[tuple[int, int]] = []
+
+    for edit in patch.edits:
+        path = edit.path.replace(" ", "")
+        if _SUMMARY_RE.match(path) and edit.op == "replace":
+            new_cv.summary = _require_text(edit)
+        elif _SKILLS_RE.match(path) and edit.op == "reorder":
+            new_cv.skills = _reordered(new_cv.skills, edit)
+        elif match := _HIGHLIGHTS_RE.match(path):
+            role = new_cv.experience[_index(new_cv.experience, match[1], path)]
+            if edit.op != "reorder":
+                raise PatchError(f"'{edit.op} {path}' is not allowed, only reorder")
+            role.highlights = _reordered(role.highlights, edit)
+        elif match := _HIGHLIGHT_RE.match(path):
+            role_index = _index(new_cv.experience, match[1], path)
+            highlights = new_cv.experience[role_index].highlights
+            bullet_index = _index(highlights, match[2], path)
+            if edit.op == "replace":
+                highlights[bullet_index] = _require_text(edit)
+            elif edit.op == "remove":
+                removals.append((role_index, bullet_index))
+            else:
+                raise PatchError(f"'{edit.op} {path}' is not allowed")
+        elif (match := _PROJECT_RE.match(path)) and edit.op == "replace":
+            new_cv.projects[_index(new_cv.projects, match[1], path)] = _require_text(
+                edit
+            )
+        else:
+            raise PatchError(f"'{edit.op} {edit.path}' is not an allowed edit")
+
+    for role_index, bullet_index in sorted(set(removals), reverse=True):
+        del new_cv.experience[role_index].highlights[bullet_index]
+    if any(not role.highlights for role in new_cv.experience):
+        raise PatchError("A patch may not remove every highlight of a role")
+
+    return new_cv
@@ -0,0 +1,119 @@
+import time
+from contextvars import ContextVar
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from models.agents.output import CV
+from models.workflow import ResumeTailorResult
+
+# Label of the run that emits events, e.g. "resume.md × posting.md" in batch
+# mode. A context variable so concurrent pairs tag their own events.
+event_source: ContextVar[str] = ContextVar("event_source", default="")
+
+
+class WorkflowEvent(BaseModel):
+    kind: str
+    source: str = Field(default_factory=event_source.get)
+    timestamp: float = Field(default_factory=time.time)
+
+
+class Message(WorkflowEvent):
+    """Human readable progress line, what the CLI prints."""
+
+    kind: Literal["message"] = "message"
+    text: str
+
+
+class StageStarted(WorkflowEvent):
+    kind: Literal["stage_started"] = "stage_started"
+    stage: str
+
+
+class StageFinished(WorkflowEvent):
+    kind: Literal["stage_finished"] = "stage_finished"
+    stage: str
+    seconds: float
+    error: str | None = None
+
+
+class CacheHit(WorkflowEvent):
+    kind: Literal["cache_hit"] = "cache_hit"
+    stage: str
+    shared_in_flight: bool = False
+    similarity: float | None = Field(
+        default=None,
+        description="Set when reused from a near-duplicate posting, 0-1.",
+    )
+
+
+class PostingNormalized(WorkflowEvent):
+    """Boilerplate was stripped from a posting before analysis."""
+
+    kind: Literal["posting_normalized"] = "posting_normalized"
+    original_bytes: int
+    normalized_bytes: int
+    original_tokens: int
+    normalized_tokens: int
+
+
+class CheckpointReplayed(WorkflowEvent):
+    """An agent output was replayed from the run journal instead of called."""
+
+    kind: Literal["checkpoint_replayed"] = "checkpoint_replayed"
+    stage: str
+    agent: str
+
+
+class WriterPartial(WorkflowEvent):
+    """A partially generated CV, streamed while the writer is still running."""
+
+    kind: Literal["writer_partial"] = "writer_partial"
+    cv: CV
+
+
+class ReviewScored(WorkflowEvent):
+    kind: Literal["review_scored"] = "review_scored"
+    iteration: int
+    quality_score: int
+    needs_improvement: bool
+    source_of_score: Literal["local", "llm"]
+    keyword_coverage: float | None = None
+
+
+class AuditVerdict(WorkflowEvent):
+    kind: Literal["audit_verdict"] = "audit_verdict"
+    attempt: int
+    passed: bool
+    hallucination_score: int | None = None
+    ai_cliche_score: int | None = None
+    issue_count: int = 0
+    source_of_verdict: Literal["pre_audit", "llm"]
+
+
+class CascadeVerdict(WorkflowEvent):
+    """The cheap model's verdict was kept, or escalated to the strong model."""
+
+    kind: Literal["cascade_verdict"] = "cascade_verdict"
+    agent: str
+    cheap_model: str
+    score: int | None = Field(
+        default=None, description="hallucination_score or quality_score."
+    )
+    escalated: bool
+
+
+class RunFinished(WorkflowEvent):
+    kind: Literal["run_finished"] = "run_finished"
+    result: ResumeTailorResult
+
+
+def print_event(event: WorkflowEvent) -> None:
+    """Console subscriber: prints progress messages, prefixed in batch runs."""
+    if not isinstance(event, Message):
+        return
+    if not event.source:
+        print(event.text)
+        return
+    for line in event.text.split("\n"):
+        print(f"[{event.source}] {line}" if line.strip() else line)
@@ -0,0 +1,228 @@
+import json
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel, Field
+
+from workflows.events import event_source
+
+if TYPE_CHECKING:
+    from pydantic_ai.messages import ModelMessage
+    from pydantic_ai.usage import RunUsage
+
+
+class AgentCallRecord(BaseModel):
+    stage: str
+    agent: str
+    model: str = Field(default="", description="Model the call ran on.")
+    source: str = Field(default="", description="Run label in batch mode.")
+    started_at: float = Field(description="Unix timestamp.")
+    seconds: float = 0.0
+    requests: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    retries: int = Field(
+        default=0, description="Model requests beyond the first (output retries)."
+    )
+    cost_usd: float | None = Field(
+        default=None, description="Estimated from genai-prices, None if unknown."
+    )
+    error: str | None = None
+
+
+class RunCounters(BaseModel):
+    write_attempts: int = 0
+    review_iterations: int = 0
+
+
+class CascadeCounters(BaseModel):
+    settled: int = Field(default=0, description="Verdicts the cheap model settled.")
+    escalated: int = Field(
+        default=0, description="Borderline verdicts escalated to the strong model."
+    )
+
+    @property
+    def settled_rate(self) -> float:
+        total = self.settled + self.escalated
+        return self.settled / total if total else 0.0
+
+
+class RunProfile(BaseModel):
+    calls: list[AgentCallRecord] = Field(default_factory=list)
+    runs: dict[str, RunCounters] = Field(default_factory=dict)
+    cascades: dict[str, CascadeCounters] = Field(
+        default_factory=dict, description="Agent name -> cheap-first verdict counts."
+    )
+
+    def format(self) -> str:
+        """Per-stage breakdown of time, tokens, calls and cost."""
+        stages: dict[str, list[AgentCallRecord]] = defaultdict(list)
+        for call in self.calls:
+            stages[call.stage].append(call)
+
+        lines = [
+            "📊 Run profile",
+            (
+                f"   {'stage':<14}{'calls':>6}{'retries':>8}{'time (s)':>10}"
+                f"{'in tok':>9}{'out tok':>9}{'cost ($)':>10}"
+            ),
+        ]
+        for stage, calls in [*stages.items(), ("TOTAL", self.calls)]:
+            costs = [c.cost_usd for c in calls if c.cost_usd is not None]
+            cost = f"{sum(costs):.4f}" if costs else "n/a"
+            lines.append(
+                f"   {stage:<14}{len(calls):>6}{sum(c.retries for c in calls):>8}"
+                f"{sum(c.seconds for c in calls):>10.2f}"
+                f"{sum(c.input_tokens for c in calls):>9}"
+                f"{sum(c.output_tokens for c in calls):>9}{cost:>10}"
+            )
+        for label, counters in self.runs.items():
+            lines.append(
+                f"   {label or 'run'}: {counters.write_attempts} write attempt(s), "
+                f"{counters.review_iterations} review iteration(s)"
+            )
+        for agent, counters in self.cascades.items():
+            tiers = []
+            for model in dict.fromkeys(c.model for c in self.calls if c.agent == agent):
+                calls = [c for c in self.calls if c.agent == agent and c.model == model]
+                costs = [c.cost_usd for c in calls if c.cost_usd is not None]
+                cost = f"${sum(costs):.4f}" if costs else "n/a"
+                tiers.append(
+                    f"{model or 'default'} {len(calls)} call(s), "
+                    f"{sum(c.seconds for c in calls):.2f}s, {cost}"
+                )
+            lines.append(
+                f"   {agent} cascade: {counters.settled} settled cheaply, "
+                f"{counters.escalated} escalated ({counters.settled_rate:.0%} cheap hit "
+                "rate)" + "".join(f"; {tier}" for tier in tiers)
+            )
+        return "\n".join(lines)
+
+
+def _estimate_cost(messages: "list[ModelMessage]") -> float | None:
+    from pydantic_ai.messages import ModelResponse
+
+    total = 0.0
+    for message in messages:
+        if not isinstance(message, ModelResponse):
+            continue
+        try:
+            total += float(message.cost().total_price)
+        except (AssertionError, LookupError, ValueError):
+            # Unknown model or provider (e.g. test models), no price data
+            return None
+    return total
+
+
+class Instrumentation:
+    """
+    Records timing, token usage, retries and cost for every agent call.
+
+    Records are kept in `profile`, optionally appended to a JSON-lines trace
+    file, and optionally exported as OpenTelemetry spans (the spans go to
+    whatever exporter the host application configured).
+    """
+
+    def __init__(self, trace_path: str | None = None, otel: bool = False):
+        self.trace_path = trace_path
+        self.profile = RunProfile()
+        self._tracer = None
+        if otel:
+            from opentelemetry import trace
+
+            self._tracer = trace.get_tracer("resume_tailorator")
+
+    @contextmanager
+    def agent_call(
+        self, stage: str, agent: str, model: str = ""
+    ) -> Iterator[AgentCallRecord]:
+        """
+        Time one agent call. Fill the yielded record with `add_usage` once
+        the call returns; failures are recorded with their error.
+        """
+        record = AgentCallRecord(
+            stage=stage,
+            agent=agent,
+            model=model,
+            source=event_source.get(),
+            started_at=time.time(),
+        )
+        with ExitStack() as stack:
+            # The span sees any exception leaving the call, which records it
+            # and sets the span's status to error
+            span = (
+                stack.enter_context(
+                    self._tracer.start_as_current_span(f"agent {agent}")
+                )
+                if self._tracer
+                else None
+            )
+            start = time.perf_counter()
+            try:
+                yield record
+            except BaseException as e:
+                record.error = repr(e)
+                raise
+            finally:
+                record.seconds = time.perf_counter() - start
+                self.profile.calls.append(record)
+                if span is not None:
+                    span.set_attributes(self._span_attributes(record))
+                self._write_trace(record)
+
+    @staticmethod
+    def add_usage(
+        record: AgentCallRecord, usage: "RunUsage", messages: "list[ModelMessage]"
+    ) -> None:
+        record.requests = usage.requests
+        record.input_tokens = usage.input_tokens
+        record.output_tokens = usage.output_tokens
+        record.retries = max(0, usage.requests - 1)
+        record.cost_usd = _estimate_cost(messages)
+
+    def count_write_attempt(self) -> None:
+        self._counters().write_attempts += 1
+
+    def count_review_iteration(self) -> None:
+        self._counters().review_iterations += 1
+
+    def count_cascade(self, agent: str, escalated: bool) -> None:
+        counters = self.profile.cascades.setdefault(agent, CascadeCounters())
+        if escalated:
+            counters.escalated += 1
+        else:
+            counters.settled += 1
+
+    def _counters(self) -> RunCounters:
+        return self.profile.runs.setdefault(event_source.get(), RunCounters())
+
+    def _write_trace(self, record: AgentCallRecord) -> None:
+        if not self.trace_path:
+            return
+        with open(self.trace_path, "a", encoding="utf-8") as f:
+            f.write(record.model_dump_json() + "\n")
+
+    @staticmethod
+    def _span_attributes(record: AgentCallRecord) -> dict[str, Any]:
+        attributes: dict[str, Any] = {
+            "resume_tailorator.stage": record.stage,
+            "resume_tailorator.source": record.source,
+            "gen_ai.agent.name": record.agent,
+            "gen_ai.request.model": record.model,
+            "gen_ai.usage.input_tokens": record.input_tokens,
+            "gen_ai.usage.output_tokens": record.output_tokens,
+            "resume_tailorator.requests": record.requests,
+            "resume_tailorator.retries": record.retries,
+        }
+        if record.cost_usd is not None:
+            attributes["resume_tailorator.cost_usd"] = record.cost_usd
+        if record.error:
+            attributes["error.type"] = record.error
+        return attributes
+
+    def dumps(self) -> str:
+        """The whole profile as JSON."""
+        return json.dumps(self.profile.model_dump(mode="json"))
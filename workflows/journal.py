@@ -0,0 +1,182 @@
+import json
+import os
+import secrets
+import time
+from collections import Counter
+from typing import Any
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+from utils.cache import DEFAULT_CACHE_DIR
+from utils.text import content_hash
+
+DEFAULT_JOURNAL_DIR = os.path.join(DEFAULT_CACHE_DIR, "runs")
+# Journals of interrupted runs kept for --resume-run
+DEFAULT_MAX_JOURNALS = 32
+DEFAULT_MAX_JOURNAL_AGE_SECONDS = 7 * 24 * 60 * 60  # 7 days
+
+
+class JournalEntry(BaseModel):
+    key: str = Field(description="Identifies the agent call, see call_key.")
+    stage: str
+    agent: str
+    output: Any = Field(description="The agent output, as JSON.")
+    timestamp: float = Field(default_factory=time.time)
+
+
+def _remove(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def new_run_id() -> str:
+    """A sortable, unique run id, e.g. 20261018-153000-3fa2c1."""
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+
+
+class RunJournal:
+    """
+    Append-only JSON-lines checkpoint of every agent output in a run, so a
+    restarted run replays completed calls instead of paying for them again.
+
+    Calls are identified by stage, agent and a hash of the prompt, plus how
+    many identical calls came before. Replay is therefore independent of
+    scheduling order and of which stages were served from the caches: a
+    call that was answered before the crash is answered from the journal,
+    everything after it runs live. In batch mode this means a crash only
+    costs the calls that were in flight.
+
+    The first line holds the run's metadata (its inputs and options). A
+    journal is deleted once its run completes; journals of runs that never
+    completed are evicted by `evict`, oldest first.
+    """
+
+    def __init__(self, run_id: str | None = None, directory: str | None = None):
+        self.run_id = run_id or new_run_id()
+        self.path = os.path.join(
+            directory or DEFAULT_JOURNAL_DIR, f"{self.run_id}.jsonl"
+        )
+        self.metadata: dict[str, Any] = {}
+        self.replayed = 0
+        self._entries: dict[str, JournalEntry] = {}
+        self._occurrences: Counter[str] = Counter()
+        self._load()
+
+    @classmethod
+    def open(cls, run_id: str, directory: str | None = None) -> "RunJournal":
+        """
+        Open the journal of an earlier run to continue it.
+
+        Raises:
+            FileNotFoundError: If there is no journal for `run_id`
+        """
+        journal = cls(run_id, directory)
+        if not os.path.exists(journal.path):
+            raise FileNotFoundError(f"No run journal at {journal.path}")
+        return journal
+
+    @staticmethod
+    def evict(
+        directory: str | None = None,
+        max_journals: int = DEFAULT_MAX_JOURNALS,
+        max_age_seconds: float = DEFAULT_MAX_JOURNAL_AGE_SECONDS,
+    ) -> int:
+        """
+        Delete journals last written more than `max_age_seconds` ago, then
+        the oldest ones beyond `max_journals`.
+
+        Returns:
+            Number of journals deleted
+        """
+        directory = directory or DEFAULT_JOURNAL_DIR
+        try:
+            names = [name for name in os.listdir(directory) if name.endswith(".jsonl")]
+        except FileNotFoundError:
+            return 0
+        now = time.time()
+        removed = 0
+        alive: list[tuple[float, str]] = []
+        for name in names:
+            path = os.path.join(directory, name)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if now - mtime > max_age_seconds:
+                removed += _remove(path)
+            else:
+                alive.append((mtime, path))
+        alive.sort()
+        while len(alive) > max_journals:
+            _, path = alive.pop(0)
+            removed += _remove(path)
+        return removed
+
+    def delete(self) -> None:
+        """Delete the journal, once its run completed and can't be resumed."""
+        _remove(self.path)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        for line in lines:
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash mid-write
+                continue
+            if "metadata" in data:
+                self.metadata = data["metadata"]
+                continue
+            try:
+                entry = JournalEntry.model_validate(data)
+            except ValidationError:
+                continue
+            self._entries[entry.key] = entry
+
+    def _append(self, data: dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def write_metadata(self, metadata: dict[str, Any]) -> None:
+        """Record the run's inputs and options, once, when the run starts."""
+        self.metadata = metadata
+        self._append({"metadata": metadata})
+
+    def call_key(self, stage: str, agent: str, prompt: str) -> str:
+        """Key of the next call to `agent` with `prompt` in `stage`."""
+        base = f"{stage}/{agent}/{content_hash(prompt)[:16]}"
+        occurrence = self._occurrences[base]
+        self._occurrences[base] += 1
+        return f"{base}#{occurrence}"
+
+    def get(self, key: str, output_type: Any) -> Any | None:
+        """The recorded output of a call, or None if it didn't complete."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            output = TypeAdapter(output_type).validate_python(entry.output)
+        except ValidationError:
+            # Recorded by a version with a different output schema
+            return None
+        self.replayed += 1
+        return output
+
+    def record(self, key: str, stage: str, agent: str, output: Any) -> None:
+        """Checkpoint a completed call, synced to disk before returning."""
+        entry = JournalEntry(
+            key=key, stage=stage, agent=agent, output=to_jsonable_python(output)
+        )
+        self._entries[key] = entry
+        self._append(entry.model_dump(mode="json"))
@@ -0,0 +1,157 @@
+from collections import Counter
+
+from models.agents.output import CV, JobAnalysis, ReviewResult
+from models.workflow import KeywordCoverage
+from utils.text import tokenize
+
+# How much a keyword hit counts depending on where it appears; ATS parsers
+# and recruiters weigh the skills list and summary above deep bullet points
+SECTION_WEIGHTS = {
+    "skills": 1.0,
+    "summary": 0.9,
+    "experience": 0.8,
+    "projects": 0.6,
+    "other": 0.4,
+}
+# BM25 term-frequency saturation: repeating a keyword quickly stops helping,
+# a keyword mentioned FULL_CREDIT_MENTIONS times (e.g. skills + a bullet)
+# gets full credit
+BM25_K1 = 1.2
+FULL_CREDIT_MENTIONS = 2
+# Keywords listed both as hard skills and ATS keywords matter more
+BOTH_LISTS_WEIGHT = 1.5
+
+
+def _sections(cv: CV) -> dict[str, list[str]]:
+    return {
+        "skills": tokenize(" ".join(cv.skills)),
+        "summary": tokenize(cv.summary),
+        "experience": tokenize(
+            " ".join(
+                part for exp in cv.experience for part in [exp.role, *exp.highlights]
+            )
+        ),
+        "projects": tokenize(" ".join(cv.projects)),
+        "other": tokenize(
+            " ".join([*cv.education, *cv.certifications, *cv.publications])
+        ),
+    }
+
+
+def _phrase_count(tokens: list[str], phrase: list[str]) -> int:
+    """Count contiguous occurrences of `phrase` in `tokens`."""
+    if not phrase:
+        return 0
+    if len(phrase) == 1:
+        return Counter(tokens)[phrase[0]]
+    size = len(phrase)
+    return sum(tokens[i : i + size] == phrase for i in range(len(tokens) - size + 1))
+
+
+def _bm25_tf(term_frequency: int) -> float:
+    return term_frequency * (BM25_K1 + 1) / (term_frequency + BM25_K1)
+
+
+def _saturate(term_frequency: int) -> float:
+    """BM25 tf saturation scaled to 0-1."""
+    return min(1.0, _bm25_tf(term_frequency) / _bm25_tf(FULL_CREDIT_MENTIONS))
+
+
+def score_keyword_coverage(
+    cv: CV, original_cv: CV, job_analysis: JobAnalysis
+) -> KeywordCoverage:
+    """
+    Score how well a CV covers the job's keywords, without an LLM.
+
+    Only keywords that appear somewhere in the original CV are counted as
+    targetable: the writer is not allowed to add the others, so they can't
+    be held against the draft.
+
+    Args:
+        cv: The tailored draft to score
+        original_cv: The parsed original resume
+        job_analysis: The analyzed job posting
+
+    Returns:
+        Coverage details with a 0-10 score
+    """
+    keywords: dict[str, float] = {}
+    labels: dict[str, str] = {}
+    for keyword in [*job_analysis.keywords_to_target, *job_analysis.hard_skills]:
+        key = " ".join(tokenize(keyword))
+        if not key:
+            continue
+        if key in keywords:
+            keywords[key] = BOTH_LISTS_WEIGHT
+        else:
+            keywords[key] = 1.0
+            labels[key] = keyword
+
+    draft_sections = _sections(cv)
+    original_tokens = [
+        token for tokens in _sections(original_cv).values() for token in tokens
+    ]
+
+    matched: dict[str, str] = {}
+    missing: list[str] = []
+    misplaced: list[str] = []
+    untargetable: list[str] = []
+    earned = total = 0.0
+
+    for key, weight in keywords.items():
+        phrase = key.split()
+        if not _phrase_count(original_tokens, phrase):
+            untargetable.append(labels[key])
+            continue
+
+        total += weight
+        counts = {
+            section: _phrase_count(tokens, phrase)
+            for section, tokens in draft_sections.items()
+        }
+        found_in = [section for section, count in counts.items() if count]
+        if not found_in:
+            missing.append(labels[key])
+            continue
+
+        # Placement decides the ceiling, repetition across sections fills it
+        best_section = max(found_in, key=SECTION_WEIGHTS.__getitem__)
+        matched[labels[key]] = best_section
+        earned += (
+            weight * SECTION_WEIGHTS[best_section] * _saturate(sum(counts.values()))
+        )
+        if best_section not in ("skills", "summary"):
+            misplaced.append(labels[key])
+
+    coverage = earned / total if total else 1.0
+    return KeywordCoverage(
+        score=round(10 * coverage, 2),
+        coverage=round(coverage, 4),
+        matched=matched,
+        missing=missing,
+        misplaced=misplaced,
+        untargetable=untargetable,
+    )
+
+
+def coverage_to_review(coverage: KeywordCoverage) -> ReviewResult:
+    """Express a local coverage score as a ReviewResult for the review loop."""
+    suggestions = [
+        f"Work '{keyword}' into the summary or a relevant bullet, it appears in the original CV."
+        for keyword in coverage.missing
+    ]
+    suggestions += [
+        f"Surface '{keyword}' in the Skills section or Summary, it's only mentioned in {coverage.matched[keyword]}."
+        for keyword in coverage.misplaced
+    ]
+    strengths = []
+    if coverage.matched:
+        strengths.append(
+            f"Covers {len(coverage.matched)}/{len(coverage.matched) + len(coverage.missing)} targetable job keywords"
+        )
+    return ReviewResult(
+        quality_score=max(0, min(10, round(coverage.score))),
+        needs_improvement=coverage.score < 8,
+        specific_suggestions=suggestions,
+        strengths=strengths,
+    )
@@ -0,0 +1,348 @@
+import asyncio
+import email.utils
+import itertools
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Literal, TypeVar
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeouts, conflicts, rate limits, server errors
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+
+
+class WorkflowError(Exception):
+    """Base class for failures the workflow reports instead of exiting."""
+
+
+class AgentCallError(WorkflowError):
+    """An agent call failed for good, after the policy's retries."""
+
+    def __init__(self, agent: str, attempts: int, error: BaseException):
+        self.agent = agent
+        self.attempts = attempts
+        super().__init__(
+            f"Agent '{agent}' failed after {attempts} attempt(s): {error!r}"
+        )
+
+
+class CircuitOpenError(WorkflowError):
+    """The provider failed repeatedly, calls are refused until it recovers."""
+
+    def __init__(self, agent: str, retry_in: float):
+        self.agent = agent
+        self.retry_in = retry_in
+        super().__init__(
+            f"Agent '{agent}' not called: the provider failed repeatedly, "
+            f"retrying in {retry_in:.0f}s"
+        )
+
+
+class StageFailedError(WorkflowError):
+    """A pipeline stage couldn't produce its result."""
+
+    def __init__(self, stage: str, message: str):
+        self.stage = stage
+        super().__init__(f"{stage}: {message}")
+
+
+class IncompleteOutputError(Exception):
+    """An agent returned valid but unusable output, e.g. a CV without a name."""
+
+
+@dataclass(frozen=True)
+class PolicyConfig:
+    """
+    How agent calls are limited and retried.
+
+    Args:
+        max_attempts: Attempts per agent call, including the first
+        base_delay: Backoff before the first retry, doubling after each
+            attempt; the actual delay is drawn uniformly up to it (full jitter)
+        max_delay: Upper bound for the backoff and for retry-after hints
+        requests_per_minute: Request rate limit, None for unlimited
+        tokens_per_minute: Token rate limit (prompt estimate up front, actual
+            usage once the call returns), None for unlimited
+        breaker_threshold: Consecutive provider failures that open the
+            circuit breaker
+        breaker_reset_seconds: How long the breaker stays open before one
+            trial call is let through
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    breaker_threshold: int = 5
+    breaker_reset_seconds: float = 30.0
+
+
+class TokenBucket:
+    """
+    Async token bucket: holds up to `capacity` tokens, refilled continuously
+    at `rate_per_minute`. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity or rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> float:
+        """
+        Wait until `amount` tokens are available and take them.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+    def adjust(self, amount: float) -> None:
+        """Take (or, if negative, give back) tokens without waiting."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures and refuses calls for
+    `reset_seconds`; then lets one trial call through, closing again if it
+    succeeds and reopening if it fails.
+    """
+
+    def __init__(self, threshold: int, reset_seconds: float):
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> Literal["closed", "open", "half_open"]:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at < self.reset_seconds:
+            return "open"
+        return "half_open"
+
+    def retry_in(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def allow(self) -> bool:
+        """Whether a call may go ahead now."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._trial_running or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+    def release_trial(self) -> None:
+        """Free the trial slot of a trial call that ended without a verdict."""
+        self._trial_running = False
+
+
+def retry_after(error: BaseException) -> float | None:
+    """
+    Seconds the provider asked to wait before retrying, from the
+    `retry-after-ms` or `retry-after` header of the HTTP response behind
+    `error` (pydantic-ai chains the provider SDK's error as the cause).
+    """
+    current: BaseException | None = error
+    while current is not None:
+        response = getattr(current, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers is not None:
+            if (value := headers.get("retry-after-ms")) is not None:
+                try:
+                    return float(value) / 1000
+                except ValueError:
+                    pass
+            if (value := headers.get("retry-after")) is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    pass
+                try:
+                    date = email.utils.parsedate_to_datetime(value)
+                    return max(0.0, date.timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        current = current.__cause__ or current.__context__
+    return None
+
+
+def classify_error(error: BaseException) -> Literal["provider", "output"] | None:
+    """
+    Whether a failed call is worth retrying: "provider" for rate limits,
+    server and network errors (these back off and count towards the
+    circuit breaker), "output" for unusable model output (retried right
+    away), None for errors a retry won't fix.
+    """
+    # Only needed once a call failed, so not imported at startup
+    import httpx
+    from pydantic_ai.exceptions import (
+        ModelAPIError,
+        ModelHTTPError,
+        UnexpectedModelBehavior,
+    )
+
+    if isinstance(error, ModelHTTPError):
+        if error.status_code in RETRYABLE_STATUS_CODES or error.status_code >= 500:
+            return "provider"
+        return None
+    if isinstance(
+        error, ModelAPIError | httpx.TransportError | TimeoutError | ConnectionError
+    ):
+        return "provider"
+    if isinstance(error, UnexpectedModelBehavior | IncompleteOutputError):
+        return "output"
+    return None
+
+
+class CallPolicy:
+    """
+    The one place agent calls are rate limited and retried.
+
+    Shared by everything that calls the same provider (one workflow runs
+    all pairs of a batch), so limits and the circuit breaker apply to the
+    combined load. A rate-limit response pauses every call, not just the one
+    that hit it, so concurrent calls don't all retry into the same limit.
+    """
+
+    def __init__(self, config: PolicyConfig | None = None):
+        self.config = config or PolicyConfig()
+        self.requests = (
+            TokenBucket(self.config.requests_per_minute)
+            if self.config.requests_per_minute
+            else None
+        )
+        self.tokens = (
+            TokenBucket(self.config.tokens_per_minute)
+            if self.config.tokens_per_minute
+            else None
+        )
+        self.breaker = CircuitBreaker(
+            self.config.breaker_threshold, self.config.breaker_reset_seconds
+        )
+        self._paused_until = 0.0
+
+    def backoff(self, attempt: int, error: BaseException) -> float:
+        """Seconds to wait before retrying after failed attempt `attempt` (1-based)."""
+        ceiling = min(
+            self.config.max_delay, self.config.base_delay * 2 ** (attempt - 1)
+        )
+        delay = random.uniform(0, ceiling)
+        hint = retry_after(error)
+        if hint is not None:
+            delay = max(delay, min(hint, self.config.max_delay))
+        return delay
+
+    async def _wait_for_slot(self, estimated_tokens: int) -> None:
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        if self.requests:
+            await self.requests.acquire()
+        if self.tokens and estimated_tokens:
+            await self.tokens.acquire(estimated_tokens)
+
+    def settle_tokens(self, estimated_tokens: int, used_tokens: int) -> None:
+        """Correct the token limit once a call's actual usage is known."""
+        if self.tokens:
+            self.tokens.adjust(
+                used_tokens - min(estimated_tokens, self.tokens.capacity)
+            )
+
+    async def call(
+        self,
+        agent: str,
+        fn: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        on_retry: Callable[[str, int, float, BaseException], None] | None = None,
+    ) -> T:
+        """
+        Run `fn` within the rate limits, retrying transient failures.
+
+        Args:
+            agent: Agent name, for errors and `on_retry`
+            fn: Makes one attempt at the call
+            estimated_tokens: Tokens to reserve before each attempt
+            on_retry: Called with (agent, failed attempt, delay, error)
+                before each retry
+
+        Returns:
+            What `fn` returned
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            AgentCallError: If the last attempt failed, or an attempt failed
+                with an error that isn't worth retrying
+        """
+        attempts = max(1, self.config.max_attempts)
+        for attempt in itertools.count(1):
+            await self._wait_for_slot(estimated_tokens)
+            trial = self.breaker.state == "half_open"
+            if not self.breaker.allow():
+                raise CircuitOpenError(agent, self.breaker.retry_in())
+            try:
+                result = await fn()
+            except Exception as e:
+                kind = classify_error(e)
+                if kind == "provider":
+                    self.breaker.record_failure()
+                elif trial:
+                    # The provider answered, only the output was unusable
+                    self.breaker.record_success()
+                if kind is None or attempt == attempts:
+                    raise AgentCallError(agent, attempt, e) from e
+                delay = self.backoff(attempt, e) if kind == "provider" else 0.0
+                if retry_after(e) is not None:
+                    self._paused_until = max(
+                        self._paused_until, time.monotonic() + delay
+                    )
+                if on_retry:
+                    on_retry(agent, attempt, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+            finally:
+                # e.g. cancelled: never leave the breaker waiting on a trial
+                # that won't report back
+                if trial:
+                    self.breaker.release_trial()
@@ -0,0 +1,174 @@
+import re
+
+from models.workflow import NormalizedPosting
+from utils.markdown_sections import MarkdownSection, split_markdown_sections
+from utils.text import estimate_tokens, normalize_text, tokenize
+
+# Estimated tokens of a posting sent to the analyst; longer postings are cut,
+# lowest priority sections first
+MAX_POSTING_TOKENS = 2500
+# Don't keep a section stub shorter than this when cutting to the cap
+MIN_SECTION_TOKENS = 40
+# Lines with fewer tokens (e.g. a lone "Python" bullet) are never deduplicated
+MIN_DEDUPE_TOKENS = 3
+
+# Sections that never say anything about the role's duties or skills
+_BOILERPLATE_HEADING_RE = re.compile(
+    r"equal (employment )?opportunit|\beeo\b|diversity|inclusion|benefits|perks"
+    r"|we offer|compensation|salary|pay range|accommodation"
+    r"|privacy|cookie|how to apply|apply now|share this|similar jobs",
+    re.IGNORECASE,
+)
+# Sections the analysis is built from, kept over everything else
+_HIGH_PRIORITY_HEADING_RE = re.compile(
+    r"responsibilit|requirement|qualification|skill|you('| wi)ll|you have"
+    r"|you bring|must have|nice to have|experience|the role|about the (role|job|position)"
+    r"|job description|what you|tech stack|duties",
+    re.IGNORECASE,
+)
+# Company blurbs: useful for context, first to go when over the cap
+_LOW_PRIORITY_HEADING_RE = re.compile(
+    r"about (us|the company)|who we are|our (mission|story|values|culture)"
+    r"|why join|life at|^about\b",
+    re.IGNORECASE,
+)
+# Legal and HR paragraphs, also found without a heading of their own
+_BOILERPLATE_PARAGRAPH_RE = re.compile(
+    r"equal (employment )?opportunity employer|without regard to"
+    r"|reasonable accommodation|e-verify|protected veteran"
+    r"|unsolicited (resumes|applications)|privacy (policy|notice)"
+    r"|we use cookies|accept (all )?cookies",
+    re.IGNORECASE,
+)
+# Navigation and buttons scraped along with the posting
+_NAV_LINE_RE = re.compile(
+    r"^[\s*_>-]*(apply( now| for this (job|position))?|save( this)? job"
+    r"|share( this job)?|sign in|log in|back to( all)? jobs|view all jobs"
+    r"|skip to( main)? content|report this job|cookie settings|menu|home|jobs)"
+    r"[\s*_.!:>-]*$",
+    re.IGNORECASE,
+)
+# "Responsibilities:" or "**Requirements**" on a line of its own
+_PSEUDO_HEADING_RE = re.compile(
+    r"^(?:\*\*|__)?([A-Z][^\n.!?:*_]{1,60}?)(?::(?:\*\*|__)?|(?:\*\*|__))\s*$"
+)
+
+
+def _promote_pseudo_headings(text: str) -> str:
+    """Turn plain-text section titles into Markdown headings, so they split."""
+    return "\n".join(
+        f"### {match.group(1).strip()}"
+        if (match := _PSEUDO_HEADING_RE.match(line))
+        else line
+        for line in text.split("\n")
+    )
+
+
+def _priority(section: MarkdownSection, is_title: bool) -> int:
+    """0 for the title and duties/skills sections, 1 for the rest, 2 for blurbs."""
+    if is_title or _HIGH_PRIORITY_HEADING_RE.search(section.heading):
+        return 0
+    if _LOW_PRIORITY_HEADING_RE.search(section.heading):
+        return 2
+    return 1
+
+
+def _cut(text: str, max_tokens: int) -> str:
+    """Keep whole lines of `text` up to `max_tokens`."""
+    kept: list[str] = []
+    used = 0
+    for line in text.split("\n"):
+        used += estimate_tokens(line + "\n")
+        if used > max_tokens:
+            break
+        kept.append(line)
+    return "\n".join(kept).rstrip()
+
+
+def normalize_posting(
+    text: str, max_tokens: int = MAX_POSTING_TOKENS
+) -> NormalizedPosting:
+    """
+    Shrink a job posting before analysis: drop boilerplate sections (EEO,
+    benefits, privacy...), legal paragraphs and navigation lines, remove
+    repeated lines, and cut it to `max_tokens`, giving up company blurbs
+    before duties and requirements.
+
+    Args:
+        text: The posting as Markdown or plain text
+        max_tokens: Estimated token cap for the result
+
+    Returns:
+        The normalized posting and what was removed
+    """
+    original = normalize_text(text)
+    report = NormalizedPosting(
+        text="",
+        original_bytes=len(original.encode()),
+        normalized_bytes=0,
+        original_tokens=estimate_tokens(original),
+        normalized_tokens=0,
+    )
+
+    seen_lines: set[str] = set()
+    # (section, body, whether it's the preamble or a title heading)
+    kept: list[tuple[MarkdownSection, str, bool]] = []
+    seen_heading = False
+    for section in split_markdown_sections(_promote_pseudo_headings(original)):
+        # The job title or company: the preamble, top-level headings, and
+        # the first heading, e.g. a promoted "**Engineer at Acme**" line
+        is_title = section.level <= 1 or not seen_heading
+        seen_heading = seen_heading or section.level > 0
+        if section.level and _BOILERPLATE_HEADING_RE.search(section.heading):
+            report.dropped_sections.append(section.heading)
+            continue
+        lines: list[str] = []
+        removed = False
+        for paragraph in section.text.split("\n\n"):
+            if _BOILERPLATE_PARAGRAPH_RE.search(paragraph):
+                report.boilerplate_paragraphs += 1
+                removed = True
+                continue
+            for line in paragraph.split("\n"):
+                if _NAV_LINE_RE.match(line):
+                    report.boilerplate_paragraphs += 1
+                    removed = True
+                    continue
+                words = tokenize(line)
+                if len(words) >= MIN_DEDUPE_TOKENS and not line.startswith("#"):
+                    key = " ".join(words)
+                    if key in seen_lines:
+                        report.duplicate_lines += 1
+                        removed = True
+                        continue
+                    seen_lines.add(key)
+                lines.append(line)
+            lines.append("")
+        body = normalize_text("\n".join(lines))
+        # A heading whose whole body was removed goes with it; headings
+        # that stand alone (the job title, the company) stay
+        if body and (is_title or "\n" in body or not removed):
+            kept.append((section, body, is_title))
+
+    # Fill the budget in priority order, then restore the document order
+    budget = max_tokens
+    fitted: dict[int, str] = {}
+    for index in sorted(
+        range(len(kept)), key=lambda i: (_priority(kept[i][0], kept[i][2]), i)
+    ):
+        section, body, is_title = kept[index]
+        tokens = estimate_tokens(body + "\n\n")
+        if tokens <= budget:
+            fitted[index] = body
+            budget -= tokens
+            continue
+        report.truncated_sections.append(section.heading or "(top of the posting)")
+        cut = _cut(body, budget) if budget >= MIN_SECTION_TOKENS else ""
+        if cut and (is_title or "\n" in cut):
+            fitted[index] = cut
+            budget -= estimate_tokens(cut + "\n\n")
+
+    report.text = "\n\n".join(fitted[index] for index in sorted(fitted))
+    report.normalized_bytes = len(report.text.encode())
+    report.normalized_tokens = estimate_tokens(report.text)
+    return report
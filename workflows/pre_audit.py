@@ -0,0 +1,274 @@
+import re
+from difflib import SequenceMatcher
+
+from models.agents.output import CV, AuditIssue, AuditResult, WorkExperience
+from utils.text import tokenize
+
+# Fuzzy match thresholds (difflib ratio, 0-1)
+COMPANY_MATCH_THRESHOLD = 0.8
+ROLE_MATCH_THRESHOLD = 0.75
+SKILL_MATCH_THRESHOLD = 0.85
+# A bullet is untraceable when both its word overlap with the original
+# experience and its best token-level match to an original bullet fall below this
+BULLET_TRACE_THRESHOLD = 0.3
+
+_SKILL_SPLIT_RE = re.compile(r"[,;|•]")
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+# "1,000,000" or "1,000.5": commas that only group thousands
+_THOUSANDS_RE = re.compile(r"^\d{1,3}(?:,\d{3})+(?:\.\d+)?$")
+_DASH_RE = re.compile(r"\s*[-–—]+\s*|\s+to\s+")
+_PRESENT_RE = re.compile(r"\b(present|current|now|today)\b")
+_MONTHS = (
+    "jan",
+    "feb",
+    "mar",
+    "apr",
+    "may",
+    "jun",
+    "jul",
+    "aug",
+    "sep",
+    "oct",
+    "nov",
+    "dec",
+)
+# "Jan 2020", "January 2020", "Sept. 2020"
+_MONTH_NAME_RE = re.compile(
+    r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+(\d{4})\b"
+)
+# "01/2020", "1.2020"
+_MONTH_YEAR_RE = re.compile(r"\b(\d{1,2})[/.](\d{4})\b")
+# "2020/01", "2020-1"
+_YEAR_MONTH_RE = re.compile(r"\b(\d{4})[/.-](\d{1,2})\b")
+
+
+def _normalize(text: str) -> str:
+    return " ".join(tokenize(text))
+
+
+def _similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, _normalize(a), _normalize(b)).ratio()
+
+
+def _normalize_dates(dates: str) -> str:
+    """
+    Canonical form of a date range, so "Jan 2020 - Present",
+    "January 2020 to current" and "01/2020 – now" compare equal: months
+    become "2020-01" and every range separator a single "-".
+    """
+    dates = _PRESENT_RE.sub("present", dates.casefold())
+    dates = _MONTH_NAME_RE.sub(
+        lambda m: f"{m.group(2)}-{_MONTHS.index(m.group(1)) + 1:02d}", dates
+    )
+    dates = _MONTH_YEAR_RE.sub(
+        lambda m: (
+            f"{m.group(2)}-{int(m.group(1)):02d}"
+            if 1 <= int(m.group(1)) <= 12
+            else m.group(0)
+        ),
+        dates,
+    )
+    dates = _YEAR_MONTH_RE.sub(
+        lambda m: (
+            f"{m.group(1)}-{int(m.group(2)):02d}"
+            if 1 <= int(m.group(2)) <= 12
+            else m.group(0)
+        ),
+        dates,
+    )
+    return _DASH_RE.sub("-", dates).strip()
+
+
+def _numbers(text: str) -> set[str]:
+    """The figures in `text`, "1,000" and "1000" alike."""
+    return {
+        number.replace(",", "") if _THOUSANDS_RE.match(number) else number
+        for number in _NUMBER_RE.findall(text)
+    }
+
+
+def _skill_items(skill: str) -> list[str]:
+    """Split grouped skills like 'Languages: Python, Go' into single items."""
+    if ":" in skill:
+        skill = skill.split(":", 1)[1]
+    return [item.strip() for item in _SKILL_SPLIT_RE.split(skill) if item.strip()]
+
+
+def _cv_text(cv: CV) -> str:
+    parts = [cv.summary, *cv.skills, *cv.projects, *cv.education]
+    parts += [*cv.certifications, *cv.publications]
+    for exp in cv.experience:
+        parts += [exp.company, exp.role, exp.dates, *exp.highlights]
+    return "\n".join(parts)
+
+
+def match_experience(
+    new_exp: WorkExperience, original: list[WorkExperience]
+) -> WorkExperience | None:
+    """Find the original entry for the same company and role, if any."""
+    best: WorkExperience | None = None
+    best_score = 0.0
+    for exp in original:
+        company_score = _similarity(new_exp.company, exp.company)
+        if company_score < COMPANY_MATCH_THRESHOLD:
+            continue
+        score = company_score + _similarity(new_exp.role, exp.role)
+        if score > best_score:
+            best, best_score = exp, score
+    return best
+
+
+def pre_audit_cv(original_cv: CV, new_cv: CV) -> AuditResult:
+    """
+    Deterministically compare a tailored CV against the original.
+
+    Catches the hallucinations that don't need an LLM to spot: a changed
+    name or contact details, new skills, invented companies or roles,
+    changed dates, and bullets or numbers that can't be traced back to the
+    original. Any critical issue fails the
+    pre-audit so the draft can be rewritten without calling the auditor.
+
+    Args:
+        original_cv: The parsed original resume
+        new_cv: The writer's tailored draft
+
+    Returns:
+        An AuditResult with one AuditIssue per finding
+    """
+    issues: list[AuditIssue] = []
+    original_text = _cv_text(original_cv)
+    original_normalized = _normalize(original_text)
+    original_numbers = _numbers(original_text)
+    original_skills = [
+        item for skill in original_cv.skills for item in _skill_items(skill)
+    ]
+
+    # 0. Name and contact details are never rewritten; the LLM auditor
+    # doesn't see them, so this is the only check
+    for field, label in (("full_name", "Name"), ("contact_info", "Contact details")):
+        original_value = getattr(original_cv, field)
+        new_value = getattr(new_cv, field)
+        if " ".join(new_value.split()) != " ".join(original_value.split()):
+            issues.append(
+                AuditIssue(
+                    severity="Critical",
+                    issue=f"{label} changed: '{new_value}' instead of the original '{original_value}'.",
+                    suggestion=f"Keep the original {label.lower()} unchanged.",
+                    section="header",
+                )
+            )
+
+    # 1. Skills must exist somewhere in the original CV
+    for skill in new_cv.skills:
+        for item in _skill_items(skill):
+            normalized = _normalize(item)
+            if not normalized or f" {normalized} " in f" {original_normalized} ":
+                continue
+            if any(
+                _similarity(item, original) >= SKILL_MATCH_THRESHOLD
+                for original in original_skills
+            ):
+                continue
+            issues.append(
+                AuditIssue(
+                    severity="Critical",
+                    issue=f"Skill '{item}' does not appear in the original CV.",
+                    suggestion=f"Remove '{item}' or replace it with a skill from the original CV.",
+                    section="skills",
+                )
+            )
+
+    # 2. Company/role pairs and dates must match the original
+    for index, new_exp in enumerate(new_cv.experience):
+        section = f"experience[{index}]"
+        original_exp = match_experience(new_exp, original_cv.experience)
+        if original_exp is None:
+            issues.append(
+                AuditIssue(
+                    severity="Critical",
+                    issue=f"Company '{new_exp.company}' does not appear in the original CV.",
+                    suggestion="Only list employers from the original CV.",
+                    section=section,
+                )
+            )
+            continue
+
+        if _similarity(new_exp.role, original_exp.role) < ROLE_MATCH_THRESHOLD:
+            issues.append(
+                AuditIssue(
+                    severity="Critical",
+                    issue=f"Role '{new_exp.role}' at {new_exp.company} differs from the original role '{original_exp.role}'.",
+                    suggestion=f"Use the original role title '{original_exp.role}'.",
+                    section=section,
+                )
+            )
+
+        if _normalize_dates(new_exp.dates) != _normalize_dates(original_exp.dates):
+            issues.append(
+                AuditIssue(
+                    severity="Critical",
+                    issue=f"Dates '{new_exp.dates}' for {new_exp.company} differ from the original '{original_exp.dates}'.",
+                    suggestion=f"Keep the original dates '{original_exp.dates}'.",
+                    section=section,
+                )
+            )
+
+        # 3. Every bullet must trace back to the original experience; the
+        # original skills count too since the writer weaves them into bullets
+        original_words = set(
+            tokenize(
+                " ".join(
+                    [original_exp.role, *original_exp.highlights, *original_cv.skills]
+                ),
+                drop_stopwords=True,
+            )
+        )
+        for highlight in new_exp.highlights:
+            invented_numbers = _numbers(highlight) - original_numbers
+            if invented_numbers:
+                issues.append(
+                    AuditIssue(
+                        severity="Critical",
+                        issue=f"Bullet at {new_exp.company} uses figures not in the original CV ({', '.join(sorted(invented_numbers))}): '{highlight}'",
+                        suggestion="Only use metrics that appear in the original CV.",
+                        section=section,
+                    )
+                )
+                continue
+
+            words = tokenize(highlight, drop_stopwords=True)
+            if not words:
+                continue
+            traced = sum(word in original_words for word in words) / len(words)
+            best_match = max(
+                (
+                    SequenceMatcher(
+                        None, words, tokenize(hl, drop_stopwords=True)
+                    ).ratio()
+                    for hl in original_exp.highlights
+                ),
+                default=0.0,
+            )
+            if traced < BULLET_TRACE_THRESHOLD and best_match < BULLET_TRACE_THRESHOLD:
+                issues.append(
+                    AuditIssue(
+                        severity="Critical",
+                        issue=f"Bullet at {new_exp.company} can't be traced to the original experience: '{highlight}'",
+                        suggestion="Rephrase an existing bullet from this role instead of adding new content.",
+                        section=section,
+                    )
+                )
+
+    critical = [issue for issue in issues if issue.severity == "Critical"]
+    return AuditResult(
+        passed=not critical,
+        hallucination_score=min(10, 2 * len(critical) + 2) if critical else 0,
+        ai_cliche_score=0,
+        issues=issues,
+        feedback_summary=(
+            f"Deterministic pre-audit found {len(critical)} critical issue(s) "
+            "where the draft departs from the original CV."
+            if critical
+            else "Deterministic pre-audit found no unsupported skills, roles, dates or bullets."
+        ),
+    )
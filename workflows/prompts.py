@@ -0,0 +1,313 @@
+import json
+from typing import Any
+
+from pydantic import BaseModel
+
+from models.agents.output import (
+    CV,
+    AuditIssue,
+    AuditResult,
+    JobAnalysis,
+    WorkExperience,
+)
+from utils.markdown_sections import MarkdownSection
+
+# Fields each agent doesn't need to see. Names and contact details never
+# influence review or audit verdicts: the workflow restores them from the
+# original CV after every write and the pre-audit checks them. The company
+# name and posting summary only matter to the writer.
+REVIEW_CV_EXCLUDE = {"full_name", "contact_info"}
+REVIEW_JOB_EXCLUDE = {"company_name"}
+AUDIT_CV_EXCLUDE = {"full_name", "contact_info"}
+AUDIT_JOB_EXCLUDE = {"company_name", "summary"}
+IMPROVE_ORIGINAL_CV_EXCLUDE = {"full_name", "contact_info"}
+IMPROVE_JOB_EXCLUDE = {"company_name", "summary"}
+# Section writers only see what their section needs
+SECTION_CV_EXCLUDE = {"full_name", "contact_info"}
+SKILLS_JOB_EXCLUDE = {"company_name", "summary", "key_responsibilities"}
+EXPERIENCE_JOB_EXCLUDE = {"company_name", "summary"}
+PATCH_CV_EXCLUDE = {"full_name", "contact_info"}
+
+
+def _drop_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _drop_empty(item)
+            for key, item in value.items()
+            if item not in ("", [], {}, None)
+        }
+    if isinstance(value, list):
+        return [_drop_empty(item) for item in value]
+    return value
+
+
+def compact_json(model: BaseModel, exclude: set[str] | None = None) -> str:
+    """
+    Serialize a model for a prompt with as few tokens as possible.
+
+    Drops defaults, None and empty values plus any `exclude`d fields, and
+    uses minimal separators without ASCII escaping.
+
+    Args:
+        model: The model to serialize
+        exclude: Top-level field names to leave out
+
+    Returns:
+        Compact JSON string
+    """
+    data = model.model_dump(
+        mode="json", exclude=exclude, exclude_defaults=True, exclude_none=True
+    )
+    return json.dumps(_drop_empty(data), separators=(",", ":"), ensure_ascii=False)
+
+
+def analysis_prompt(job_content: str) -> str:
+    return f"""
+Analyze this job posting and extract structured job data:
+
+{job_content}
+"""
+
+
+def resume_parse_prompt(resume_text: str) -> str:
+    return f"Parse this resume into structured format:\n\n{resume_text}"
+
+
+def resume_section_prompt(section: MarkdownSection) -> str:
+    location = " > ".join([*section.path, section.heading]) or "(top of the resume)"
+    return f"""
+Parse this section of a resume into structured format.
+Extract only what this section contains and leave all other fields empty.
+
+Section: {location}
+
+{section.text}
+"""
+
+
+def _omitted_text(omitted: list[str] | None) -> str:
+    if not omitted:
+        return ""
+    return (
+        "\nLess relevant items left out above, re-added unchanged after you write "
+        f"(do NOT invent replacements): {'; '.join(omitted)}\n"
+    )
+
+
+def writer_prompt(
+    original_cv: CV, job_analysis: JobAnalysis, omitted: list[str] | None = None
+) -> str:
+    return f"""
+Here is the Job Analysis:
+{compact_json(job_analysis)}
+
+Here is the Original CV (structured):
+{compact_json(original_cv)}
+{_omitted_text(omitted)}
+Rewrite the CV to match the Job Analysis. Use ONLY the information from the Original CV.
+Rephrase and reorganize to highlight relevant experience, but do NOT add new skills or experiences.
+"""
+
+
+def _issues_text(issues: list[AuditIssue] | None) -> str:
+    if not issues:
+        return ""
+    return (
+        "\nThe previous version failed the audit. Fix these issues:\n"
+        + "\n".join(f"- [{i.severity}] {i.issue} -> {i.suggestion}" for i in issues)
+        + "\n"
+    )
+
+
+def summary_prompt(
+    original_cv: CV, job_analysis: JobAnalysis, issues: list[AuditIssue] | None = None
+) -> str:
+    return f"""
+Here is the Job Analysis:
+{compact_json(job_analysis)}
+
+Here is the Original CV (structured):
+{compact_json(original_cv, SECTION_CV_EXCLUDE)}
+
+Rewrite ONLY the professional summary to target the Job Analysis.
+Use ONLY information from the Original CV. Other sections are rewritten separately.
+{_issues_text(issues)}"""
+
+
+def skills_prompt(original_cv: CV, job_analysis: JobAnalysis) -> str:
+    return f"""
+Job skills and keywords:
+{compact_json(job_analysis, SKILLS_JOB_EXCLUDE)}
+
+Original skills:
+{json.dumps(original_cv.skills, ensure_ascii=False)}
+
+Order the original skills so the most relevant to the job come first.
+Return every original skill exactly as written. Do NOT add, rename or remove skills.
+"""
+
+
+def experience_prompt(
+    role: WorkExperience,
+    job_analysis: JobAnalysis,
+    avoid: list[str] | None = None,
+    issues: list[AuditIssue] | None = None,
+) -> str:
+    avoid_text = (
+        "\nOther roles already use these, so phrase this role differently:\n"
+        + "\n".join(f"- {phrase}" for phrase in avoid)
+        + "\n"
+        if avoid
+        else ""
+    )
+    return f"""
+Here is the Job Analysis:
+{compact_json(job_analysis, EXPERIENCE_JOB_EXCLUDE)}
+
+Here is one role from the Original CV:
+{compact_json(role)}
+
+Rewrite ONLY the highlight bullets of this role to target the Job Analysis.
+Keep every achievement, number and technology accurate. Do NOT add new skills or experiences.
+{avoid_text}{_issues_text(issues)}"""
+
+
+def writer_retry_prompt(
+    original_cv: CV,
+    job_analysis: JobAnalysis,
+    audit: AuditResult | None,
+    omitted: list[str] | None = None,
+) -> str:
+    issues_text = "\n".join(
+        f"- [{i.severity}] {i.issue} -> {i.suggestion}"
+        for i in (audit.issues if audit else [])
+    )
+    return f"""
+The previous CV draft failed the audit. Here is the feedback:
+
+Audit Feedback: {audit.feedback_summary if audit else ""}
+
+Issues to fix:
+{issues_text}
+
+Here is the Job Analysis:
+{compact_json(job_analysis)}
+
+Here is the Original CV (structured):
+{compact_json(original_cv)}
+{_omitted_text(omitted)}
+CRITICAL RULES:
+1. ONLY use skills and experience from the Original CV - DO NOT add new skills
+2. Fix all the issues mentioned in the audit feedback
+3. Ensure all job requirements are addressed using ONLY existing skills from the original CV
+4. Avoid AI clichés and use natural language
+5. You may rephrase existing content but cannot add new information
+
+Rewrite the CV to match the Job Analysis while addressing all audit feedback.
+"""
+
+
+def review_prompt(cv: CV, job_analysis: JobAnalysis) -> str:
+    return f"""
+Review this CV against job requirements:
+
+CV: {compact_json(cv, REVIEW_CV_EXCLUDE)}
+Job Analysis: {compact_json(job_analysis, REVIEW_JOB_EXCLUDE)}
+
+Assess quality and suggest improvements if needed.
+"""
+
+
+def improvement_prompt(
+    cv: CV, original_cv: CV, job_analysis: JobAnalysis, suggestions: list[str]
+) -> str:
+    suggestions_text = "\n".join(f"- {s}" for s in suggestions)
+    return f"""
+Improve this CV based on reviewer feedback:
+
+Current CV: {compact_json(cv)}
+Original CV: {compact_json(original_cv, IMPROVE_ORIGINAL_CV_EXCLUDE)}
+Job Analysis: {compact_json(job_analysis, IMPROVE_JOB_EXCLUDE)}
+
+Specific improvements to address:
+{suggestions_text}
+
+CRITICAL RULES:
+1. ONLY use information from the Original CV - DO NOT add new skills or experiences
+2. Apply the suggestions to improve quality and relevance
+3. Maintain accuracy and honesty
+4. Use natural language, avoid AI clichés
+5. Keep all dates and facts accurate
+
+Focus on better highlighting relevant experience and incorporating job keywords naturally.
+"""
+
+
+def patch_prompt(
+    cv: CV, original_cv: CV, job_analysis: JobAnalysis, suggestions: list[str]
+) -> str:
+    suggestions_text = "\n".join(f"- {s}" for s in suggestions)
+    return f"""
+Improve this CV based on reviewer feedback by returning targeted edits, not a new CV.
+
+Current CV: {compact_json(cv, PATCH_CV_EXCLUDE)}
+Original CV: {compact_json(original_cv, IMPROVE_ORIGINAL_CV_EXCLUDE)}
+Job Analysis: {compact_json(job_analysis, IMPROVE_JOB_EXCLUDE)}
+
+Specific improvements to address:
+{suggestions_text}
+
+Allowed edits (indexes are 0-based and refer to the Current CV):
+- replace "summary" with new text
+- reorder "skills" (the full list, same items)
+- replace or remove "experience[i].highlights[j]"
+- reorder "experience[i].highlights" (the full list, same items)
+- replace "projects[i]"
+
+CRITICAL RULES:
+1. ONLY use information from the Original CV - DO NOT add new skills or experiences
+2. Only edit what the suggestions ask for, leave everything else untouched
+3. Use natural language, avoid AI clichés
+"""
+
+
+def audit_prompt(original_cv: CV, new_cv: CV, job_analysis: JobAnalysis) -> str:
+    return f"""
+ORIGINAL CV (structured):
+{compact_json(original_cv, AUDIT_CV_EXCLUDE)}
+
+NEW GENERATED CV (structured):
+{compact_json(new_cv, AUDIT_CV_EXCLUDE)}
+
+JOB REQUIREMENTS:
+{compact_json(job_analysis, AUDIT_JOB_EXCLUDE)}
+
+Compare the two structured CVs carefully. Ensure that:
+1. No new skills appear in the new CV that weren't in the original
+2. No new companies or roles were invented
+3. All experiences in the new CV can be traced back to the original
+4. The language is professional and not AI-generated sounding
+5. The new CV properly targets the job requirements using only original information
+Set each issue's section to the part of the new CV it concerns.
+"""
+
+
+def section_audit_prompt(
+    original_cv: CV, sections: dict[str, Any], job_analysis: JobAnalysis
+) -> str:
+    return f"""
+ORIGINAL CV (structured):
+{compact_json(original_cv, AUDIT_CV_EXCLUDE)}
+
+REWRITTEN SECTIONS OF THE NEW CV (the rest of the new CV already passed the audit):
+{json.dumps(sections, separators=(",", ":"), ensure_ascii=False)}
+
+JOB REQUIREMENTS:
+{compact_json(job_analysis, AUDIT_JOB_EXCLUDE)}
+
+Audit ONLY the rewritten sections against the original CV. Ensure that:
+1. No new skills, companies, roles or achievements were invented
+2. Everything in them can be traced back to the original
+3. The language is professional and not AI-generated sounding
+Set each issue's section to the section key it concerns.
+"""
@@ -0,0 +1,201 @@
+import math
+from collections import Counter
+
+from pydantic import BaseModel, Field
+
+from models.agents.output import CV, JobAnalysis
+from utils.text import tokenize
+from workflows.pre_audit import match_experience
+
+# Standard BM25 parameters: term-frequency saturation and length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Bullets per role the writer always sees, however unrelated, and at most
+HIGHLIGHTS_PER_ROLE = (2, 6)
+PROJECTS = (1, 3)
+# Skills cost few tokens, so only long lists of unrelated ones are pruned
+SKILLS = (12, 40)
+
+
+class BM25Index:
+    """In-memory BM25 scores of short documents against a query."""
+
+    def __init__(self, documents: list[str]):
+        self.documents = [
+            Counter(tokenize(doc, drop_stopwords=True)) for doc in documents
+        ]
+        self.lengths = [sum(doc.values()) for doc in self.documents]
+        self.average_length = (
+            sum(self.lengths) / len(self.lengths) if self.lengths else 0.0
+        )
+        document_frequency = Counter(term for doc in self.documents for term in doc)
+        total = len(self.documents)
+        self.idf = {
+            term: math.log(1 + (total - count + 0.5) / (count + 0.5))
+            for term, count in document_frequency.items()
+        }
+
+    def scores(self, query: Counter[str]) -> list[float]:
+        """BM25 score of every document, query terms weighted by their count."""
+        results = []
+        for doc, length in zip(self.documents, self.lengths):
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * length / (self.average_length or 1))
+            results.append(
+                sum(
+                    weight
+                    * self.idf[term]
+                    * doc[term]
+                    * (BM25_K1 + 1)
+                    / (doc[term] + norm)
+                    for term, weight in query.items()
+                    if term in doc
+                )
+            )
+        return results
+
+
+class PrunedItem(BaseModel):
+    text: str
+    position: int = Field(description="Index in the original CV's list.")
+
+
+class PrunedCV(BaseModel):
+    cv: CV = Field(description="The CV with only top-ranked material, for the writer.")
+    highlights: dict[int, list[PrunedItem]] = Field(
+        default_factory=dict,
+        description="Role index -> bullets left out, in their original order.",
+    )
+    projects: list[PrunedItem] = Field(default_factory=list)
+    skills: list[PrunedItem] = Field(default_factory=list)
+
+    @property
+    def omitted_count(self) -> int:
+        return (
+            sum(map(len, self.highlights.values()))
+            + len(self.projects)
+            + len(self.skills)
+        )
+
+    def references(self) -> list[str]:
+        """Where items were left out and how many, for the writer prompt."""
+        references = [
+            f"experience[{index}]: {len(bullets)} highlight(s)"
+            for index, bullets in sorted(self.highlights.items())
+        ]
+        if self.projects:
+            references.append(f"projects: {len(self.projects)}")
+        if self.skills:
+            references.append(f"skills: {len(self.skills)}")
+        return references
+
+
+def job_query(job_analysis: JobAnalysis) -> Counter[str]:
+    """Query terms of a job, counted once per list that mentions them."""
+    query: Counter[str] = Counter()
+    for items in (
+        job_analysis.hard_skills,
+        job_analysis.keywords_to_target,
+        job_analysis.key_responsibilities,
+    ):
+        query.update(set(tokenize(" ".join(items), drop_stopwords=True)))
+    return query
+
+
+def _select(
+    scores: list[float], limits: tuple[int, int]
+) -> tuple[list[int], list[int]]:
+    """
+    Split item indexes into kept and left out: the `limits[0]` best are
+    always kept, then items that match the job at all, up to `limits[1]`.
+    """
+    minimum, maximum = limits
+    ranked = sorted(range(len(scores)), key=lambda i: (-scores[i], i))
+    kept = {
+        index
+        for rank, index in enumerate(ranked)
+        if rank < minimum or (rank < maximum and scores[index] > 0)
+    }
+    return sorted(kept), [i for i in range(len(scores)) if i not in kept]
+
+
+def _left_out(items: list[str], indexes: list[int]) -> list[PrunedItem]:
+    return [PrunedItem(text=items[i], position=i) for i in indexes]
+
+
+def prune_cv(cv: CV, job_analysis: JobAnalysis) -> PrunedCV:
+    """
+    Leave the bullets, projects and skills least relevant to the job out of
+    the CV the writer sees, ranked by BM25 against the job's hard skills,
+    keywords and responsibilities. Every role keeps its best bullets.
+
+    Args:
+        cv: The original CV
+        job_analysis: The job it is tailored to
+
+    Returns:
+        The pruned CV and what was left out, to restore with restore_pruned
+    """
+    bullets = [
+        (role_index, bullet_index, bullet)
+        for role_index, role in enumerate(cv.experience)
+        for bullet_index, bullet in enumerate(role.highlights)
+    ]
+    # One corpus, so a term's rarity is judged across the whole CV
+    index = BM25Index(
+        [bullet for _, _, bullet in bullets] + list(cv.projects) + list(cv.skills)
+    )
+    scores = index.scores(job_query(job_analysis))
+    bullet_scores = scores[: len(bullets)]
+    project_scores = scores[len(bullets) : len(bullets) + len(cv.projects)]
+    skill_scores = scores[len(bullets) + len(cv.projects) :]
+
+    pruned = PrunedCV(cv=cv.model_copy(deep=True))
+    for role_index, role in enumerate(pruned.cv.experience):
+        role_scores = [
+            score
+            for (bullet_role, _, _), score in zip(bullets, bullet_scores)
+            if bullet_role == role_index
+        ]
+        kept, left_out = _select(role_scores, HIGHLIGHTS_PER_ROLE)
+        if left_out:
+            pruned.highlights[role_index] = _left_out(role.highlights, left_out)
+            role.highlights = [role.highlights[i] for i in kept]
+
+    kept, left_out = _select(project_scores, PROJECTS)
+    pruned.projects = _left_out(cv.projects, left_out)
+    pruned.cv.projects = [cv.projects[i] for i in kept]
+
+    kept, left_out = _select(skill_scores, SKILLS)
+    pruned.skills = _left_out(cv.skills, left_out)
+    pruned.cv.skills = [cv.skills[i] for i in kept]
+    return pruned
+
+
+def restore_pruned(cv: CV, pruned: PrunedCV) -> CV:
+    """
+    Put the items prune_cv left out back into a CV written from the pruned
+    one, verbatim and at their original positions among the writer's own
+    items, unless the writer already included them.
+
+    The writer's items stand in for the kept ones in order, so when the
+    writer keeps its list's length and order, the original order is
+    restored exactly.
+    """
+    restored = cv.model_copy(deep=True)
+
+    def merged(present: list[str], items: list[PrunedItem]) -> list[str]:
+        seen = {" ".join(tokenize(item)) for item in present}
+        result = list(present)
+        # In ascending position, every earlier original item is already placed
+        for item in items:
+            if " ".join(tokenize(item.text)) not in seen:
+                result.insert(min(item.position, len(result)), item.text)
+        return result
+
+    for role_index, bullets in pruned.highlights.items():
+        role = match_experience(pruned.cv.experience[role_index], restored.experience)
+        if role is not None:
+            role.highlights = merged(role.highlights, bullets)
+    restored.projects = merged(restored.projects, pruned.projects)
+    restored.skills = merged(restored.skills, pruned.skills)
+    return restored
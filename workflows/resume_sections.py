@@ -0,0 +1,49 @@
+from models.agents.output import CV, CVFragment
+from utils.markdown_sections import MarkdownSection, split_markdown_sections
+
+
+def resume_parse_units(resume_text: str) -> list[MarkdownSection]:
+    """
+    The sections of a Markdown resume that are parsed separately: one per
+    heading, e.g. one per role under "## Experience", skipping headings
+    with no content of their own.
+    """
+    return [
+        section for section in split_markdown_sections(resume_text) if section.has_body
+    ]
+
+
+def merge_cv_fragments(fragments: list[CVFragment]) -> CV | None:
+    """
+    Merge per-section parse results, in document order, into one CV.
+
+    Args:
+        fragments: One CVFragment per resume section
+
+    Returns:
+        The merged CV, or None when the fragments don't add up to a usable
+        CV (no name or no work experience)
+    """
+    full_name = next((f.full_name for f in fragments if f.full_name), "")
+    experience = [role for f in fragments for role in f.experience]
+    if not full_name or not experience:
+        return None
+
+    seen_skills: set[str] = set()
+    skills: list[str] = []
+    for skill in (skill for f in fragments for skill in f.skills):
+        if skill.casefold() not in seen_skills:
+            seen_skills.add(skill.casefold())
+            skills.append(skill)
+
+    return CV(
+        full_name=full_name,
+        contact_info=next((f.contact_info for f in fragments if f.contact_info), ""),
+        summary="\n\n".join(f.summary for f in fragments if f.summary),
+        skills=skills,
+        projects=[p for f in fragments for p in f.projects],
+        experience=experience,
+        education=[e for f in fragments for e in f.education],
+        certifications=[c for f in fragments for c in f.certifications],
+        publications=[p for f in fragments for p in f.publications],
+    )
@@ -0,0 +1,131 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from models.workflow import RunTimeline, StageTiming
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a pipeline, declared by the values it consumes and produces.
+
+    `fn` is called with one keyword argument per input name. With a single
+    output its return value is stored under that name; with several outputs
+    it must return a dict keyed by output name.
+    """
+
+    name: str
+    fn: Callable[..., Awaitable[Any]]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+
+
+class StageScheduler:
+    """
+    Runs a DAG of stages, starting each one as soon as all of its inputs
+    are available, and records a timeline with the critical path.
+    """
+
+    def __init__(self, stages: list[Stage]):
+        self.stages = stages
+        self.producers: dict[str, str] = {}
+        for stage in stages:
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(
+                        f"Output '{output}' is produced by both "
+                        f"'{self.producers[output]}' and '{stage.name}'"
+                    )
+                self.producers[output] = stage.name
+
+    async def run(self, values: dict[str, Any]) -> tuple[dict[str, Any], RunTimeline]:
+        """
+        Run every stage and return all values plus the run timeline.
+
+        Args:
+            values: Initial values, keyed by the input names stages declare
+
+        Raises:
+            ValueError: If some stages can never start (missing input or cycle)
+        """
+        values = dict(values)
+        pending = list(self.stages)
+        running: dict[asyncio.Task, Stage] = {}
+        timings: dict[str, StageTiming] = {}
+        run_start = time.perf_counter()
+
+        try:
+            while pending or running:
+                for stage in [s for s in pending if self._is_ready(s, values)]:
+                    pending.remove(stage)
+                    kwargs = {name: values[name] for name in stage.inputs}
+                    running[asyncio.ensure_future(stage.fn(**kwargs))] = stage
+                    timings[stage.name] = StageTiming(
+                        name=stage.name,
+                        started_at=time.perf_counter() - run_start,
+                        finished_at=0.0,
+                        depends_on=sorted(
+                            {
+                                self.producers[name]
+                                for name in stage.inputs
+                                if name in self.producers
+                            }
+                        ),
+                    )
+
+                if not running:
+                    blocked = ", ".join(stage.name for stage in pending)
+                    raise ValueError(f"Stages can never start: {blocked}")
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    stage = running.pop(task)
+                    timings[stage.name].finished_at = time.perf_counter() - run_start
+                    values.update(self._outputs_of(stage, task.result()))
+        finally:
+            # A failed stage aborts the run, don't leave siblings running
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+        return values, self._timeline(timings, time.perf_counter() - run_start)
+
+    def _is_ready(self, stage: Stage, values: dict[str, Any]) -> bool:
+        return all(name in values for name in stage.inputs)
+
+    @staticmethod
+    def _outputs_of(stage: Stage, result: Any) -> dict[str, Any]:
+        if len(stage.outputs) == 1:
+            return {stage.outputs[0]: result}
+        if not stage.outputs:
+            return {}
+        missing = set(stage.outputs) - set(result)
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' did not produce {sorted(missing)}")
+        return {name: result[name] for name in stage.outputs}
+
+    @staticmethod
+    def _timeline(timings: dict[str, StageTiming], total_seconds: float) -> RunTimeline:
+        # Walk back from the last stage to finish, always following the
+        # dependency that finished last: that chain bounded the wall-clock time
+        critical_path: list[str] = []
+        current = max(timings.values(), key=lambda t: t.finished_at, default=None)
+        while current is not None:
+            critical_path.append(current.name)
+            current = max(
+                (timings[name] for name in current.depends_on),
+                key=lambda t: t.finished_at,
+                default=None,
+            )
+        critical_path.reverse()
+
+        return RunTimeline(
+            stages=list(timings.values()),
+            critical_path=critical_path,
+            total_seconds=total_seconds,
+        )
@@ -0,0 +1,135 @@
+from collections import Counter, defaultdict
+
+from models.agents.output import CV, WorkExperience
+from utils.text import STOPWORDS, tokenize
+
+# Phrases of this many words shared between sections count as repetition
+PHRASE_WORDS = 3
+# A bullet opener (usually the verb) used this often counts as repetition
+MAX_OPENER_USES = 2
+
+
+def reorder_skills(skills: list[str], original_cv: CV) -> list[str]:
+    """
+    The original skills in the order `skills` lists them: skills that aren't
+    in the original are dropped and original skills missing from `skills`
+    are appended, spelled as in the original.
+    """
+    original_skills = {skill.casefold(): skill for skill in original_cv.skills}
+    ordered: dict[str, str] = {}
+    for skill in [*skills, *original_cv.skills]:
+        key = skill.strip().casefold()
+        if key in original_skills and key not in ordered:
+            ordered[key] = original_skills[key]
+    return list(ordered.values())
+
+
+def assemble_cv(
+    original_cv: CV,
+    summary: str,
+    skills: list[str],
+    highlights: list[list[str]],
+) -> CV:
+    """
+    Build the tailored CV from independently rewritten sections.
+
+    Everything the writer may not change comes from the original: name,
+    contact details, companies, roles, dates, projects, education,
+    certifications and publications. Skills are only reordered: unknown
+    skills are dropped and skills the writer left out are appended.
+
+    Args:
+        original_cv: The parsed original resume
+        summary: The rewritten summary
+        skills: The skills in the writer's order
+        highlights: Rewritten bullets, one list per original role
+
+    Returns:
+        The assembled CV
+    """
+    return original_cv.model_copy(
+        update={
+            "summary": summary or original_cv.summary,
+            "skills": reorder_skills(skills, original_cv),
+            "experience": [
+                WorkExperience(
+                    company=role.company,
+                    role=role.role,
+                    dates=role.dates,
+                    highlights=role_highlights or role.highlights,
+                )
+                for role, role_highlights in zip(original_cv.experience, highlights)
+            ],
+        },
+        deep=True,
+    )
+
+
+def _phrases(text: str) -> set[str]:
+    tokens = tokenize(text)
+    return {
+        " ".join(tokens[i : i + PHRASE_WORDS])
+        for i in range(len(tokens) - PHRASE_WORDS + 1)
+        if not all(t in STOPWORDS for t in tokens[i : i + PHRASE_WORDS])
+    }
+
+
+def _section_texts(cv: CV) -> list[list[str]]:
+    return [role.highlights for role in cv.experience]
+
+
+def _opener(bullet: str) -> str | None:
+    tokens = tokenize(bullet)
+    return tokens[0] if tokens else None
+
+
+def find_repeated_phrasing(cv: CV, original_cv: CV) -> dict[int, list[str]]:
+    """
+    Find phrasing the section writers repeated across experience entries.
+
+    A phrase counts when it appears in more roles than it did in the
+    original CV, so repetition that was already there is left alone. The
+    first role using a phrase keeps it; later roles are asked to rephrase.
+
+    Args:
+        cv: The assembled tailored CV
+        original_cv: The parsed original resume
+
+    Returns:
+        Role index -> phrases that role should avoid
+    """
+    to_avoid: dict[int, set[str]] = defaultdict(set)
+
+    def phrase_roles(source: CV) -> dict[str, list[int]]:
+        roles: dict[str, list[int]] = defaultdict(list)
+        for index, bullets in enumerate(_section_texts(source)):
+            for phrase in set().union(*(_phrases(b) for b in bullets)):
+                roles[phrase].append(index)
+        return roles
+
+    before = phrase_roles(original_cv)
+    for phrase, indexes in phrase_roles(cv).items():
+        if len(indexes) > max(1, len(before.get(phrase, []))):
+            for index in indexes[1:]:
+                to_avoid[index].add(f'"{phrase}"')
+
+    def openers(source: CV) -> Counter:
+        return Counter(
+            opener
+            for bullets in _section_texts(source)
+            for opener in map(_opener, bullets)
+            if opener and opener not in STOPWORDS
+        )
+
+    original_openers = openers(original_cv)
+    for opener, uses in openers(cv).items():
+        if uses > max(MAX_OPENER_USES, original_openers[opener]):
+            seen = 0
+            for index, bullets in enumerate(_section_texts(cv)):
+                for bullet in bullets:
+                    if _opener(bullet) == opener:
+                        seen += 1
+                        if seen > MAX_OPENER_USES:
+                            to_avoid[index].add(f'starting bullets with "{opener}"')
+
+    return {index: sorted(phrases) for index, phrases in sorted(to_avoid.items())}
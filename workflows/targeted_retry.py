@@ -0,0 +1,133 @@
+import re
+from collections import defaultdict
+from typing import Any
+
+from models.agents.output import CV, AuditIssue, AuditResult
+from utils.text import tokenize
+
+# Parts of a CV that are regenerated on their own. Header, projects,
+# education, certifications and publications are facts from the original
+# and are restored from it rather than rewritten.
+FACT_SECTIONS = ("header", "projects", "education", "certifications", "publications")
+
+_SECTION_RE = re.compile(
+    r"^\s*(summary|skills|experience\[(\d+)\]|projects|education|certifications"
+    r"|publications|header|full_name|contact_info)(?!\w)",
+    re.IGNORECASE,
+)
+_QUOTED_RE = re.compile(r"'([^']{3,})'|\"([^\"]{3,})\"")
+_KEYWORDS = (
+    ("summary", "summary"),
+    ("skill", "skills"),
+    ("project", "projects"),
+    ("education", "education"),
+    ("degree", "education"),
+    ("certification", "certifications"),
+    ("publication", "publications"),
+    ("contact", "header"),
+)
+
+
+def _normalize_section(section: str, cv: CV) -> str | None:
+    match = _SECTION_RE.match(section)
+    if match is None:
+        return None
+    if match[2] is not None:
+        return f"experience[{match[2]}]" if int(match[2]) < len(cv.experience) else None
+    name = match[1].casefold()
+    return "header" if name in ("full_name", "contact_info") else name
+
+
+def _contains(haystack: str, needle: str) -> bool:
+    words = " ".join(tokenize(needle))
+    return bool(words) and f" {words} " in f" {' '.join(tokenize(haystack))} "
+
+
+def locate_issue(issue: AuditIssue, cv: CV) -> str | None:
+    """
+    The section of the draft an audit issue concerns.
+
+    Uses the section the auditor gave when it names one, otherwise looks for
+    quoted draft text, then company names, then section keywords in the
+    issue text.
+
+    Args:
+        issue: An issue from an audit of `cv`
+        cv: The audited draft
+
+    Returns:
+        'summary', 'skills', 'experience[i]' or one of FACT_SECTIONS, or
+        None when the issue can't be pinned to a single section
+    """
+    if issue.section and (section := _normalize_section(issue.section, cv)):
+        return section
+
+    text = f"{issue.issue} {issue.suggestion}"
+    quotes = [a or b for a, b in _QUOTED_RE.findall(issue.issue)]
+    for quote in quotes:
+        found = {
+            f"experience[{i}]"
+            for i, role in enumerate(cv.experience)
+            if any(_contains(part, quote) for part in [*role.highlights, role.role])
+        }
+        if _contains(cv.summary, quote):
+            found.add("summary")
+        if any(_contains(skill, quote) for skill in cv.skills):
+            found.add("skills")
+        if any(_contains(project, quote) for project in cv.projects):
+            found.add("projects")
+        if len(found) == 1:
+            return found.pop()
+
+    companies = {
+        f"experience[{i}]"
+        for i, role in enumerate(cv.experience)
+        if role.company and _contains(text, role.company)
+    }
+    if len(companies) == 1:
+        return companies.pop()
+
+    keywords = {section for word, section in _KEYWORDS if word in text.casefold()}
+    if len(keywords) == 1:
+        return keywords.pop()
+    return None
+
+
+def issue_sections(audit: AuditResult, cv: CV) -> dict[str, list[AuditIssue]] | None:
+    """
+    Group the issues of a failed audit by the draft section they concern.
+
+    Args:
+        audit: The failed audit of `cv`
+        cv: The audited draft
+
+    Returns:
+        Section -> its issues, or None when a critical issue can't be
+        located, or no issue can, and the whole draft should be rewritten.
+        Minor issues that can't be located are left out; callers compare
+        the issue counts to tell.
+    """
+    sections: dict[str, list[AuditIssue]] = defaultdict(list)
+    for issue in audit.issues:
+        section = locate_issue(issue, cv)
+        if section is not None:
+            sections[section].append(issue)
+        elif issue.severity == "Critical":
+            return None
+    return dict(sections) or None
+
+
+def section_values(cv: CV, sections: list[str]) -> dict[str, Any]:
+    """The content of the given sections of a CV, keyed by section."""
+    values: dict[str, Any] = {}
+    for section in sections:
+        if match := re.fullmatch(r"experience\[(\d+)\]", section):
+            values[section] = cv.experience[int(match[1])].model_dump(mode="json")
+        elif section == "header":
+            values[section] = {
+                "full_name": cv.full_name,
+                "contact_info": cv.contact_info,
+            }
+        else:
+            values[section] = getattr(cv, section)
+    return values